@@ -0,0 +1,105 @@
+# benchmarks/bench_bplus.py
+# B+ 树 vs AVL 树：Python 对象数量、内存、点查、全量/范围扫描与随机插入吞吐量
+# 运行：python -m benchmarks.bench_bplus [--n 1000000] [--orders 32 64 128] [--inserts 20000]
+import argparse
+import contextlib
+import gc
+import io
+import random
+import time
+import tracemalloc
+
+from core.avl_setops import _from_pairs
+from core.avl_tree import AVLTree
+from core.bplus_tree import BPlusTree
+
+
+def _measure_build(build):
+    """返回 (结构, 新增的 GC 跟踪对象数, 新增内存字节数)"""
+    gc.collect()
+    before = len(gc.get_objects())
+    tracemalloc.start()
+    obj = build()
+    mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    gc.collect()
+    return obj, len(gc.get_objects()) - before, mem
+
+
+def _wrap_avl(pairs):
+    tree = AVLTree()
+    tree.root = _from_pairs(pairs)
+    return tree
+
+
+def _avl_range(tree, lo, hi):
+    """AVL 上的范围扫描：从根下降到 lo，再用栈做中序迭代"""
+    stack = []
+    cur = tree.root
+    while cur:
+        if cur.val >= lo:
+            stack.append(cur)
+            cur = cur.left
+        else:
+            cur = cur.right
+    while stack:
+        node = stack.pop()
+        if node.val >= hi:
+            return
+        yield node.val, node.freq
+        cur = node.right
+        while cur:
+            stack.append(cur)
+            cur = cur.left
+
+
+def _timeit(fn):
+    t = time.perf_counter()
+    fn()
+    return time.perf_counter() - t
+
+
+def main():
+    parser = argparse.ArgumentParser(description="B+ 树与 AVL 树对比基准")
+    parser.add_argument("--n", type=int, default=10 ** 6)
+    parser.add_argument("--orders", nargs="*", type=int, default=[32, 64, 128])
+    parser.add_argument("--inserts", type=int, default=20000, help="随机插入测试的键数")
+    parser.add_argument("--ranges", type=int, default=1000, help="范围扫描次数（每次约 1000 个键）")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    keys = sorted(rnd.sample(range(args.n * 4), args.n))
+    pairs = [(k, 1) for k in keys]
+    probes = [rnd.randrange(args.n * 4) for _ in range(200000)]
+    starts = [rnd.randrange(args.n * 4) for _ in range(args.ranges)]
+    span = 4000  # 键密度为 1/4，约 1000 个键
+    new_keys = [rnd.randrange(args.n * 4) for _ in range(args.inserts)]
+
+    print(f"n={args.n}（批量构建）")
+    print(f"{'结构':<12}{'对象数':>12}{'内存MB':>9}{'树高':>6}{'点查/秒':>12}"
+          f"{'全量扫描s':>11}{'范围扫描s':>11}{'插入/秒':>11}")
+
+    engines = [("AVL", lambda: _wrap_avl(pairs))]
+    engines += [(f"B+ order={o}", (lambda o=o: BPlusTree.from_sorted(pairs, o))) for o in args.orders]
+
+    for name, build in engines:
+        tree, objects, mem = _measure_build(build)
+        height = tree.height() if isinstance(tree, BPlusTree) else tree.root.height
+        search_s = _timeit(lambda: [tree.search(p) for p in probes])
+        scan_s = _timeit(tree.inorder)
+        if isinstance(tree, BPlusTree):
+            range_s = _timeit(lambda: [sum(1 for _ in tree.range(s, s + span)) for s in starts])
+        else:
+            range_s = _timeit(lambda: [sum(1 for _ in _avl_range(tree, s, s + span)) for s in starts])
+        # AVLTree 旋转时会打印调试信息，基准中屏蔽标准输出
+        with contextlib.redirect_stdout(io.StringIO()):
+            insert_s = _timeit(lambda: [tree.insert(k) for k in new_keys])
+        print(f"{name:<12}{objects:>12,}{mem / 2 ** 20:>9.1f}{height:>6}"
+              f"{len(probes) / search_s:>12,.0f}{scan_s:>11.3f}{range_s:>11.3f}"
+              f"{len(new_keys) / insert_s:>11,.0f}")
+        del tree
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main()
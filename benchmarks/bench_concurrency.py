@@ -0,0 +1,95 @@
+# benchmarks/bench_concurrency.py
+# 多读单写场景下的读吞吐量：写线程以固定速率插入/删除，多个读线程不停查找
+# 运行：python -m benchmarks.bench_concurrency [--n 20000] [--readers 1 2 4 8] [--write-rate 2000] [--seconds 2]
+import argparse
+import contextlib
+import io
+import random
+import threading
+import time
+
+from core.avl_tree import AVLTree
+from core.bst_tree import BSTree
+from core.concurrent_tree import ReadWriteLockedTree, SnapshotTree
+
+
+def _build(cls, values):
+    tree = cls()
+    for v in values:
+        tree.insert(v)
+    return tree
+
+
+def _run(tree, n, readers, write_rate, seconds):
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+
+    def reader(idx):
+        rnd = random.Random(idx)
+        count = 0
+        while not stop.is_set():
+            tree.search(rnd.randrange(n * 2))
+            count += 1
+        reads[idx] = count
+
+    def writer():
+        rnd = random.Random(-1)
+        interval = 1.0 / write_rate if write_rate else None
+        next_time = time.perf_counter()
+        while not stop.is_set():
+            v = rnd.randrange(n * 2)
+            if rnd.random() < 0.5:
+                tree.insert(v)
+            else:
+                tree.delete(v)
+            writes[0] += 1
+            if interval:
+                next_time += interval
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return sum(reads) / elapsed, writes[0] / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="读写锁 / RCU 快照 并发读吞吐基准")
+    parser.add_argument("--n", type=int, default=20000, help="初始节点数")
+    parser.add_argument("--readers", nargs="*", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--write-rate", type=int, default=2000, help="写操作/秒（0 表示不限速）")
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    values = random.Random(0).sample(range(args.n * 2), args.n)
+    engines = {
+        "RWLock+AVLTree": lambda: ReadWriteLockedTree(_build(AVLTree, values)),
+        "RWLock+BSTree": lambda: ReadWriteLockedTree(_build(BSTree, values)),
+        "RCU SnapshotTree": lambda: SnapshotTree(values),
+    }
+
+    print(f"n={args.n} 写速率={args.write_rate}/s 时长={args.seconds}s")
+    print(f"{'实现':<18}{'读线程':>6}{'读/秒':>14}{'写/秒':>10}")
+    # AVLTree 旋转时会打印调试信息，基准中屏蔽标准输出
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = []
+        for name, make in engines.items():
+            for r in args.readers:
+                tree = make()
+                rows.append((name, r) + _run(tree, args.n, r, args.write_rate, args.seconds))
+    for name, r, rps, wps in rows:
+        print(f"{name:<18}{r:>6}{rps:>14,.0f}{wps:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
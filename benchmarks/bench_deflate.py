@@ -0,0 +1,70 @@
+# benchmarks/bench_deflate.py
+# LZ77 + Huffman 与纯 Huffman 的吞吐量 / 压缩率对比
+# 运行：python -m benchmarks.bench_deflate [文件 ...] [--levels 0 1 6 9]
+import argparse
+import glob
+import os
+import time
+
+from core.deflate import compress, decompress
+from core.huffman_tree import HuffmanTree
+
+
+def _default_corpus():
+    """默认语料：项目内所有 .py 源码拼接"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data = bytearray()
+    for path in sorted(glob.glob(os.path.join(root, "**", "*.py"), recursive=True)):
+        with open(path, "rb") as f:
+            data += f.read()
+    return bytes(data)
+
+
+def _pure_huffman_bits(data):
+    """纯 Huffman 路径：HuffmanTree 对字节建码，统计编码位数（不含码表）"""
+    tree = HuffmanTree()
+    tree.build(data)
+    return sum(len(tree.code_map[b]) or 1 for b in data)
+
+
+def bench(name, data, levels):
+    mb = len(data) / 1e6
+    print(f"== {name}: {len(data)} 字节 ==")
+    print(f"{'路径':<16}{'压缩后':>10}{'压缩率':>9}{'压缩MB/s':>10}{'解压MB/s':>10}")
+
+    t = time.perf_counter()
+    bits = _pure_huffman_bits(data)
+    dt = time.perf_counter() - t
+    size = (bits + 7) // 8
+    print(f"{'HuffmanTree':<16}{size:>10}{size / max(len(data), 1):>9.3f}{mb / dt:>10.2f}{'-':>10}")
+
+    for level in levels:
+        t = time.perf_counter()
+        blob = compress(data, level)
+        ct = time.perf_counter() - t
+        t = time.perf_counter()
+        out = decompress(blob)
+        dt = time.perf_counter() - t
+        assert out == data, f"level {level} 解压结果不一致"
+        label = "仅Huffman(L0)" if level == 0 else f"LZ77+Huffman L{level}"
+        print(f"{label:<16}{len(blob):>10}{len(blob) / max(len(data), 1):>9.3f}"
+              f"{mb / ct:>10.2f}{mb / dt:>10.2f}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DEFLATE 风格压缩基准")
+    parser.add_argument("files", nargs="*", help="待压缩文件（默认使用项目源码）")
+    parser.add_argument("--levels", nargs="*", type=int, default=[0, 1, 4, 6, 9])
+    args = parser.parse_args()
+
+    if args.files:
+        for path in args.files:
+            with open(path, "rb") as f:
+                bench(os.path.basename(path), f.read(), args.levels)
+    else:
+        bench("项目源码", _default_corpus(), args.levels)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_frozen.py
+# 冻结索引（Eytzinger + NumPy 批量查询）vs 逐键调用树的 search / lower_bound
+# 运行：python -m benchmarks.bench_frozen [--n 100000] [--queries 1000000]
+import argparse
+import contextlib
+import io
+import random
+import time
+
+import numpy as np
+
+from core.avl_tree import AVLTree
+
+
+def _rate(count, fn):
+    t = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - t)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="冻结索引批量查询基准")
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=1000000)
+    parser.add_argument("--tree-queries", type=int, default=100000, help="逐键查询的次数（较慢，单独限量）")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    tree = AVLTree()
+    # AVLTree 旋转时会打印调试信息，构建时屏蔽标准输出
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(args.n):
+            tree.insert(rnd.randrange(args.n * 4))
+
+    t = time.perf_counter()
+    index = tree.freeze()
+    print(f"n={args.n} 冻结耗时 {time.perf_counter() - t:.3f}s")
+
+    probes = np.random.default_rng(0).integers(0, args.n * 4, size=args.queries)
+    few = probes[: args.tree_queries].tolist()
+
+    # 正确性抽查：与逐键查询一致
+    for k in few[:1000]:
+        node = tree.search(k)
+        assert index.search(k) == (node.freq if node else 0)
+
+    print(f"{'查询':<14}{'逐键/秒':>14}{'批量/秒':>16}{'加速比':>10}")
+    rows = [
+        ("search", lambda: [tree.search(k) for k in few], lambda: index.search(probes)),
+        ("lower_bound", lambda: [tree.lower_bound(k) for k in few], lambda: index.lower_bound(probes)),
+    ]
+    for name, slow, fast in rows:
+        r_tree = _rate(len(few), slow)
+        r_index = _rate(len(probes), fast)
+        print(f"{name:<14}{r_tree:>14,.0f}{r_index:>16,.0f}{r_index / r_tree:>10.1f}")
+    r_rank = _rate(len(probes), lambda: index.rank(probes))
+    r_cnt = _rate(len(probes), lambda: index.count_range(probes, probes + 100))
+    print(f"{'rank':<14}{'-':>14}{r_rank:>16,.0f}")
+    print(f"{'count_range':<14}{'-':>14}{r_cnt:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_gap_buffer.py
+# 顺序表后端对比：Python list vs array('q') 间隙缓冲区 vs 隐式 Treap
+# 局部编辑（编辑位置在上次位置附近随机游走）与随机位置编辑的速率，以及每个元素占用的内存
+# 运行：python -m benchmarks.bench_gap_buffer [--n 1000000] [--ops 200000]
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from core.sequence_list import SequenceList
+
+
+def _edits(n, ops, local, seed=0):
+    """生成 (是否插入, 位置) 序列；local 时位置在上次附近 ±4 内游走"""
+    rnd = random.Random(seed)
+    size, pos = n, n // 2
+    seq = []
+    for _ in range(ops):
+        pos = max(0, min(size, pos + rnd.randint(-4, 4))) if local else rnd.randint(0, size)
+        if rnd.random() < 0.5 or size == 0:
+            seq.append((True, pos))
+            size += 1
+        else:
+            pos = min(pos, size - 1)
+            seq.append((False, pos))
+            size -= 1
+    return seq
+
+
+def _rate(seq_list, edits):
+    t = time.perf_counter()
+    for is_insert, pos in edits:
+        if is_insert:
+            seq_list.insert(pos, pos)
+        else:
+            seq_list.delete(pos)
+    return len(edits) / (time.perf_counter() - t)
+
+
+def _bytes_per_item(backend, n):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    s = SequenceList(backend)
+    s.build(range(10 ** 6, 10 ** 6 + n))  # 避开小整数缓存
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del s
+    return (after - before) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="顺序表 list / 间隙缓冲区 / 隐式 Treap 后端基准")
+    parser.add_argument("--n", type=int, default=1000000, help="初始元素个数")
+    parser.add_argument("--ops", type=int, default=200000, help="局部编辑次数（随机编辑为其 1/20）")
+    args = parser.parse_args()
+
+    local = _edits(args.n, args.ops, local=True)
+    scattered = _edits(args.n, max(1, args.ops // 20), local=False, seed=1)
+    print(f"n={args.n}（每秒操作数）")
+    print(f"{'后端':<8}{'局部编辑':>14}{'随机编辑':>14}{'字节/元素':>12}")
+    for backend in ("list", "gap", "treap"):
+        row = []
+        for edits in (local, scattered):
+            s = SequenceList(backend)
+            s.build(range(args.n))
+            row.append(_rate(s, edits))
+        mem = _bytes_per_item(backend, min(args.n, 1000000))
+        print(f"{backend:<8}{row[0]:>14,.0f}{row[1]:>14,.0f}{mem:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_list_nodes.py
+# 链表节点开销：原 Node（time.time() id + __dict__ 可视化字段）vs SlimNode（__slots__ + 整数 id）
+# 统计每个节点占用的内存、节点创建速率，以及可扩展模式 List 的尾插速率
+# 运行：python -m benchmarks.bench_list_nodes [--n 1000000]
+import argparse
+import gc
+import time
+import tracemalloc
+
+from core.list import List, Node, SlimNode
+
+
+def _memory_per_node(factory, n):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [factory(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # 扣掉保存节点的 Python 列表本身（每个槽位一个指针）
+    per_node = (after - before) / n - 8
+    del nodes
+    return per_node
+
+
+def _rate(n, fn):
+    t = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - t)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="链表节点内存与创建速率基准")
+    parser.add_argument("--n", type=int, default=1000000)
+    args = parser.parse_args()
+    n = args.n
+
+    kinds = [("Node", lambda i: Node(i, i)), ("SlimNode", SlimNode)]
+    print(f"n={n}")
+    print(f"{'节点类型':<12}{'字节/节点':>12}{'创建/秒':>16}")
+    for name, factory in kinds:
+        mem = _memory_per_node(factory, min(n, 200000))
+        rate = _rate(n, lambda: [factory(i) for i in range(n)])
+        print(f"{name:<12}{mem:>12.0f}{rate:>16,.0f}")
+
+    print(f"\n可扩展模式 List.insert_tail（每秒）")
+    for slim in (False, True):
+        for mode in ("singly", "doubly"):
+            lst = List(mode, unbounded=True, slim=slim)
+            rate = _rate(n, lambda: [lst.insert_tail(i) for i in range(n)])
+            print(f"{'SlimNode' if slim else 'Node':<12}{mode:<10}{rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
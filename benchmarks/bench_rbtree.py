@@ -0,0 +1,75 @@
+# benchmarks/bench_rbtree.py
+# 红黑树 vs AVL 树：每次操作的旋转次数、树高、插入/查找/删除吞吐量
+# 运行：python -m benchmarks.bench_rbtree [--n 1000000] [--seed 0]
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from core.avl_tree import AVLTree
+from core.rb_tree import RBTree
+
+
+def _height(tree):
+    # AVL 节点自带高度；红黑树按层计算
+    if hasattr(tree, "height"):
+        return tree.height()
+    return tree.root.height if tree.root else 0
+
+
+def bench(cls, keys, probes):
+    tree = cls()
+    rotations = [0]
+
+    def count(state):
+        if state["action"] == "rotation":
+            rotations[0] += 1
+    tree.add_listener(count)
+
+    row = {}
+    t = time.perf_counter()
+    for k in keys:
+        tree.insert(k)
+    row["insert"] = len(keys) / (time.perf_counter() - t)
+    row["insert_rot"] = rotations[0] / len(keys)
+    row["height"] = _height(tree)
+
+    t = time.perf_counter()
+    for k in probes:
+        tree.search(k)
+    row["search"] = len(probes) / (time.perf_counter() - t)
+
+    rotations[0] = 0
+    half = keys[: len(keys) // 2]
+    t = time.perf_counter()
+    for k in half:
+        tree.delete(k)
+    row["delete"] = len(half) / (time.perf_counter() - t)
+    row["delete_rot"] = rotations[0] / max(len(half), 1)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="红黑树与 AVL 树对比基准")
+    parser.add_argument("--n", type=int, default=10 ** 6, help="键的数量")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    keys = rnd.sample(range(args.n * 4), args.n)
+    probes = [rnd.randrange(args.n * 4) for _ in range(args.n)]
+
+    print(f"n={args.n}（随机键）")
+    print(f"{'引擎':<8}{'插入/秒':>12}{'旋转/插入':>10}{'树高':>6}"
+          f"{'查找/秒':>12}{'删除/秒':>12}{'旋转/删除':>10}")
+    # AVLTree 旋转时会打印调试信息，基准中屏蔽标准输出
+    for name, cls in (("AVL", AVLTree), ("红黑树", RBTree)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            r = bench(cls, keys, probes)
+        print(f"{name:<8}{r['insert']:>12,.0f}{r['insert_rot']:>10.3f}{r['height']:>6}"
+              f"{r['search']:>12,.0f}{r['delete']:>12,.0f}{r['delete_rot']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
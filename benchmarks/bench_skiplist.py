@@ -0,0 +1,58 @@
+# benchmarks/bench_skiplist.py
+# 跳表与各树引擎对比：随机插入、查找、删除、第 k 小（仅支持 kth_smallest 的引擎）
+# 运行：python -m benchmarks.bench_skiplist [--n 100000] [--kth 200]
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from core.avl_tree import AVLTree
+from core.bplus_tree import BPlusTree
+from core.bst_tree import BSTree
+from core.rb_tree import RBTree
+from core.skip_list import SkipList
+
+
+def _rate(ops, fn):
+    t = time.perf_counter()
+    fn()
+    return len(ops) / (time.perf_counter() - t)
+
+
+def bench(cls, keys, probes, ks):
+    tree = cls()
+    row = {"insert": _rate(keys, lambda: [tree.insert(k) for k in keys])}
+    row["search"] = _rate(probes, lambda: [tree.search(p) for p in probes])
+    if hasattr(tree, "kth_smallest"):
+        row["kth"] = _rate(ks, lambda: [tree.kth_smallest(k) for k in ks])
+    half = keys[: len(keys) // 2]
+    row["delete"] = _rate(half, lambda: [tree.delete(k) for k in half])
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="跳表与树引擎对比基准")
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--kth", type=int, default=200, help="第 k 小查询次数（BSTree 每次 O(n)，不宜过大）")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    keys = [rnd.randrange(args.n * 2) for _ in range(args.n)]  # 含重复键
+    probes = [rnd.randrange(args.n * 2) for _ in range(args.n)]
+    ks = [rnd.randint(1, args.n) for _ in range(args.kth)]
+
+    engines = [("SkipList", SkipList), ("BSTree", BSTree), ("AVLTree", AVLTree),
+               ("RBTree", RBTree), ("BPlusTree", BPlusTree)]
+    print(f"n={args.n}（每秒操作数）")
+    print(f"{'引擎':<12}{'插入':>12}{'查找':>12}{'删除':>12}{'第k小':>12}")
+    for name, cls in engines:
+        # AVLTree 旋转时会打印调试信息，基准中屏蔽标准输出
+        with contextlib.redirect_stdout(io.StringIO()):
+            r = bench(cls, keys, probes, ks)
+        kth = f"{r['kth']:>12,.0f}" if "kth" in r else f"{'-':>12}"
+        print(f"{name:<12}{r['insert']:>12,.0f}{r['search']:>12,.0f}{r['delete']:>12,.0f}{kth}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_splay.py
+# Zipf 分布的 search 访问序列：伸展树 vs AVL 树 vs 普通 BST
+# skew=0 为均匀分布，skew 越大热点越集中，伸展树把热点留在根附近
+# 运行：python -m benchmarks.bench_splay [--n 100000] [--queries 200000] [--skews 0 0.8 1.0 1.2 1.5 2.0]
+import argparse
+import contextlib
+import io
+import itertools
+import random
+import time
+
+from core.avl_tree import AVLTree
+from core.bst_tree import BSTree
+from core.splay_tree import SplayTree
+
+
+def zipf_trace(keys, skew, count, rnd):
+    """按 Zipf(skew) 生成访问序列：排名 r 的键被访问的概率正比于 1 / r^skew，排名随机打乱"""
+    hot = list(keys)
+    rnd.shuffle(hot)
+    weights = [1.0 / (r ** skew) for r in range(1, len(hot) + 1)]
+    cum = list(itertools.accumulate(weights))
+    return rnd.choices(hot, cum_weights=cum, k=count)
+
+
+def _build(cls, keys):
+    tree = cls()
+    for k in keys:
+        tree.insert(k)
+    return tree
+
+
+def _mean_depth(tree, trace):
+    """通过 found/not_found 事件携带的路径统计每次查找访问的节点数"""
+    total = [0]
+
+    def listener(state):
+        if state["action"] in ("found", "not_found"):
+            total[0] += len(state["extra"] or ())
+    tree.add_listener(listener)
+    for k in trace:
+        tree.search(k)
+    tree.listeners.remove(listener)
+    return total[0] / max(len(trace), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zipf 访问下的伸展树基准")
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200000)
+    parser.add_argument("--skews", nargs="*", type=float, default=[0, 0.8, 1.0, 1.2, 1.5, 2.0])
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    keys = rnd.sample(range(args.n * 4), args.n)
+    engines = [("BSTree", BSTree), ("AVLTree", AVLTree), ("SplayTree", SplayTree)]
+
+    # AVLTree 旋转时会打印调试信息，构建时屏蔽标准输出
+    with contextlib.redirect_stdout(io.StringIO()):
+        trees = {name: _build(cls, keys) for name, cls in engines}
+
+    print(f"n={args.n} 查询数={args.queries}（查找/秒，越大越好）")
+    print(f"{'skew':>6}" + "".join(f"{name:>14}" for name, _ in engines) + f"{'伸展/AVL':>10}")
+    rows = []
+    for skew in args.skews:
+        trace = zipf_trace(keys, skew, args.queries, random.Random(int(skew * 100)))
+        rates = {}
+        for name, _ in engines:
+            tree = trees[name]
+            t = time.perf_counter()
+            for k in trace:
+                tree.search(k)
+            rates[name] = len(trace) / (time.perf_counter() - t)
+        depths = {name: _mean_depth(trees[name], trace[: len(trace) // 10]) for name, _ in engines}
+        rows.append((skew, depths))
+        print(f"{skew:>6.2f}" + "".join(f"{rates[name]:>14,.0f}" for name, _ in engines)
+              + f"{rates['SplayTree'] / rates['AVLTree']:>10.2f}")
+
+    # 访问深度与解释器开销无关，能直接看出伸展在多大的倾斜度下开始占优
+    print("\n平均访问节点数（越小越好）")
+    print(f"{'skew':>6}" + "".join(f"{name:>14}" for name, _ in engines))
+    for skew, depths in rows:
+        print(f"{skew:>6.2f}" + "".join(f"{depths[name]:>14.2f}" for name, _ in engines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_unrolled.py
+# 块状链表 vs 逐节点链表：尾插建表、整表遍历（to_list）、查找未命中（contains）、按下标随机插入/删除
+# List 使用可扩展模式（unbounded + slim），UnrolledList 比较几种块容量
+# 运行：python -m benchmarks.bench_unrolled [--n 100000] [--ops 2000]
+import argparse
+import random
+import time
+
+from core.list import List
+from core.unrolled_list import UnrolledList
+
+
+def _rate(count, fn):
+    t = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - t)
+
+
+def bench(make, n, idx_ops, rounds=5):
+    lst = make()
+    row = {"build": _rate(n, lambda: [lst.insert_tail(i) for i in range(n)])}
+    # 遍历与查找按“每秒扫过的元素数”计
+    row["traverse"] = _rate(n * rounds, lambda: [lst.to_list() for _ in range(rounds)])
+    row["find"] = _rate(n * rounds, lambda: [lst.contains(-1) for _ in range(rounds)])
+
+    def insert_delete():
+        for pos in idx_ops:
+            lst.insert_at_index(pos, pos)
+            lst.delete_at_index(pos)
+
+    row["index"] = _rate(len(idx_ops) * 2, insert_delete)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="块状链表与逐节点链表对比基准")
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--ops", type=int, default=2000, help="按下标插入+删除的次数")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    idx_ops = [rnd.randrange(args.n) for _ in range(args.ops)]
+    variants = [
+        ("List", lambda: List("singly", unbounded=True, slim=True)),
+        ("List(双)", lambda: List("doubly", unbounded=True, slim=True)),
+    ]
+    for cap in (16, 64, 256):
+        variants.append((f"Unrolled/{cap}", lambda cap=cap: UnrolledList("singly", capacity=cap, unbounded=True)))
+    variants.append(("Unrolled(双)/64", lambda: UnrolledList("doubly", capacity=64, unbounded=True)))
+
+    print(f"n={args.n}（建表/下标操作：每秒操作数；遍历/查找：每秒扫过的元素数）")
+    print(f"{'结构':<16}{'尾插建表':>14}{'遍历':>16}{'查找未命中':>16}{'下标插删':>12}")
+    for name, make in variants:
+        r = bench(make, args.n, idx_ops)
+        print(f"{name:<16}{r['build']:>14,.0f}{r['traverse']:>16,.0f}{r['find']:>16,.0f}{r['index']:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+# core/avl_setops.py
+# AVL 树的 join / split 原语，以及基于它们的并、交、差（多重集语义，freq 视为重数）
+# - join(L, k, R)：要求 L 中所有值 < k < R 中所有值，代价 O(|h(L) - h(R)| + 1)
+# - split(T, k)：按 k 拆成 (<k, ==k, >k) 三部分，代价 O(log n)
+# - union / intersection / difference：代价 O(m log(n/m + 1))，m <= n 为两棵树的规模
+# 所有操作都会直接复用（破坏）输入树的节点，调用后原树经由 clear() 清空（同步布隆过滤器、记录历史版本并通知视图）
+from concurrent.futures import ProcessPoolExecutor
+
+from core.avl_tree import AVLNode, AVLTree
+
+# 两棵树节点总数超过该值且指定了 workers 时，按枢轴切块后交给进程池并行计算
+PARALLEL_THRESHOLD = 200_000
+
+
+# ---------- 节点级辅助函数（同时维护 parent 指针与高度） ----------
+def _h(node):
+    return node.height if node else 0
+
+
+def _link(node, left, right):
+    node.left = left
+    node.right = right
+    if left:
+        left.parent = node
+    if right:
+        right.parent = node
+    node.height = 1 + max(_h(left), _h(right))
+    return node
+
+
+def _rot_left(x):
+    y = x.right
+    _link(x, x.left, y.left)
+    return _link(y, x, y.right)
+
+
+def _rot_right(y):
+    x = y.left
+    _link(y, x.right, y.right)
+    return _link(x, x.left, y)
+
+
+def _rebalance(node):
+    bf = _h(node.left) - _h(node.right)
+    if bf > 1:
+        if _h(node.left.left) < _h(node.left.right):
+            _link(node, _rot_left(node.left), node.right)
+        return _rot_right(node)
+    if bf < -1:
+        if _h(node.right.right) < _h(node.right.left):
+            _link(node, node.left, _rot_right(node.right))
+        return _rot_left(node)
+    return node
+
+
+def _detach(node):
+    if node:
+        node.parent = None
+    return node
+
+
+# ---------- join / split ----------
+def _join_right(left, mid, right):
+    # left 比 right 高：沿 left 的右脊下降，找到高度与 right 相近的子树再挂上 mid
+    if _h(left.right) <= _h(right) + 1:
+        _link(mid, left.right, right)
+    else:
+        mid = _join_right(left.right, mid, right)
+    _link(left, left.left, mid)
+    return _rebalance(left)
+
+
+def _join_left(left, mid, right):
+    if _h(right.left) <= _h(left) + 1:
+        _link(mid, left, right.left)
+    else:
+        mid = _join_left(left, mid, right.left)
+    _link(right, mid, right.right)
+    return _rebalance(right)
+
+
+def join_nodes(left, mid, right):
+    """以节点 mid 连接两棵子树，返回新根（parent 为 None）"""
+    if _h(left) > _h(right) + 1:
+        root = _join_right(left, mid, right)
+    elif _h(right) > _h(left) + 1:
+        root = _join_left(left, mid, right)
+    else:
+        root = _link(mid, left, right)
+    return _detach(root)
+
+
+def _split_last(node):
+    """拆出子树中的最大节点，返回 (剩余子树, 最大节点)"""
+    if node.right is None:
+        return _detach(node.left), node
+    rest, last = _split_last(node.right)
+    return join_nodes(node.left, node, rest), last
+
+
+def join2_nodes(left, right):
+    """没有中间键的连接：取左树最大节点作为中间键"""
+    if left is None:
+        return _detach(right)
+    if right is None:
+        return _detach(left)
+    rest, last = _split_last(left)
+    return join_nodes(rest, last, right)
+
+
+def split_nodes(node, key):
+    """返回 (值<key 的子树, 值==key 的节点或 None, 值>key 的子树)"""
+    if node is None:
+        return None, None, None
+    left, right = node.left, node.right
+    if key == node.val:
+        node.left = node.right = node.parent = None
+        node.height = 1
+        return _detach(left), node, _detach(right)
+    if key < node.val:
+        l, m, r = split_nodes(left, key)
+        return l, m, join_nodes(r, node, right)
+    l, m, r = split_nodes(right, key)
+    return join_nodes(left, node, l), m, r
+
+
+# ---------- 集合运算（节点级） ----------
+def union_nodes(a, b):
+    if a is None:
+        return _detach(b)
+    if b is None:
+        return _detach(a)
+    a_left, a_right = a.left, a.right
+    l, m, r = split_nodes(b, a.val)
+    left = union_nodes(a_left, l)
+    right = union_nodes(a_right, r)
+    if m:
+        a.freq += m.freq
+    return join_nodes(left, a, right)
+
+
+def intersection_nodes(a, b):
+    if a is None or b is None:
+        return None
+    a_left, a_right = a.left, a.right
+    l, m, r = split_nodes(b, a.val)
+    left = intersection_nodes(a_left, l)
+    right = intersection_nodes(a_right, r)
+    if m:
+        a.freq = min(a.freq, m.freq)
+        return join_nodes(left, a, right)
+    return join2_nodes(left, right)
+
+
+def difference_nodes(a, b):
+    """a - b：重数相减，减到 0 的值被删除"""
+    if a is None:
+        return None
+    if b is None:
+        return _detach(a)
+    b_left, b_right = b.left, b.right
+    l, m, r = split_nodes(a, b.val)
+    left = difference_nodes(l, b_left)
+    right = difference_nodes(r, b_right)
+    if m and m.freq > b.freq:
+        m.freq -= b.freq
+        return join_nodes(left, m, right)
+    return join2_nodes(left, right)
+
+
+_NODE_OPS = {
+    "union": union_nodes,
+    "intersection": intersection_nodes,
+    "difference": difference_nodes,
+}
+
+
+# ---------- 并行：按枢轴切块，每块在子进程中独立计算 ----------
+def _to_pairs(node):
+    pairs = []
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        pairs.append((node.val, node.freq))
+        node = node.right
+    return pairs
+
+
+def _from_pairs(pairs, lo=0, hi=None):
+    if hi is None:
+        hi = len(pairs)
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = AVLNode(pairs[mid][0])
+    node.freq = pairs[mid][1]
+    return _link(node, _from_pairs(pairs, lo, mid), _from_pairs(pairs, mid + 1, hi))
+
+
+def _size(node):
+    n = 0
+    stack = [node] if node else []
+    while stack:
+        cur = stack.pop()
+        n += 1
+        if cur.left:
+            stack.append(cur.left)
+        if cur.right:
+            stack.append(cur.right)
+    return n
+
+
+def _pick_pivots(node, count):
+    """取树的前几层（按层序）作为枢轴，这些值天然把键空间分得比较均匀"""
+    pivots = []
+    level = [node] if node else []
+    while level and len(pivots) < count:
+        nxt = []
+        for cur in level:
+            if len(pivots) < count:
+                pivots.append(cur.val)
+            nxt.extend(c for c in (cur.left, cur.right) if c)
+        level = nxt
+    return sorted(pivots)
+
+
+def _pairs_worker(op, pairs_a, pairs_b):
+    # 子进程中：以有序序列重建两棵平衡树 -> 做集合运算 -> 以有序序列返回
+    return _to_pairs(_NODE_OPS[op](_from_pairs(pairs_a), _from_pairs(pairs_b)))
+
+
+def _merge_mid(op, ma, mb):
+    """枢轴位置上两个单节点的运算结果（可能为 None）"""
+    if op == "union":
+        if ma and mb:
+            ma.freq += mb.freq
+        return ma or mb
+    if op == "intersection":
+        if ma and mb:
+            ma.freq = min(ma.freq, mb.freq)
+            return ma
+        return None
+    if ma and mb:
+        if ma.freq <= mb.freq:
+            return None
+        ma.freq -= mb.freq
+    return ma
+
+
+def _parallel_nodes(op, a, b, workers):
+    pivots = _pick_pivots(a if _h(a) >= _h(b) else b, workers - 1)
+    pieces, mids = [], []
+    for key in pivots:
+        la, ma, a = split_nodes(a, key)
+        lb, mb, b = split_nodes(b, key)
+        pieces.append((_to_pairs(la), _to_pairs(lb)))
+        mids.append(_merge_mid(op, ma, mb))
+    pieces.append((_to_pairs(a), _to_pairs(b)))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_pairs_worker, [op] * len(pieces),
+                                *zip(*pieces)))
+
+    root = _from_pairs(results[0])
+    for mid, pairs in zip(mids, results[1:]):
+        right = _from_pairs(pairs)
+        root = join_nodes(root, mid, right) if mid else join2_nodes(root, right)
+    return _detach(root)
+
+
+def combine_nodes(op, ra, rb, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    节点级集合运算，返回结果根；ra / rb 的节点被复用，调用方负责清空原树
+    workers > 1 且节点总数 >= threshold 时使用进程池
+    """
+    ra, rb = _detach(ra), _detach(rb)
+    if workers and workers > 1 and _size(ra) + _size(rb) >= threshold:
+        return _parallel_nodes(op, ra, rb, workers)
+    return _NODE_OPS[op](ra, rb)
+
+
+def _run(op, a, b, workers=None, threshold=PARALLEL_THRESHOLD):
+    """对两棵 AVLTree 做集合运算，返回新的 AVLTree；两棵输入树会被清空"""
+    if a is b:
+        raise ValueError("集合运算的两棵树不能是同一棵")
+    a._ensure_mutable()
+    b._ensure_mutable()
+    ra, rb = a.root, b.root
+    a.clear()
+    b.clear()
+    result = AVLTree()
+    result.root = combine_nodes(op, ra, rb, workers, threshold)
+    return result
+
+
+# ---------- 面向 AVLTree 的接口 ----------
+def join(left, key, right):
+    """
+    连接两棵树：要求 left 的所有值 < key < right 的所有值
+    key 可以是值，也可以是已有的 AVLNode（保留其 freq）
+    返回新的 AVLTree，left / right 被清空
+    """
+    if left is right:
+        raise ValueError("join 的两棵树不能是同一棵")
+    mid = key if isinstance(key, AVLNode) else AVLNode(key)
+    left._ensure_mutable()
+    right._ensure_mutable()
+    l, r = left.root, right.root
+    left.clear()
+    right.clear()
+    result = AVLTree()
+    result.root = join_nodes(_detach(l), mid, _detach(r))
+    return result
+
+
+def split(tree, key):
+    """
+    按 key 拆分，返回 (值<key 的 AVLTree, 值==key 的节点或 None, 值>key 的 AVLTree)
+    原树被清空
+    """
+    tree._ensure_mutable()
+    root = tree.root
+    tree.clear()
+    l, m, r = split_nodes(_detach(root), key)
+    left, right = AVLTree(), AVLTree()
+    left.root, right.root = l, r
+    return left, m, right
+
+
+def union(a, b, workers=None, threshold=PARALLEL_THRESHOLD):
+    return _run("union", a, b, workers, threshold)
+
+
+def intersection(a, b, workers=None, threshold=PARALLEL_THRESHOLD):
+    return _run("intersection", a, b, workers, threshold)
+
+
+def difference(a, b, workers=None, threshold=PARALLEL_THRESHOLD):
+    return _run("difference", a, b, workers, threshold)
@@ -1,6 +1,9 @@
 # core/avl_tree.py
 import random
 
+from core.bloom_filter import BloomTreeMixin
+from core.tree_mixins import TreeQueryMixin
+
 class AVLNode:
     def __init__(self, val):
         self.val = val
@@ -10,11 +13,14 @@ class AVLNode:
         self.parent = None  # 新增父节点引用
         self.height = 1  # AVL树节点高度
 
-class AVLTree:
+class AVLTree(BloomTreeMixin, TreeQueryMixin):
     def __init__(self):
         self.root = None
         self.listeners = []
-        self.state_list = []  # 状态列表用于回溯
+        self.history = None  # 持久化版本历史（enable_history 后启用，用于撤销/重做/回溯）
+        self.bloom = None    # 可选的布隆过滤器（attach_bloom_filter 后启用，拦截确定未命中的查找）
+        self._viewing = False       # root 指向历史版本的持久化节点（只读），第一次修改前才复制
+        self._parked_bloom = None   # 查看历史版本期间摘下的过滤器
 
     def add_listener(self, func):
         self.listeners.append(func)
@@ -23,6 +29,95 @@ class AVLTree:
         for f in self.listeners:
             f({"action": action, "node": node, "tree": self.root, "extra": extra})
 
+    # ---------- 版本历史（基于持久化 AVL，每次操作只多占 O(log n) 内存） ----------
+    def enable_history(self):
+        """开启版本历史，以当前树作为初始版本，返回 PersistentAVLTree"""
+        from core.persistent_avl import PersistentAVLTree
+
+        self.history = PersistentAVLTree()
+        pairs = []
+        stack = []
+        cur = self.root
+        while stack or cur:
+            while cur:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            pairs.append((cur.val, cur.freq))
+            cur = cur.right
+        self.history.reset(pairs)
+        return self.history
+
+    def _restore_from_history(self):
+        # 跳转 O(1)：root 直接指向该版本的持久化根，查询与绘制都在共享的只读节点上进行
+        # AVLTree 的插入/删除会原地修改节点，因此第一次修改前由 _ensure_mutable 复制出可编辑的树
+        self.root = self.history.root
+        self._viewing = True
+        if self.bloom is not None:
+            # 过滤器内容属于跳转前的版本：先摘下（查询直接走树），回到可编辑状态时再按当前内容重建
+            self._parked_bloom, self.bloom = self.bloom, None
+        self.notify("build", None, extra=[])
+
+    def _ensure_mutable(self, keep=True):
+        """
+        查看历史版本后第一次修改前调用：把当前版本复制成带 parent 指针的 AVLNode 树，O(n)
+        keep=False 用于随后整体替换 root 的操作（清空、随机重建、集合运算结果），不做复制
+        """
+        if not self._viewing:
+            return
+        self._viewing = False
+        self.root = self.history.materialize() if keep else None
+        if self._parked_bloom is not None:
+            self.bloom, self._parked_bloom = self._parked_bloom, None
+            self._sync_bloom()
+
+    def attach_bloom_filter(self, expected_n=None, fp_rate=0.01, counting=True):
+        self._parked_bloom = None
+        return super().attach_bloom_filter(expected_n, fp_rate, counting)
+
+    def detach_bloom_filter(self):
+        self._parked_bloom = None
+        super().detach_bloom_filter()
+
+    def cursor(self, val=None):
+        # 游标依赖 parent 指针，持久化节点没有
+        self._ensure_mutable()
+        return super().cursor(val)
+
+    def undo(self):
+        """撤销到上一个版本（只移动版本指针，O(1)）"""
+        if self.history is None or not self.history.undo():
+            return False
+        self._restore_from_history()
+        return True
+
+    def redo(self):
+        """重做到下一个版本（只移动版本指针，O(1)）"""
+        if self.history is None or not self.history.redo():
+            return False
+        self._restore_from_history()
+        return True
+
+    def checkout(self, version):
+        """跳转到任意历史版本（只移动版本指针，O(1)）"""
+        if self.history is None:
+            raise RuntimeError("未开启版本历史，请先调用 enable_history()")
+        self.history.checkout(version)
+        self._restore_from_history()
+
+    def clear(self):
+        self._ensure_mutable(keep=False)
+        self.root = None
+        if self.history is not None:
+            self.history.clear()
+        if self.bloom is not None:
+            self.bloom.clear()
+        self.notify("build", None, extra=[])
+
+    # 节点工厂：子类（如区间树）可以返回带额外增强字段的节点
+    def _new_node(self, val):
+        return AVLNode(val)
+
     # 辅助函数：获取节点高度
     def _height(self, node):
         return node.height if node else 0
@@ -145,11 +240,12 @@ class AVLTree:
 
     # 插入节点
     def insert(self, val, step_callback=None,skip_balance_notify=False):
+        self._ensure_mutable()
         path = []
         
         def _insert(node, val, parent=None):
             if not node:
-                new_node = AVLNode(val)
+                new_node = self._new_node(val)
                 new_node.parent = parent
                 path.append(new_node)
                 return new_node, path
@@ -175,6 +271,10 @@ class AVLTree:
             step_callback(f"开始插入值：{val}")
             
         self.root, path = _insert(self.root, val)
+        if self.history is not None:
+            self.history.insert(val)
+        if self.bloom is not None:
+            self.bloom.add(val)
         
         # 只有非随机生成时才执行这些通知
         if not skip_balance_notify:
@@ -187,6 +287,8 @@ class AVLTree:
             # 从插入节点向上检查平衡
             current = new_node
             while current:
+                # 下层的旋转会让递归阶段算好的高度过期，沿路径向上时重新计算
+                self._update_height(current)
                 # 计算平衡因子
                 bf = self._balance_factor(current)
                 
@@ -260,6 +362,7 @@ class AVLTree:
 
     # 删除节点
     def delete(self, val, step_callback=None):
+        self._ensure_mutable()
         path = []
         deleted_node = None
         
@@ -299,6 +402,8 @@ class AVLTree:
                     
                 node.val = temp.val
                 node.freq = temp.freq
+                # 频率已整体搬走，前驱节点必须被真正摘除而不是只减频率
+                temp.freq = 1
                 
                 # 删除前驱节点
                 node.left, _ = _delete(node.left, temp.val, node)
@@ -322,6 +427,13 @@ class AVLTree:
             step_callback(f"开始删除值：{val}")
             
         self.root, path = _delete(self.root, val)
+        if self.root:
+            # 删除根后提升上来的孩子仍指向被删节点，需要断开（游标等依赖 parent 指针）
+            self.root.parent = None
+        if deleted_node is not None:
+            if self.history is not None:
+                self.history.delete(val)
+            self._bloom_remove(val)
         
         # 通知删除完成（BST阶段）
         self.notify("bst_delete_complete", deleted_node, extra=path)
@@ -331,6 +443,8 @@ class AVLTree:
         # 从删除节点的父节点向上检查平衡
         current = path[-1].parent if path else None
         while current:
+            # 与插入相同：下层旋转后祖先的高度需要重新计算
+            self._update_height(current)
             # 计算平衡因子
             bf = self._balance_factor(current)
             
@@ -404,6 +518,12 @@ class AVLTree:
     def search(self, val, step_callback=None):
         if step_callback:
             step_callback(f"开始查找值：{val}")
+
+        if self.bloom is not None and not self.bloom.might_contain(val):
+            self.notify("not_found", None, extra=[])
+            if step_callback:
+                step_callback(f"布隆过滤器判定 {val} 一定不存在，跳过树查找")
+            return None
             
         cur = self.root
         path = []
@@ -426,6 +546,8 @@ class AVLTree:
                 if step_callback and cur:
                     step_callback(f"前往右子树继续查找")
 
+        if self.bloom is not None:
+            self.bloom.record_false_positive()
         self.notify("not_found", None, extra=path)
         if step_callback:
             step_callback(f"未找到节点 {val}")
@@ -449,8 +571,7 @@ class AVLTree:
     def build_random(self, n=7, value_range=(1, 100), step_callback=None):
         low, high = value_range
         if n <= 0:
-            self.root = None
-            self.notify("build", None, extra=[])
+            self.clear()
             if step_callback:
                 step_callback("清空树，生成空AVL树")
             return []
@@ -465,14 +586,17 @@ class AVLTree:
         if step_callback:
             step_callback(f"随机生成值序列：{values}")
         
+        self._ensure_mutable(keep=False)
         self.root = None
+        if self.history is not None:
+            self.history.clear()
+        if self.bloom is not None:
+            self.bloom.clear()
         for i, v in enumerate(values):
             # 随机插入时跳过平衡检查的通知流程
             self.insert(v, step_callback=step_callback)
             if step_callback:
                 step_callback(f"插入第 {i+1} 个节点：{v}")
-        # 所有插入结束后，重新计算整棵树高度 + 平衡因子
-        self._recalculate_all(self.root)
         
         self.notify("build", None, extra=values)
         return values
@@ -569,6 +693,44 @@ class AVLTree:
         self.notify("trace_path", pred, extra=path)
         return pred, path
 
+    # ---------- 集合运算（基于 join/split，见 core/avl_setops.py） ----------
+    def _replace_root(self, root, label):
+        """整体换根后同步布隆过滤器、记录一个历史版本并通知视图"""
+        self._ensure_mutable(keep=False)
+        self.root = root
+        self._sync_bloom()
+        if self.history is not None:
+            from core.avl_setops import _to_pairs
+
+            self.history.assign(_to_pairs(root), label)
+        self.notify("build", None, extra=[])
+
+    def _apply_setop(self, op, other, workers, label):
+        from core.avl_setops import combine_nodes
+
+        if other is self:
+            raise ValueError("不能与自身做集合运算")
+        # join/split 会重新链接节点，正在查看的历史版本先复制出来
+        self._ensure_mutable()
+        other._ensure_mutable()
+        ra, rb = self.root, other.root
+        # other 的节点被取走：经由 clear() 清空，其布隆过滤器、版本历史与视图随之更新
+        other.clear()
+        self._replace_root(combine_nodes(op, ra, rb, workers), label)
+        return self
+
+    def union_update(self, other, workers=None):
+        """并入 other（频率相加），other 被清空"""
+        return self._apply_setop("union", other, workers, "并集")
+
+    def intersection_update(self, other, workers=None):
+        """只保留与 other 共有的值（频率取较小者），other 被清空"""
+        return self._apply_setop("intersection", other, workers, "交集")
+
+    def difference_update(self, other, workers=None):
+        """减去 other（频率相减，减到 0 则删除），other 被清空"""
+        return self._apply_setop("difference", other, workers, "差集")
+
     # 辅助函数：获取最小值节点
     def _get_min(self, node):
         current = node
@@ -0,0 +1,76 @@
+# core/batch_query.py
+# 批量查询：查询键只排序一次，然后
+# - 查询密集时（m·h >= n）：一次迭代中序遍历，与有序查询做归并，O(n + m)
+# - 查询稀疏时：共享前缀下降，每个节点用二分把当前查询区间劈成“左 / 命中 / 右”三段，
+#   同一子树只走一次，没有逐键的 notify 与路径复制
+# 适用于任何带 val/freq/left/right 的二叉搜索树节点（AVLTree / BSTree / RBTree 等）
+from bisect import bisect_left, bisect_right
+
+
+def _plan(root, keys, size):
+    keys = list(keys)
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    if size is None:
+        # 未知节点数时按树高粗略估计（平衡树约为 2^h）
+        size = 1 << min(getattr(root, "height", 1), 62) if root else 0
+    height = getattr(root, "height", 1) if root else 0
+    dense = len(keys) * max(height, 1) >= size
+    return keys, order, dense
+
+
+def _merge_walk(root, keys, order, out, lower):
+    """迭代中序遍历与有序查询归并：每个查询落在首个值 >= 它的节点上"""
+    j, m = 0, len(order)
+    stack = []
+    node = root
+    while (stack or node) and j < m:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        v = node.val
+        while j < m and keys[order[j]] <= v:
+            if lower or keys[order[j]] == v:
+                out[order[j]] = node
+            j += 1
+        node = node.right
+
+
+def _shared_descent(root, keys, order, out, lower):
+    """共享前缀下降：栈中元素为 (子树根, 查询区间 [lo, hi), 当前 lower_bound 候选)"""
+    sorted_keys = [keys[i] for i in order]
+    stack = [(root, 0, len(order), None)]
+    while stack:
+        node, lo, hi, bound = stack.pop()
+        if node is None:
+            if lower:
+                for t in range(lo, hi):
+                    out[order[t]] = bound
+            continue
+        v = node.val
+        a = bisect_left(sorted_keys, v, lo, hi)
+        b = bisect_right(sorted_keys, v, a, hi)
+        for t in range(a, b):
+            out[order[t]] = node
+        if a > lo:
+            stack.append((node.left, lo, a, node))
+        if hi > b:
+            stack.append((node.right, b, hi, bound))
+
+
+def _run(root, keys, size, lower):
+    keys, order, dense = _plan(root, keys, size)
+    out = [None] * len(keys)
+    if root is not None and keys:
+        (_merge_walk if dense else _shared_descent)(root, keys, order, out, lower)
+    return out
+
+
+def search_many(root, keys, size=None):
+    """返回与 keys 等长的节点列表，未找到为 None；size 为树的节点数（可选，用于选择策略）"""
+    return _run(root, keys, size, lower=False)
+
+
+def lower_bound_many(root, keys, size=None):
+    """返回与 keys 等长的列表：首个值 >= 键的节点，不存在为 None"""
+    return _run(root, keys, size, lower=True)
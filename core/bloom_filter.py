@@ -0,0 +1,220 @@
+# core/bloom_filter.py
+# 布隆过滤器：挂在 AVLTree / BSTree 前面，search 未命中时大多数情况下不必走完整条根到叶路径
+# - BloomFilter：位数组，只支持 add，删除后残留的键只会增加误判，不会漏判
+# - CountingBloomFilter：每个槽位一个 8 位计数器，支持 remove；计数器饱和（255）后不再减少，保证不漏判
+# 由 expected_n 与 fp_rate 计算位数 m 与哈希个数 k；命中/拦截/误判次数可通过 stats() 查看
+# BloomTreeMixin：attach_bloom_filter / detach_bloom_filter 等挂载接口，AVLTree 与 BSTree 共用
+# 纯 Python 下过滤器本身也有常数开销：树较浅且没有监听器时收益有限，深树 / 带 UI 监听器时收益明显
+import math
+import threading
+
+_MASK64 = (1 << 64) - 1
+
+
+def _hash_pair(val):
+    """把 hash(val) 打散成两个 32 位哈希（整数的 hash() 就是它本身，需要先混合再取模）"""
+    h = (hash(val) * 0x9E3779B97F4A7C15) & _MASK64
+    h ^= h >> 29
+    h = (h * 0xBF58476D1CE4E5B9) & _MASK64
+    h ^= h >> 32
+    return h & 0xFFFFFFFF, (h >> 32) | 1
+
+
+def optimal_params(expected_n, fp_rate):
+    """返回 (m, k)：m = -n·ln p / (ln 2)^2，k = m/n · ln 2"""
+    n = max(int(expected_n), 1)
+    if not 0 < fp_rate < 1:
+        raise ValueError("fp_rate 必须在 (0, 1) 之间")
+    m = max(8, math.ceil(-n * math.log(fp_rate) / (math.log(2) ** 2)))
+    k = max(1, round(m / n * math.log(2)))
+    return m, k
+
+
+class BloomFilter:
+    def __init__(self, expected_n=1024, fp_rate=0.01):
+        self.expected_n = expected_n
+        self.fp_rate = fp_rate
+        self.m, self.k = optimal_params(expected_n, fp_rate)
+        self._alloc()
+        self.count = 0            # 已加入的元素次数
+        self.checks = 0           # might_contain 调用次数
+        self.negatives = 0        # 被过滤器直接拦截的确定未命中
+        self.false_positives = 0  # 过滤器放行但树中不存在（由树回报）
+        self._stats_lock = None   # share_between_threads() 后统计计数在锁内累加
+
+    def _alloc(self):
+        self.bits = bytearray((self.m + 7) // 8)
+
+    def _indexes(self, val):
+        # 双重哈希：g_i = h1 + i·h2（h2 取奇数）
+        h1, h2 = _hash_pair(val)
+        m = self.m
+        return [(h1 + i * h2) % m for i in range(self.k)]
+
+    def _set(self, i):
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def add(self, val):
+        for i in self._indexes(val):
+            self._set(i)
+        self.count += 1
+
+    def share_between_threads(self):
+        """
+        多个读线程共享同一过滤器时调用（见 core/concurrent_tree.py）：
+        查询只持有共享读锁，checks / negatives / false_positives 的累加改为在互斥锁内进行
+        """
+        if self._stats_lock is None:
+            self._stats_lock = threading.Lock()
+        return self
+
+    def _probe(self, val):
+        # 查找是热路径：逐个探测，遇到空位立即返回，不预先算出全部 k 个下标
+        h, h2 = _hash_pair(val)
+        m = self.m
+        bits = self.bits
+        for _ in range(self.k):
+            i = h % m
+            if not bits[i >> 3] >> (i & 7) & 1:
+                return False
+            h += h2
+        return True
+
+    def might_contain(self, val):
+        """False 表示一定不存在；True 表示可能存在"""
+        hit = self._probe(val)
+        lock = self._stats_lock
+        if lock is None:
+            self.checks += 1
+            if not hit:
+                self.negatives += 1
+        else:
+            with lock:
+                self.checks += 1
+                if not hit:
+                    self.negatives += 1
+        return hit
+
+    def __contains__(self, val):
+        return self.might_contain(val)
+
+    def record_false_positive(self):
+        if self._stats_lock is None:
+            self.false_positives += 1
+        else:
+            with self._stats_lock:
+                self.false_positives += 1
+
+    def clear(self):
+        self._alloc()
+        self.count = 0
+
+    def update(self, values):
+        for v in values:
+            self.add(v)
+
+    def estimated_fp_rate(self):
+        """按当前元素数估计的理论误判率 (1 - e^(-k·n/m))^k"""
+        return (1 - math.exp(-self.k * self.count / self.m)) ** self.k
+
+    def stats(self):
+        passed = self.checks - self.negatives
+        return {
+            "m": self.m,
+            "k": self.k,
+            "count": self.count,
+            "checks": self.checks,
+            "negatives": self.negatives,
+            "false_positives": self.false_positives,
+            # 被拦截的查询占比（越高越省路径遍历）
+            "filter_rate": self.negatives / self.checks if self.checks else 0.0,
+            # 放行的查询中实际未命中的占比
+            "observed_fp_rate": self.false_positives / passed if passed else 0.0,
+            "estimated_fp_rate": self.estimated_fp_rate(),
+        }
+
+
+class CountingBloomFilter(BloomFilter):
+    MAX_COUNT = 255
+
+    def _alloc(self):
+        self.counters = bytearray(self.m)
+
+    def _set(self, i):
+        if self.counters[i] < self.MAX_COUNT:
+            self.counters[i] += 1
+
+    def _probe(self, val):
+        h, h2 = _hash_pair(val)
+        m = self.m
+        counters = self.counters
+        for _ in range(self.k):
+            if not counters[h % m]:
+                return False
+            h += h2
+        return True
+
+    def remove(self, val):
+        """移除一次 val（调用方需保证 val 之前加入过）"""
+        for i in self._indexes(val):
+            c = self.counters[i]
+            if 0 < c < self.MAX_COUNT:
+                self.counters[i] = c - 1
+        self.count = max(self.count - 1, 0)
+
+
+def _iter_nodes(node):
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def fill_from_tree(bloom, root):
+    """清空后按树的当前内容重新填充（计数版按频率计次，与 add/remove 的计数方式一致）"""
+    bloom.clear()
+    counting = isinstance(bloom, CountingBloomFilter)
+    n = 0
+    for node in _iter_nodes(root):
+        for _ in range(node.freq if counting else 1):
+            bloom.add(node.val)
+        n += 1
+    return n
+
+
+def filter_for_tree(root, expected_n=None, fp_rate=0.01, counting=True):
+    """为一棵树创建并填充过滤器；expected_n 缺省时取当前不同键数的两倍（至少 1024）"""
+    if expected_n is None:
+        expected_n = max(2 * sum(1 for _ in _iter_nodes(root)), 1024)
+    bloom = (CountingBloomFilter if counting else BloomFilter)(expected_n, fp_rate)
+    fill_from_tree(bloom, root)
+    return bloom
+
+
+class BloomTreeMixin:
+    """AVLTree / BSTree 共用的过滤器挂载接口；宿主类需提供 self.root 与 self.bloom（初始为 None）"""
+
+    def attach_bloom_filter(self, expected_n=None, fp_rate=0.01, counting=True):
+        """
+        在 search 前挂一个布隆过滤器，确定未命中时直接返回，不再走根到叶路径
+        counting=True 使用计数版以支持删除；返回过滤器本身（可调用 stats() 查看命中率）
+        """
+        self.bloom = filter_for_tree(self.root, expected_n, fp_rate, counting)
+        return self.bloom
+
+    def detach_bloom_filter(self):
+        self.bloom = None
+
+    def _sync_bloom(self):
+        """树被整体替换后（版本回溯、集合运算等）按当前内容重建过滤器"""
+        if self.bloom is not None:
+            fill_from_tree(self.bloom, self.root)
+
+    def _bloom_remove(self, val):
+        # 普通布隆过滤器不支持删除，残留的位只会增加误判
+        if self.bloom is not None and hasattr(self.bloom, "remove"):
+            self.bloom.remove(val)
@@ -0,0 +1,423 @@
+# core/bplus_tree.py
+# B+ 树有序多重集：内部节点只存分隔键，叶子节点用有序数组保存 (键, 频率) 并用 bisect 查找
+# 叶子之间双向链接，范围扫描只需定位一次再沿链表顺序读取
+# 与 AVLTree / BSTree 相比，一个叶子承载 order-1 个键，Python 对象数量与指针跳转次数都少得多
+import random
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+# search / lower_bound / successor / predecessor 的返回值：带 val 属性，可直接替代二叉树节点使用
+BPlusEntry = namedtuple("BPlusEntry", ["val", "freq", "leaf", "index"])
+
+
+class BPlusLeaf:
+    __slots__ = ("keys", "freqs", "next", "prev")
+
+    def __init__(self, keys=None, freqs=None):
+        self.keys = keys if keys is not None else []
+        self.freqs = freqs if freqs is not None else []
+        self.next = None
+        self.prev = None
+
+    is_leaf = True
+
+    def __repr__(self):
+        return f"BPlusLeaf({self.keys})"
+
+
+class BPlusInternal:
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys=None, children=None):
+        # children[i] 中的键都 < keys[i] <= children[i+1] 中的键
+        self.keys = keys if keys is not None else []
+        self.children = children if children is not None else []
+
+    is_leaf = False
+
+    def __repr__(self):
+        return f"BPlusInternal({self.keys})"
+
+
+class BPlusTree:
+    def __init__(self, order=64):
+        """order：内部节点最多的孩子数（>=3），每个节点最多 order-1 个键"""
+        if order < 3:
+            raise ValueError("B+ 树的阶必须 >= 3")
+        self.order = order
+        self.max_keys = order - 1
+        self.min_keys = self.max_keys // 2
+        self.root = BPlusLeaf()
+        self.size = 0  # 总元素个数（含重复）
+        self.listeners = []
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    def notify(self, action, node=None, extra=None):
+        for f in self.listeners:
+            f({"action": action, "node": node, "tree": self.root, "extra": extra})
+
+    def __len__(self):
+        return self.size
+
+    def clear(self):
+        self.root = BPlusLeaf()
+        self.size = 0
+        self.notify("build", None, extra=[])
+
+    @classmethod
+    def from_sorted(cls, pairs, order=64):
+        """由有序且无重复的 (键, 频率) 序列自底向上批量构建，O(n)"""
+        tree = cls(order)
+        pairs = list(pairs)
+        if not pairs:
+            return tree
+        # 叶子装满到 max_keys，最后两个叶子平分，保证不低于 min_keys
+        level = []
+        step = tree.max_keys
+        chunks = [pairs[i:i + step] for i in range(0, len(pairs), step)]
+        if len(chunks) > 1 and len(chunks[-1]) < tree.min_keys:
+            merged = chunks[-2] + chunks[-1]
+            half = len(merged) // 2
+            chunks[-2:] = [merged[:half], merged[half:]]
+        prev = None
+        for chunk in chunks:
+            leaf = BPlusLeaf([k for k, _ in chunk], [f for _, f in chunk])
+            leaf.prev = prev
+            if prev:
+                prev.next = leaf
+            prev = leaf
+            level.append((chunk[0][0], leaf))
+            tree.size += sum(f for _, f in chunk)
+        # 逐层向上构建内部节点
+        while len(level) > 1:
+            groups = [level[i:i + tree.order] for i in range(0, len(level), tree.order)]
+            if len(groups) > 1 and len(groups[-1]) < tree.min_keys + 1:
+                merged = groups[-2] + groups[-1]
+                half = len(merged) // 2
+                groups[-2:] = [merged[:half], merged[half:]]
+            level = [(g[0][0], BPlusInternal([k for k, _ in g[1:]], [n for _, n in g]))
+                     for g in groups]
+        tree.root = level[0][1]
+        return tree
+
+    # ---------- 定位 ----------
+    def _find_leaf(self, val, path=None):
+        node = self.root
+        while not node.is_leaf:
+            if path is not None:
+                path.append(node)
+            node = node.children[bisect_right(node.keys, val)]
+        if path is not None:
+            path.append(node)
+        return node
+
+    def _first_leaf(self):
+        node = self.root
+        while not node.is_leaf:
+            node = node.children[0]
+        return node
+
+    def _last_leaf(self):
+        node = self.root
+        while not node.is_leaf:
+            node = node.children[-1]
+        return node
+
+    def height(self):
+        h = 1
+        node = self.root
+        while not node.is_leaf:
+            node = node.children[0]
+            h += 1
+        return h
+
+    # ---------- 插入 ----------
+    def insert(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始插入值：{val}")
+        split = self._insert(self.root, val, step_callback)
+        if split:
+            sep, right = split
+            self.root = BPlusInternal([sep], [self.root, right])
+            if step_callback:
+                step_callback(f"根节点分裂，新根分隔键 {sep}，树高 +1")
+        self.size += 1
+        if self.listeners:
+            self.notify("insert", self._find_leaf(val), extra={"val": val})
+        return self.root
+
+    def _insert(self, node, val, step_callback):
+        """返回 None 或 (分隔键, 新右兄弟)"""
+        if node.is_leaf:
+            keys = node.keys
+            i = bisect_left(keys, val)
+            if i < len(keys) and keys[i] == val:
+                node.freqs[i] += 1
+                if step_callback:
+                    step_callback(f"值 {val} 已存在，频率+1 -> {node.freqs[i]}")
+                return None
+            keys.insert(i, val)
+            node.freqs.insert(i, 1)
+            if len(keys) <= self.max_keys:
+                return None
+            mid = len(keys) // 2
+            right = BPlusLeaf(keys[mid:], node.freqs[mid:])
+            del keys[mid:]
+            del node.freqs[mid:]
+            right.next = node.next
+            right.prev = node
+            if node.next:
+                node.next.prev = right
+            node.next = right
+            if step_callback:
+                step_callback(f"叶子溢出，分裂为 {keys} | {right.keys}")
+            self.notify("split", right, extra={"sep": right.keys[0]})
+            return right.keys[0], right
+
+        i = bisect_right(node.keys, val)
+        split = self._insert(node.children[i], val, step_callback)
+        if split is None:
+            return None
+        sep, right = split
+        node.keys.insert(i, sep)
+        node.children.insert(i + 1, right)
+        if len(node.keys) <= self.max_keys:
+            return None
+        mid = len(node.keys) // 2
+        up = node.keys[mid]
+        new = BPlusInternal(node.keys[mid + 1:], node.children[mid + 1:])
+        del node.keys[mid:]
+        del node.children[mid + 1:]
+        if step_callback:
+            step_callback(f"内部节点溢出，键 {up} 上移")
+        self.notify("split", new, extra={"sep": up})
+        return up, new
+
+    # ---------- 删除 ----------
+    def delete(self, val, step_callback=None):
+        """删除一个 val（频率>1 时只减频率），返回是否删除成功"""
+        if step_callback:
+            step_callback(f"开始删除值：{val}")
+        ok = self._delete(self.root, val, step_callback)
+        if not ok:
+            if step_callback:
+                step_callback(f"未找到值 {val}")
+            self.notify("not_found", None, extra=[])
+            return False
+        if not self.root.is_leaf and not self.root.keys:
+            self.root = self.root.children[0]
+            if step_callback:
+                step_callback("根节点只剩一个孩子，树高 -1")
+        self.size -= 1
+        self.notify("delete", None, extra={"val": val})
+        return True
+
+    def _delete(self, node, val, step_callback):
+        if node.is_leaf:
+            i = bisect_left(node.keys, val)
+            if i == len(node.keys) or node.keys[i] != val:
+                return False
+            if node.freqs[i] > 1:
+                node.freqs[i] -= 1
+                if step_callback:
+                    step_callback(f"值 {val} 频率-1 -> {node.freqs[i]}")
+            else:
+                del node.keys[i]
+                del node.freqs[i]
+            return True
+
+        i = bisect_right(node.keys, val)
+        child = node.children[i]
+        if not self._delete(child, val, step_callback):
+            return False
+        if len(child.keys) < self.min_keys:
+            self._fix_underflow(node, i, step_callback)
+        return True
+
+    def _fix_underflow(self, parent, i, step_callback):
+        child = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+
+        # 1. 向兄弟借一个键
+        if left and len(left.keys) > self.min_keys:
+            if child.is_leaf:
+                child.keys.insert(0, left.keys.pop())
+                child.freqs.insert(0, left.freqs.pop())
+                parent.keys[i - 1] = child.keys[0]
+            else:
+                child.keys.insert(0, parent.keys[i - 1])
+                child.children.insert(0, left.children.pop())
+                parent.keys[i - 1] = left.keys.pop()
+            if step_callback:
+                step_callback("节点下溢，向左兄弟借键")
+            return
+        if right and len(right.keys) > self.min_keys:
+            if child.is_leaf:
+                child.keys.append(right.keys.pop(0))
+                child.freqs.append(right.freqs.pop(0))
+                parent.keys[i] = right.keys[0]
+            else:
+                child.keys.append(parent.keys[i])
+                child.children.append(right.children.pop(0))
+                parent.keys[i] = right.keys.pop(0)
+            if step_callback:
+                step_callback("节点下溢，向右兄弟借键")
+            return
+
+        # 2. 与兄弟合并（统一合并到左边的节点）
+        if right is None:
+            i -= 1
+            child, right = left, child
+        if child.is_leaf:
+            child.keys.extend(right.keys)
+            child.freqs.extend(right.freqs)
+            child.next = right.next
+            if right.next:
+                right.next.prev = child
+        else:
+            child.keys.append(parent.keys[i])
+            child.keys.extend(right.keys)
+            child.children.extend(right.children)
+        del parent.keys[i]
+        del parent.children[i + 1]
+        if step_callback:
+            step_callback("节点下溢，与兄弟合并")
+        self.notify("merge", child, extra={})
+
+    # ---------- 查询 ----------
+    def search(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始查找值：{val}")
+        path = []
+        leaf = self._find_leaf(val, path)
+        i = bisect_left(leaf.keys, val)
+        if i < len(leaf.keys) and leaf.keys[i] == val:
+            entry = BPlusEntry(val, leaf.freqs[i], leaf, i)
+            self.notify("found", leaf, extra=path)
+            if step_callback:
+                step_callback(f"找到值 {val}（频率：{entry.freq}）")
+            return entry
+        self.notify("not_found", None, extra=path)
+        if step_callback:
+            step_callback(f"未找到值 {val}")
+        return None
+
+    def count(self, val):
+        leaf = self._find_leaf(val)
+        i = bisect_left(leaf.keys, val)
+        return leaf.freqs[i] if i < len(leaf.keys) and leaf.keys[i] == val else 0
+
+    def _entry_at(self, leaf, i):
+        """叶子中第 i 个位置的条目，越界时沿链表移到相邻叶子"""
+        while leaf and i >= len(leaf.keys):
+            i -= len(leaf.keys)
+            leaf = leaf.next
+        if leaf is None:
+            return None
+        return BPlusEntry(leaf.keys[i], leaf.freqs[i], leaf, i)
+
+    def lower_bound(self, val, step_callback=None):
+        """首个 >= val 的条目，返回 (entry 或 None, 路径)"""
+        if step_callback:
+            step_callback(f"查找值 {val} 的lower_bound（首个≥{val}的值）")
+        path = []
+        leaf = self._find_leaf(val, path)
+        res = self._entry_at(leaf, bisect_left(leaf.keys, val))
+        self.notify("trace_path", res.leaf if res else None, extra=path)
+        return res, path
+
+    def successor(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的后继")
+        path = []
+        leaf = self._find_leaf(val, path)
+        res = self._entry_at(leaf, bisect_right(leaf.keys, val))
+        self.notify("trace_path", res.leaf if res else None, extra=path)
+        return res, path
+
+    def predecessor(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的前驱")
+        path = []
+        leaf = self._find_leaf(val, path)
+        i = bisect_left(leaf.keys, val) - 1
+        while leaf and i < 0:
+            leaf = leaf.prev
+            i = len(leaf.keys) - 1 if leaf else -1
+        res = BPlusEntry(leaf.keys[i], leaf.freqs[i], leaf, i) if leaf else None
+        self.notify("trace_path", res.leaf if res else None, extra=path)
+        return res, path
+
+    def range(self, lo=None, hi=None):
+        """按序产出 lo <= 键 < hi 的 (键, 频率)；lo/hi 为 None 表示不限"""
+        if lo is None:
+            leaf, i = self._first_leaf(), 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect_left(leaf.keys, lo)
+        while leaf:
+            keys = leaf.keys
+            end = len(keys) if hi is None else bisect_left(keys, hi, i)
+            freqs = leaf.freqs
+            for j in range(i, end):
+                yield keys[j], freqs[j]
+            if end < len(keys):
+                return
+            leaf, i = leaf.next, 0
+
+    def inorder(self):
+        res = []
+        leaf = self._first_leaf()
+        while leaf:
+            for k, f in zip(leaf.keys, leaf.freqs):
+                if f == 1:
+                    res.append(k)
+                else:
+                    res.extend([k] * f)
+            leaf = leaf.next
+        return res
+
+    def leaves(self):
+        """按顺序返回所有叶子（可视化使用）"""
+        res = []
+        leaf = self._first_leaf()
+        while leaf:
+            res.append(leaf)
+            leaf = leaf.next
+        return res
+
+    def levels(self):
+        """按层返回节点列表（可视化使用）"""
+        res = []
+        level = [self.root]
+        while level:
+            res.append(level)
+            if level[0].is_leaf:
+                break
+            level = [c for n in level for c in n.children]
+        return res
+
+    def node_count(self):
+        return sum(len(level) for level in self.levels())
+
+    def build_random(self, n=7, value_range=(1, 100), step_callback=None):
+        low, high = value_range
+        self.root = BPlusLeaf()
+        self.size = 0
+        if n <= 0:
+            self.notify("build", None, extra=[])
+            return []
+        rng = high - low + 1
+        if n <= rng:
+            values = random.sample(range(low, high + 1), n)
+        else:
+            values = random.choices(range(low, high + 1), k=n)
+        if step_callback:
+            step_callback(f"随机生成值序列：{values}")
+        for v in values:
+            self.insert(v, step_callback=step_callback)
+        self.notify("build", None, extra=values)
+        return values
@@ -1,8 +1,12 @@
 # core/bst_tree.py
 # 完整的 BST 数据结构（支持 multiset via freq）并提供可视化/动画友好的回调与路径信息
+import math
 import random
 from collections import deque
 
+from core.bloom_filter import BloomTreeMixin
+from core.tree_mixins import TreeQueryMixin
+
 class BSTNode:
     def __init__(self, val, parent=None):
         self.val = val
@@ -24,10 +28,13 @@ class BSTNode:
     def __repr__(self):
         return f"BSTNode({self.val},freq={self.freq})"
 
-class BSTree:
+class BSTree(BloomTreeMixin, TreeQueryMixin):
     def __init__(self):
         self.root = None
         self.listeners = []
+        # 自动重新平衡阈值 c：树高超过 c·log2(n+1) 时自动执行 DSW，None 表示关闭
+        self.auto_rebalance_factor = None
+        self.bloom = None  # 可选的布隆过滤器（attach_bloom_filter 后启用，拦截确定未命中的查找）
 
     def add_listener(self, func):
         self.listeners.append(func)
@@ -77,6 +84,8 @@ class BSTree:
         """
         if step_callback:
             step_callback(f"[insert] 开始插入 {val}")
+        if self.bloom is not None:
+            self.bloom.add(val)
 
         if not self.root:
             self.root = BSTNode(val)
@@ -126,6 +135,7 @@ class BSTree:
         # 通知，extra 使用插入路径（便于动画）
         path.append(new_node)
         self.notify("insert", new_node, extra=path)
+        self._maybe_rebalance(new_node, step_callback)
         return new_node
 
     # ---------- 搜索 ----------
@@ -133,6 +143,11 @@ class BSTree:
         """精确搜索（返回节点或 None），并通过 notify 发送路径（用于动画）"""
         if step_callback:
             step_callback(f"[search] 开始查找 {val}")
+        if self.bloom is not None and not self.bloom.might_contain(val):
+            self.notify("not_found", None, extra=[])
+            if step_callback:
+                step_callback(f"[search] 布隆过滤器判定 {val} 一定不存在，跳过树查找")
+            return None
         cur = self.root
         path = []
         while cur:
@@ -148,6 +163,8 @@ class BSTree:
                 cur = cur.left
             else:
                 cur = cur.right
+        if self.bloom is not None:
+            self.bloom.record_false_positive()
         self.notify("not_found", None, extra=path)
         if step_callback:
             step_callback(f"[search] 未找到 {val}")
@@ -275,6 +292,7 @@ class BSTree:
             return False
 
         path.append(cur)
+        self._bloom_remove(val)
         # 若 freq>1, 仅递减频率
         if cur.freq > 1:
             cur.freq -= 1
@@ -300,6 +318,7 @@ class BSTree:
             # 更新父链
             if parent:
                 self._update_path_from(parent)
+            self._maybe_rebalance(parent, step_callback)
             return True
 
         if not cur.left or not cur.right:
@@ -319,6 +338,7 @@ class BSTree:
                 step_callback(f"[delete] 单子节点 {val} 已删除，子节点提升")
             # 更新父链
             self._update_path_from(child.parent or child)
+            self._maybe_rebalance(child, step_callback)
             return True
 
         # 双子节点：使用前驱（左子树最大）替换（也可用后继）
@@ -354,8 +374,124 @@ class BSTree:
         self.notify("delete", cur, extra=path + [pred])
         if step_callback:
             step_callback(f"[delete] 前驱 {pred.val} 已删除，替换完成")
+        self._maybe_rebalance(pred_parent, step_callback)
         return True
 
+    # ---------- 重新平衡（Day–Stout–Warren） ----------
+    def rebalance(self, step_callback=None):
+        """
+        DSW 算法原地重新平衡整棵树，O(n) 时间、O(1) 额外空间（不递归、不建数组）
+        1. 右旋把整棵树拉直成只有右孩子的“藤”（vine）
+        2. 多轮左旋压缩，把藤折叠成完全平衡的树
+        3. 一次迭代后序遍历，同时修正 parent 指针并刷新 height/bf/sz
+        返回重新平衡后的树高
+        """
+        if not self.root:
+            return 0
+        before = self.root.height
+        n = self._rebuild(self.root)
+        after = self.root.height
+        if step_callback:
+            step_callback(f"[rebalance] DSW 重新平衡：{n} 个节点，树高 {before} -> {after}")
+        self.notify("rebalance", self.root, extra={"before": before, "after": after})
+        return after
+
+    def _rebuild(self, node):
+        """对以 node 为根的子树执行 DSW，重新挂回原父节点并更新祖先，返回子树节点数"""
+        parent = node.parent
+        pseudo = BSTNode(None)  # 伪根，简化对子树根的旋转
+        pseudo.right = node
+
+        # 1. tree -> vine
+        n = 0
+        tail = pseudo
+        rest = tail.right
+        while rest:
+            if rest.left:
+                child = rest.left
+                rest.left = child.right
+                child.right = rest
+                rest = child
+                tail.right = child
+            else:
+                tail = rest
+                rest = rest.right
+                n += 1
+
+        # 2. vine -> tree：先把多出满二叉树的部分压成最底层叶子，再逐轮减半
+        full = (1 << ((n + 1).bit_length() - 1)) - 1
+        self._compress(pseudo, n - full)
+        size = full
+        while size > 1:
+            size //= 2
+            self._compress(pseudo, size)
+
+        top = pseudo.right
+        top.parent = parent
+        if parent is None:
+            self.root = top
+        elif parent.left is node:
+            parent.left = top
+        else:
+            parent.right = top
+        self._refresh_subtree(top)
+        self._update_path_from(parent)
+        return n
+
+    @staticmethod
+    def _compress(pseudo, count):
+        """沿藤向下做 count 次左旋（每隔一个节点旋转一次）"""
+        scanner = pseudo
+        for _ in range(count):
+            child = scanner.right
+            scanner.right = child.right
+            scanner = scanner.right
+            child.right = scanner.left
+            scanner.left = child
+
+    def _refresh_subtree(self, top):
+        """
+        借助 parent 指针的迭代后序遍历：首次到达节点时修正孩子的 parent，
+        离开节点时 _update_node，整棵子树一遍完成，不需要栈
+        """
+        stop = top.parent
+        prev, cur = stop, top
+        while cur is not stop:
+            if prev is cur.parent:
+                # 首次到达：孩子的 parent 指针在旋转后可能已失效
+                if cur.left:
+                    cur.left.parent = cur
+                if cur.right:
+                    cur.right.parent = cur
+                nxt = cur.left or cur.right
+            elif prev is cur.left and cur.right:
+                nxt = cur.right
+            else:
+                nxt = None
+            if nxt is None:
+                self._update_node(cur)
+                nxt = cur.parent
+            prev, cur = cur, nxt
+
+    def _maybe_rebalance(self, node=None, step_callback=None):
+        """
+        开启自动平衡时，若树高 > c·log2(n+1)，从发生修改的 node 向上找到
+        第一个同样失衡（子树高 > c·log2(子树节点数+1)）的祖先，只对这棵子树执行 DSW
+        （与替罪羊树相同的思路：有序插入时每次只重建末端的小子树，均摊 O(log n)）
+        """
+        c = self.auto_rebalance_factor
+        if not (c and self.root and self.root.height > c * math.log2(self.root.sz + 1)):
+            return
+        x = node or self.root
+        while x.height <= c * math.log2(x.sz + 1):
+            x = x.parent
+        before = self.root.height
+        n = self._rebuild(x)
+        after = self.root.height
+        if step_callback:
+            step_callback(f"[rebalance] 树高超过 {c}·log2(n+1)，对以 {x.val} 为根的 {n} 个节点子树执行 DSW")
+        self.notify("rebalance", self.root, extra={"before": before, "after": after})
+
 
     # ---------- 遍历（返回序列）并支持路径/动画 ----------
     def inorder(self, step_callback=None):
@@ -500,6 +636,8 @@ class BSTree:
         low, high = value_range
         if step_callback:
             step_callback(f"[build_random] 生成 {n} 个随机值，范围 {low}..{high}")
+        if self.bloom is not None:
+            self.bloom.clear()
         if n <= 0:
             self.root = None
             self.notify("build", None, extra=[])
@@ -528,4 +666,6 @@ class BSTree:
     # ---------- 额外工具：清空树 ----------
     def clear(self):
         self.root = None
+        if self.bloom is not None:
+            self.bloom.clear()
         self.notify("update", None, extra=[])
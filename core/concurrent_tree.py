@@ -0,0 +1,265 @@
+# core/concurrent_tree.py
+# 搜索树的多线程访问层：多个读线程并发查询，单个写线程更新
+# 两种方案：
+# 1. ReadWriteLockedTree：读写锁包装现有的 AVLTree / BSTree，读操作共享、写操作独占
+# 2. SnapshotTree：RCU 风格，写线程用路径复制生成新的不可变根后一次性发布，
+#    读线程拿到根引用后无锁遍历，永远看到某个完整版本
+import threading
+from contextlib import contextmanager
+
+from core.persistent_avl import _delete, _insert, _build_sorted
+
+
+class RWLock:
+    """
+    写优先的读写锁：有写线程在等待时，新的读线程会被阻塞，避免写线程饿死
+    对持有者可重入：持有写锁的线程可以再加读锁或写锁，已持有读锁的线程可以再加读锁（不会被等待中的写线程挡住）
+    写锁内加的读锁不占读者计数；若写锁先于这些读锁释放，它们在释放写锁时转为普通读锁（降级），不会被写线程插入
+    读锁不能升级为写锁（两个读线程同时升级必然互相等待），此时抛出 RuntimeError
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._owner = None              # 持有写锁的线程 id
+        self._write_depth = 0           # 写锁重入层数
+        self._local = threading.local()  # 每个线程持有的读锁：列表，每项记录该次加锁是否计入 _readers
+
+    def _held_reads(self):
+        reads = getattr(self._local, "reads", None)
+        if reads is None:
+            reads = self._local.reads = []
+        return reads
+
+    def acquire_read(self):
+        reads = self._held_reads()
+        if self._owner == threading.get_ident():
+            # 写锁内的读锁只记层数，不占读者计数；是否计数在加锁时确定，释放时按记录处理
+            reads.append(False)
+            return
+        with self._cond:
+            if not reads:
+                while self._writer or self._waiting_writers:
+                    self._cond.wait()
+            self._readers += 1
+        reads.append(True)
+
+    def release_read(self):
+        if not self._held_reads().pop():
+            return
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        if self._owner == me:
+            self._write_depth += 1
+            return
+        if self._held_reads():
+            raise RuntimeError("持有读锁时不能再获取写锁（读锁不支持升级）")
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+            self._owner = me
+            self._write_depth = 1
+
+    def release_write(self):
+        self._write_depth -= 1
+        if self._write_depth:
+            return
+        reads = self._held_reads()
+        with self._cond:
+            # 仍持有写锁内加的读锁：原子地降级为普通读锁
+            for i, counted in enumerate(reads):
+                if not counted:
+                    reads[i] = True
+                    self._readers += 1
+            self._writer = False
+            self._owner = None
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ReadWriteLockedTree:
+    """
+    读写锁包装的搜索树（AVLTree / BSTree 均可）
+    - 查询方法在读锁下执行，可多线程并发
+    - 修改方法在写锁下执行，同一时刻只有一个写线程且没有读线程
+    - 监听器回调统一经过一把互斥锁串行分发（查询也会 notify，读线程之间会竞争监听器）
+    - cursor() 只在创建时持有读锁，之后移动游标不加锁，多线程下应放在 with wrapper.read() 中使用
+    - 挂了布隆过滤器时，search 会在读锁下累加过滤器的命中统计，因此包装时改为线程安全的统计
+    """
+    READ_METHODS = ("search", "lower_bound", "successor", "predecessor",
+                    "inorder", "preorder", "postorder", "kth_smallest",
+                    "search_many", "lower_bound_many", "cursor", "freeze")
+    WRITE_METHODS = ("insert", "delete", "clear", "build_random", "detach_bloom_filter")
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.lock = RWLock()
+        self._notify_lock = threading.Lock()
+        if getattr(tree, "bloom", None) is not None:
+            tree.bloom.share_between_threads()
+        # 已注册的监听器也改为串行分发
+        listeners = list(tree.listeners)
+        tree.listeners.clear()
+        for func in listeners:
+            self.add_listener(func)
+
+    def add_listener(self, func):
+        def serialized(state):
+            with self._notify_lock:
+                func(state)
+        self.tree.add_listener(serialized)
+
+    @property
+    def root(self):
+        return self.tree.root
+
+    def attach_bloom_filter(self, *args, **kwargs):
+        """在写锁下挂过滤器，并让其统计计数在并发读下保持准确"""
+        with self.lock.write_locked():
+            return self.tree.attach_bloom_filter(*args, **kwargs).share_between_threads()
+
+    def read(self):
+        """在读锁下做多步查询：with wrapper.read(): ...（块内可以继续调用包装器的查询方法）"""
+        return self.lock.read_locked()
+
+    def write(self):
+        """在写锁下做多步修改：with wrapper.write(): ...（块内可以继续调用包装器的任意方法）"""
+        return self.lock.write_locked()
+
+    def __getattr__(self, name):
+        attr = getattr(self.tree, name)
+        if name in self.READ_METHODS:
+            def reader(*args, **kwargs):
+                with self.lock.read_locked():
+                    return attr(*args, **kwargs)
+            return reader
+        if name in self.WRITE_METHODS:
+            def writer(*args, **kwargs):
+                with self.lock.write_locked():
+                    return attr(*args, **kwargs)
+            return writer
+        return attr
+
+
+class SnapshotTree:
+    """
+    RCU 风格的快照树
+    - 节点为 PersistentAVLNode，创建后不再修改
+    - 写操作在写锁下基于当前根做路径复制，得到新根后赋值给 self._root（引用赋值是原子的）
+    - 读操作先取一次 self._root，之后整个查询都在这个不可变快照上进行，不需要任何锁
+    - 旧版本在没有读线程引用后由垃圾回收释放（相当于 RCU 的宽限期）
+    """
+    def __init__(self, values=()):
+        self._write_lock = threading.Lock()
+        self._notify_lock = threading.Lock()
+        self.listeners = []
+        self.version = 0
+        pairs = {}
+        for v in values:
+            pairs[v] = pairs.get(v, 0) + 1
+        items = sorted(pairs.items())
+        self._root = _build_sorted(items, 0, len(items))
+
+    @classmethod
+    def from_tree(cls, tree):
+        """由现有 AVLTree / BSTree 的中序结果构造"""
+        return cls(tree.inorder())
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    def notify(self, action, node=None, extra=None):
+        with self._notify_lock:
+            for f in self.listeners:
+                f({"action": action, "node": node, "tree": self._root, "extra": extra})
+
+    @property
+    def root(self):
+        return self._root
+
+    def snapshot(self):
+        """返回当前已发布的不可变根，可在其上做任意多次一致的查询"""
+        return self._root
+
+    # ---------- 写（单写者） ----------
+    def _publish(self, new_root):
+        self._root = new_root
+        self.version += 1
+
+    def insert(self, val):
+        with self._write_lock:
+            self._publish(_insert(self._root, val))
+            self.notify("insert", self.search(val), extra={"version": self.version})
+
+    def delete(self, val):
+        with self._write_lock:
+            new_root, ok = _delete(self._root, val)
+            if ok:
+                self._publish(new_root)
+                self.notify("delete", None, extra={"version": self.version, "val": val})
+            return ok
+
+    def clear(self):
+        with self._write_lock:
+            self._publish(None)
+            self.notify("build", None, extra={"version": self.version})
+
+    # ---------- 读（无锁） ----------
+    def search(self, val, root=None):
+        cur = self._root if root is None else root
+        while cur:
+            if val == cur.val:
+                return cur
+            cur = cur.left if val < cur.val else cur.right
+        return None
+
+    def __contains__(self, val):
+        return self.search(val) is not None
+
+    def lower_bound(self, val, root=None):
+        cur = self._root if root is None else root
+        res = None
+        while cur:
+            if cur.val >= val:
+                res = cur
+                cur = cur.left
+            else:
+                cur = cur.right
+        return res
+
+    def inorder(self, root=None):
+        res = []
+        stack = []
+        cur = self._root if root is None else root
+        while stack or cur:
+            while cur:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            res.extend([cur.val] * cur.freq)
+            cur = cur.right
+        return res
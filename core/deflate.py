@@ -0,0 +1,476 @@
+# core/deflate.py
+# LZ77 + Huffman 两级压缩（DEFLATE 风格）
+# - 第一级：滑动窗口 + 哈希链匹配，把字节流变成 字面量 / (长度, 距离) 记号流
+# - 第二级：字面量/长度 与 距离 两路符号分别交给 HuffmanTree 建码，按规范哈夫曼码写出
+# 码表结构沿用 DEFLATE 的长度码/距离码定义，但容器格式是本项目自定义的（不兼容 zlib）
+from bisect import bisect_right
+
+from core.huffman_tree import HuffmanTree
+
+MAGIC = b"DSZ1"
+
+WINDOW_SIZE = 1 << 15  # 滑动窗口 32KB
+WINDOW_MASK = WINDOW_SIZE - 1
+MIN_MATCH = 3
+MAX_MATCH = 258
+BLOCK_TOKENS = 1 << 15  # 每个块最多的记号数（保证码长 < 32，可用 5 位存储）
+
+END_OF_BLOCK = 256
+CODE_LEN_BITS = 5
+
+# 长度码 257..285：基础长度与附加位数
+LENGTH_BASE = [3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31,
+               35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258]
+LENGTH_EXTRA = [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2,
+                3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0]
+# 距离码 0..29：基础距离与附加位数
+DIST_BASE = [1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193,
+             257, 385, 513, 769, 1025, 1537, 2049, 3073, 4097, 6145,
+             8193, 12289, 16385, 24577]
+DIST_EXTRA = [0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6,
+              7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13, 13]
+
+# 长度 -> 长度码下标（预计算，避免每个匹配都做二分）
+_LENGTH_INDEX = [0] * (MAX_MATCH + 1)
+for _i in range(len(LENGTH_BASE)):
+    _hi = LENGTH_BASE[_i + 1] if _i + 1 < len(LENGTH_BASE) else MAX_MATCH + 1
+    for _l in range(LENGTH_BASE[_i], _hi):
+        _LENGTH_INDEX[_l] = _i
+_LENGTH_INDEX[MAX_MATCH] = len(LENGTH_BASE) - 1
+
+# 压缩级别：(哈希链最大长度, 足够好的匹配长度, 是否惰性匹配)
+# 级别 0 不做 LZ77 匹配，等价于纯 Huffman 路径，用于对照
+LEVELS = {
+    0: (0, 0, False),
+    1: (4, 8, False),
+    2: (8, 16, False),
+    3: (16, 32, False),
+    4: (16, 32, True),
+    5: (32, 64, True),
+    6: (128, 128, True),
+    7: (256, 258, True),
+    8: (1024, 258, True),
+    9: (4096, 258, True),
+}
+DEFAULT_LEVEL = 6
+
+
+# ==============================
+# 位读写
+# ==============================
+class BitWriter:
+    """高位在前的位写入器"""
+    def __init__(self):
+        self.out = bytearray()
+        self._acc = 0
+        self._nbits = 0
+
+    def write(self, value, nbits):
+        self._acc = (self._acc << nbits) | value
+        self._nbits += nbits
+        while self._nbits >= 8:
+            self._nbits -= 8
+            self.out.append((self._acc >> self._nbits) & 0xFF)
+        self._acc &= (1 << self._nbits) - 1
+
+    def align(self):
+        """补零到字节边界"""
+        if self._nbits:
+            self.write(0, 8 - self._nbits)
+
+    def take(self):
+        """取出已写满的字节"""
+        data = bytes(self.out)
+        self.out.clear()
+        return data
+
+
+class BitReader:
+    """高位在前的位读取器"""
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos  # 字节位置
+        self._acc = 0
+        self._nbits = 0
+
+    def read(self, nbits):
+        while self._nbits < nbits:
+            if self.pos >= len(self.data):
+                raise ValueError("压缩数据意外结束")
+            self._acc = (self._acc << 8) | self.data[self.pos]
+            self.pos += 1
+            self._nbits += 8
+        self._nbits -= nbits
+        value = (self._acc >> self._nbits) & ((1 << nbits) - 1)
+        self._acc &= (1 << self._nbits) - 1
+        return value
+
+    def read_bit(self):
+        return self.read(1)
+
+
+# ==============================
+# 规范哈夫曼码
+# ==============================
+def huffman_code_lengths(symbols, alphabet_size):
+    """
+    用 HuffmanTree 对符号流建树，返回长度为 alphabet_size 的码长列表
+    未出现的符号码长为 0；只有一个符号时码长记为 1
+    """
+    lengths = [0] * alphabet_size
+    if not symbols:
+        return lengths
+    tree = HuffmanTree()
+    tree.build(symbols)
+    for sym, code in tree.code_map.items():
+        lengths[sym] = max(len(code), 1)
+    return lengths
+
+
+def canonical_codes(lengths):
+    """由码长生成规范哈夫曼码：返回 {符号: (码值, 码长)}"""
+    max_len = max(lengths) if lengths else 0
+    bl_count = [0] * (max_len + 1)
+    for l in lengths:
+        if l:
+            bl_count[l] += 1
+    next_code = [0] * (max_len + 2)
+    code = 0
+    for bits in range(1, max_len + 1):
+        code = (code + bl_count[bits - 1]) << 1
+        next_code[bits] = code
+    codes = {}
+    for sym, l in enumerate(lengths):
+        if l:
+            codes[sym] = (next_code[l], l)
+            next_code[l] += 1
+    return codes
+
+
+class CanonicalDecoder:
+    """按码长逐位解码规范哈夫曼码"""
+    def __init__(self, lengths):
+        self.max_len = max(lengths) if lengths else 0
+        self.count = [0] * (self.max_len + 1)
+        for l in lengths:
+            if l:
+                self.count[l] += 1
+        # 同码长内按符号升序排列（与 canonical_codes 一致）
+        self.symbols = [s for l in range(1, self.max_len + 1)
+                        for s, sl in enumerate(lengths) if sl == l]
+
+    def decode(self, reader):
+        code = 0
+        first = 0
+        index = 0
+        for l in range(1, self.max_len + 1):
+            code |= reader.read_bit()
+            cnt = self.count[l]
+            if code - first < cnt:
+                return self.symbols[index + code - first]
+            index += cnt
+            first = (first + cnt) << 1
+            code <<= 1
+        raise ValueError("无效的哈夫曼码")
+
+
+# ==============================
+# LZ77 匹配器
+# ==============================
+class LZ77Matcher:
+    """
+    哈希链 LZ77 匹配器（支持流式输入）
+    - head：三字节前缀 -> 最近出现的绝对位置
+    - prev：绝对位置 & WINDOW_MASK -> 同前缀的上一个位置（构成哈希链）
+    - 只保留最近 WINDOW_SIZE 字节用于回溯匹配
+    """
+    def __init__(self, level=DEFAULT_LEVEL):
+        if level not in LEVELS:
+            raise ValueError(f"压缩级别仅支持 {min(LEVELS)}~{max(LEVELS)}")
+        self.level = level
+        self.max_chain, self.nice_length, self.lazy = LEVELS[level]
+        self.buf = bytearray()
+        self.base = 0  # buf[0] 对应的绝对位置
+        self.pos = 0   # 下一个待处理的绝对位置
+        self.head = {}
+        self.prev = [-1] * WINDOW_SIZE
+
+    def _insert(self, p):
+        """把绝对位置 p 的三字节前缀加入哈希链"""
+        i = p - self.base
+        buf = self.buf
+        key = (buf[i] << 16) | (buf[i + 1] << 8) | buf[i + 2]
+        self.prev[p & WINDOW_MASK] = self.head.get(key, -1)
+        self.head[key] = p
+
+    def _longest_match(self, p, limit):
+        """在哈希链上查找 p 处的最长匹配，返回 (长度, 距离)"""
+        buf = self.buf
+        base = self.base
+        i = p - base
+        key = (buf[i] << 16) | (buf[i + 1] << 8) | buf[i + 2]
+        cand = self.head.get(key, -1)
+        best_len = MIN_MATCH - 1
+        best_dist = 0
+        chain = self.max_chain
+        while cand >= 0 and chain > 0:
+            dist = p - cand
+            if dist <= 0 or dist > WINDOW_SIZE or cand < base:
+                break
+            ci = cand - base
+            # 先比较当前最优长度处的字节，快速淘汰
+            if buf[ci + best_len] == buf[i + best_len] and buf[ci] == buf[i]:
+                l = 0
+                while l + 8 <= limit and buf[ci + l:ci + l + 8] == buf[i + l:i + l + 8]:
+                    l += 8
+                while l < limit and buf[ci + l] == buf[i + l]:
+                    l += 1
+                if l > best_len:
+                    best_len = l
+                    best_dist = dist
+                    if l >= self.nice_length or l >= limit:
+                        break
+            nxt = self.prev[cand & WINDOW_MASK]
+            if nxt >= cand:
+                break
+            cand = nxt
+            chain -= 1
+        if best_len >= MIN_MATCH:
+            return best_len, best_dist
+        return 0, 0
+
+    def feed(self, data, final=False):
+        """
+        追加输入并产出记号：int 为字面量，(长度, 距离) 为匹配
+        非 final 时保留 MAX_MATCH 字节的前瞻，等待后续输入
+        """
+        self.buf += data
+        end = self.base + len(self.buf)
+        stop = end if final else end - MAX_MATCH
+        tokens = []
+        buf = self.buf
+        p = self.pos
+        use_match = self.max_chain > 0
+        while p < stop:
+            i = p - self.base
+            avail = end - p
+            if not use_match or avail < MIN_MATCH:
+                tokens.append(buf[i])
+                p += 1
+                continue
+            limit = min(MAX_MATCH, avail)
+            length, dist = self._longest_match(p, limit)
+            if length and self.lazy and length < self.nice_length and avail > MIN_MATCH:
+                # 惰性匹配：下一个位置若能匹配更长，则当前只输出字面量
+                self._insert(p)
+                nlen, ndist = self._longest_match(p + 1, min(MAX_MATCH, avail - 1))
+                if nlen > length:
+                    tokens.append(buf[i])
+                    p += 1
+                    length, dist = nlen, ndist
+                    i += 1
+                    avail -= 1
+                else:
+                    # p 已经入链，从 p+1 开始补齐
+                    tokens.append((length, dist))
+                    last = min(p + length, end - MIN_MATCH + 1)
+                    for q in range(p + 1, last):
+                        self._insert(q)
+                    p += length
+                    continue
+            if length:
+                tokens.append((length, dist))
+                last = min(p + length, end - MIN_MATCH + 1)
+                for q in range(p, last):
+                    self._insert(q)
+                p += length
+            else:
+                self._insert(p)
+                tokens.append(buf[i])
+                p += 1
+        self.pos = p
+        # 丢弃窗口之外的历史字节，保持缓冲区有界
+        keep_from = self.pos - WINDOW_SIZE
+        if keep_from - self.base > WINDOW_SIZE:
+            del self.buf[:keep_from - self.base]
+            self.base = keep_from
+        return tokens
+
+
+# ==============================
+# 压缩 / 解压
+# ==============================
+def _write_lengths(writer, lengths):
+    """写码长表：非零码长直接写 5 位；0 后接 8 位的额外连续 0 个数"""
+    i = 0
+    n = len(lengths)
+    while i < n:
+        l = lengths[i]
+        writer.write(l, CODE_LEN_BITS)
+        i += 1
+        if l == 0:
+            run = 0
+            while i < n and lengths[i] == 0 and run < 255:
+                run += 1
+                i += 1
+            writer.write(run, 8)
+
+
+def _read_lengths(reader, count, alphabet_size):
+    lengths = []
+    while len(lengths) < count:
+        l = reader.read(CODE_LEN_BITS)
+        lengths.append(l)
+        if l == 0:
+            lengths += [0] * reader.read(8)
+    if len(lengths) != count:
+        raise ValueError("码长表损坏")
+    return lengths + [0] * (alphabet_size - count)
+
+
+def _encode_block(writer, tokens, final):
+    """把一个块的记号流写成：块头 + 码长表 + 哈夫曼编码数据"""
+    litlen_syms = []
+    dist_syms = []
+    encoded = []  # (字面量/长度符号, 长度附加, 距离符号, 距离附加)
+    for tok in tokens:
+        if isinstance(tok, int):
+            litlen_syms.append(tok)
+            encoded.append((tok, None, None, None))
+        else:
+            length, dist = tok
+            li = _LENGTH_INDEX[length]
+            di = bisect_right(DIST_BASE, dist) - 1
+            litlen_syms.append(257 + li)
+            dist_syms.append(di)
+            encoded.append((257 + li, length - LENGTH_BASE[li], di, dist - DIST_BASE[di]))
+    litlen_syms.append(END_OF_BLOCK)
+
+    lit_lengths = huffman_code_lengths(litlen_syms, 286)
+    dist_lengths = huffman_code_lengths(dist_syms, 30)
+    if max(lit_lengths) >= (1 << CODE_LEN_BITS) or max(dist_lengths) >= (1 << CODE_LEN_BITS):
+        raise ValueError("哈夫曼码长超出块格式上限")
+
+    hlit = max(i for i, l in enumerate(lit_lengths) if l) + 1
+    used_dist = [i for i, l in enumerate(dist_lengths) if l]
+    hdist = used_dist[-1] + 1 if used_dist else 0
+
+    writer.write(1 if final else 0, 1)
+    writer.write(hlit, 9)
+    _write_lengths(writer, lit_lengths[:hlit])
+    writer.write(hdist, 5)
+    _write_lengths(writer, dist_lengths[:hdist])
+
+    lit_codes = canonical_codes(lit_lengths)
+    dist_codes = canonical_codes(dist_lengths)
+    for sym, lextra, dsym, dextra in encoded:
+        code, nbits = lit_codes[sym]
+        writer.write(code, nbits)
+        if lextra is not None:
+            eb = LENGTH_EXTRA[sym - 257]
+            if eb:
+                writer.write(lextra, eb)
+            code, nbits = dist_codes[dsym]
+            writer.write(code, nbits)
+            eb = DIST_EXTRA[dsym]
+            if eb:
+                writer.write(dextra, eb)
+    code, nbits = lit_codes[END_OF_BLOCK]
+    writer.write(code, nbits)
+
+
+class DeflateCompressor:
+    """
+    流式压缩器（用法与 zlib.compressobj 类似）
+        c = DeflateCompressor(level=6)
+        out = c.compress(chunk1) + c.compress(chunk2) + c.flush()
+    level: 0 仅 Huffman；1~9 级别越高哈希链越长、压缩率越高、速度越慢
+    """
+    def __init__(self, level=DEFAULT_LEVEL):
+        self.matcher = LZ77Matcher(level)
+        self.writer = BitWriter()
+        self.writer.out += MAGIC
+        self.pending = []
+        self.finished = False
+
+    def compress(self, data):
+        if self.finished:
+            raise RuntimeError("压缩器已结束")
+        self.pending += self.matcher.feed(data)
+        while len(self.pending) >= BLOCK_TOKENS:
+            _encode_block(self.writer, self.pending[:BLOCK_TOKENS], final=False)
+            del self.pending[:BLOCK_TOKENS]
+        return self.writer.take()
+
+    def flush(self):
+        """处理剩余输入并写出最后一个块"""
+        if self.finished:
+            return b""
+        self.pending += self.matcher.feed(b"", final=True)
+        while len(self.pending) > BLOCK_TOKENS:
+            _encode_block(self.writer, self.pending[:BLOCK_TOKENS], final=False)
+            del self.pending[:BLOCK_TOKENS]
+        _encode_block(self.writer, self.pending, final=True)
+        self.pending = []
+        self.writer.align()
+        self.finished = True
+        return self.writer.take()
+
+
+def compress(data, level=DEFAULT_LEVEL):
+    """一次性压缩 bytes"""
+    c = DeflateCompressor(level)
+    return c.compress(bytes(data)) + c.flush()
+
+
+def compress_stream(chunks, level=DEFAULT_LEVEL):
+    """流式压缩：逐块读取可迭代输入，逐块产出压缩数据"""
+    c = DeflateCompressor(level)
+    for chunk in chunks:
+        out = c.compress(chunk)
+        if out:
+            yield out
+    yield c.flush()
+
+
+def decompress(blob):
+    """解压 compress / DeflateCompressor 产出的数据"""
+    if bytes(blob[:len(MAGIC)]) != MAGIC:
+        raise ValueError("不是有效的 DSZ 压缩数据")
+    reader = BitReader(blob, len(MAGIC))
+    out = bytearray()
+    final = False
+    while not final:
+        final = reader.read(1) == 1
+        hlit = reader.read(9)
+        lit_lengths = _read_lengths(reader, hlit, 286)
+        hdist = reader.read(5)
+        dist_lengths = _read_lengths(reader, hdist, 30)
+        lit_dec = CanonicalDecoder(lit_lengths)
+        dist_dec = CanonicalDecoder(dist_lengths) if hdist else None
+        while True:
+            sym = lit_dec.decode(reader)
+            if sym < 256:
+                out.append(sym)
+                continue
+            if sym == END_OF_BLOCK:
+                break
+            li = sym - 257
+            length = LENGTH_BASE[li] + (reader.read(LENGTH_EXTRA[li]) if LENGTH_EXTRA[li] else 0)
+            if dist_dec is None:
+                raise ValueError("压缩数据缺少距离码表")
+            di = dist_dec.decode(reader)
+            dist = DIST_BASE[di] + (reader.read(DIST_EXTRA[di]) if DIST_EXTRA[di] else 0)
+            start = len(out) - dist
+            if start < 0:
+                raise ValueError("匹配距离超出已解压数据")
+            if dist >= length:
+                out += out[start:start + length]
+            else:
+                # 重叠复制：按距离为周期逐段展开
+                while length > 0:
+                    n = min(dist, length)
+                    out += out[start:start + n]
+                    start += n
+                    length -= n
+    return bytes(out)
@@ -0,0 +1,108 @@
+# core/frozen_index.py
+# 只读冻结索引：把树的 (值, 频率) 按 Eytzinger（BFS 层序）布局存进 NumPy 数组
+# 第 k 个槽位的孩子在 2k / 2k+1，查找路径上的前几层总在同一批缓存行里；
+# 所有查询都接受整批键，一次调用里所有键同步下降 ⌊log2 n⌋+1 层，没有逐键的 Python 指针追踪
+# 由 AVLTree.freeze() / BSTree.freeze() 生成，之后对原树的修改不会反映到索引中
+import numpy as np
+
+
+def _sorted_pairs(node):
+    """迭代中序遍历（退化的 BST 也不会递归溢出），返回 [(值, 频率)]"""
+    pairs = []
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        pairs.append((node.val, node.freq))
+        node = node.right
+    return pairs
+
+
+def _eytzinger_order(n):
+    """order[k] = 槽位 k（1-based）对应的有序下标；按隐式完全二叉树的中序依次编号"""
+    order = np.empty(n + 1, dtype=np.int64)
+    order[0] = n
+    k = 1
+    while k <= n:
+        k <<= 1
+    for i in range(n):
+        # 去掉末尾的连续 1 和一个 0：回到中序的下一个祖先
+        k >>= ((~k) & (k + 1)).bit_length()
+        order[k] = i
+        # 进入右子树并一路向左
+        k = 2 * k + 1
+        while k <= n:
+            k <<= 1
+    return order
+
+
+class FrozenIndex:
+    def __init__(self, pairs):
+        """pairs：按值严格递增的 (值, 频率) 序列"""
+        n = len(pairs)
+        self.n = n
+        self.depth = n.bit_length()  # 下降层数
+        sorted_keys = np.array([v for v, _ in pairs])
+        freqs = np.array([f for _, f in pairs], dtype=np.int64)
+
+        order = _eytzinger_order(n)
+        # 槽位 0 不用；索引数组在 n 处越界的位置会被掩码，填什么都行
+        self.keys = np.empty(n + 1, dtype=sorted_keys.dtype if n else np.int64)
+        self.freqs = np.zeros(n + 1, dtype=np.int64)
+        if n:
+            self.keys[1:] = sorted_keys[order[1:]]
+            self.keys[0] = sorted_keys[0]
+            self.freqs[1:] = freqs[order[1:]]
+        # 槽位 -> 有序下标（槽位 0 表示“不存在”，对应下标 n）
+        self.order = order
+        self.sorted_keys = sorted_keys
+        # cum[i] = 有序下标 i 之前的元素个数（按频率计），cum[n] = 总数
+        self.cum = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(freqs, out=self.cum[1:])
+
+    @classmethod
+    def from_tree(cls, root):
+        return cls(_sorted_pairs(root))
+
+    def __len__(self):
+        return int(self.cum[-1])
+
+    def _lower_slots(self, q):
+        """每个查询键首个 >= 它的槽位，0 表示全部小于它"""
+        n = self.n
+        k = np.ones(q.shape, dtype=np.int64)
+        if n == 0:
+            return k * 0
+        keys = self.keys
+        for _ in range(self.depth):
+            live = k <= n
+            step = keys[np.minimum(k, n)] < q
+            k = np.where(live, 2 * k + step, k)
+        # 末尾连续的 1 是“向右”的步数，再去掉一个 0 就回到最后一次向左的节点
+        return k // (2 * ((k + 1) & ~k))
+
+    def lower_bound(self, keys):
+        """首个 >= 键的元素的有序下标（无则为 n），用 sorted_keys[下标] 取值"""
+        q = np.asarray(keys)
+        return self.order[self._lower_slots(q.ravel())].reshape(q.shape)
+
+    def search(self, keys):
+        """每个键的频率（不存在为 0）"""
+        q = np.asarray(keys)
+        flat = q.ravel()
+        slots = self._lower_slots(flat)
+        hit = (slots > 0) & (self.keys[slots] == flat)
+        return np.where(hit, self.freqs[slots], 0).reshape(q.shape)
+
+    def contains(self, keys):
+        return self.search(keys) > 0
+
+    def rank(self, keys):
+        """严格小于键的元素个数（按频率计）"""
+        return self.cum[self.lower_bound(keys)]
+
+    def count_range(self, lo, hi):
+        """lo <= 值 < hi 的元素个数（按频率计），lo/hi 可以是等长数组"""
+        return np.maximum(self.rank(hi) - self.rank(lo), 0)
@@ -0,0 +1,153 @@
+# core/gap_buffer.py
+# 间隙缓冲区：元素存放在 array('q') 中（每个 8 字节，没有 Python int 对象开销），
+# 中间留一段空闲的“间隙”，间隙始终停在上一次编辑的位置
+# 在同一位置附近连续插入/删除只需移动间隙两侧的少量元素，局部编辑均摊 O(1)；
+# 随机位置编辑的代价是移动间隙的距离，与 list.insert 相当
+# 接口与 Python list 中 SequenceList 用到的部分一致：insert / pop / index / in / len / 下标 / 迭代，另有 cut 原地切出一段
+from array import array
+
+MIN_GAP = 16
+
+
+class GapBuffer:
+    def __init__(self, items=(), typecode="q"):
+        buf = array(typecode, items)
+        n = len(buf)
+        gap = max(MIN_GAP, n // 4)
+        buf.extend(array(typecode, bytes(gap * buf.itemsize)))
+        self._buf = buf
+        self._gs = n          # 间隙起点（含）
+        self._ge = n + gap    # 间隙终点（不含）
+
+    def __len__(self):
+        return len(self._buf) - (self._ge - self._gs)
+
+    def _index(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("索引越界")
+        return i
+
+    def _move_gap(self, pos):
+        """把间隙移动到逻辑位置 pos（只搬动间隙与 pos 之间的元素）"""
+        gs, ge, buf = self._gs, self._ge, self._buf
+        if pos < gs:
+            k = gs - pos
+            buf[ge - k:ge] = buf[pos:gs]
+        elif pos > gs:
+            k = pos - gs
+            buf[gs:pos] = buf[ge:ge + k]
+        else:
+            return
+        self._gs = pos
+        self._ge = ge + (pos - gs)
+
+    def _grow(self):
+        """间隙用完时按当前长度翻倍扩容"""
+        buf = self._buf
+        extra = max(MIN_GAP, len(self))
+        filler = array(buf.typecode, bytes(extra * buf.itemsize))
+        self._buf = buf[:self._gs] + filler + buf[self._ge:]
+        self._ge += extra
+
+    def insert(self, index, value):
+        n = len(self)
+        if index < 0:
+            index = max(0, index + n)
+        index = min(index, n)
+        self._move_gap(index)
+        if self._gs == self._ge:
+            self._grow()
+        self._buf[self._gs] = value
+        self._gs += 1
+
+    def append(self, value):
+        self.insert(len(self), value)
+
+    def extend(self, values):
+        """批量追加：先把间隙移到末尾，整段写入（空间不足时一次扩容到位）"""
+        vals = array(self._buf.typecode, values)
+        k = len(vals)
+        self._move_gap(len(self))
+        if self._ge - self._gs < k:
+            buf = self._buf
+            extra = max(MIN_GAP, len(self), k)
+            buf[self._gs:] = array(buf.typecode, bytes(extra * buf.itemsize))
+            self._ge = len(buf)
+        self._buf[self._gs:self._gs + k] = vals
+        self._gs += k
+
+    def pop(self, index=-1):
+        index = self._index(index)
+        self._move_gap(index)
+        value = self._buf[self._ge]
+        self._ge += 1
+        return value
+
+    def cut(self, start, stop):
+        """移除 [start, stop) 并作为新的 GapBuffer 返回：间隙移到 start 后把这一段并入间隙，不重建缓冲区"""
+        k = max(0, stop - start)
+        self._move_gap(start)
+        part = GapBuffer(self._buf[self._ge:self._ge + k], self._buf.typecode)
+        self._ge += k
+        return part
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.tolist()[i]
+        i = self._index(i)
+        return self._buf[i if i < self._gs else i + (self._ge - self._gs)]
+
+    def __setitem__(self, i, value):
+        i = self._index(i)
+        self._buf[i if i < self._gs else i + (self._ge - self._gs)] = value
+
+    def __iter__(self):
+        buf, gs, ge = self._buf, self._gs, self._ge
+        for i in range(gs):
+            yield buf[i]
+        for i in range(ge, len(buf)):
+            yield buf[i]
+
+    def index(self, value):
+        buf, gs, ge = self._buf, self._gs, self._ge
+        try:
+            return buf.index(value, 0, gs)
+        except ValueError:
+            pass
+        try:
+            return buf.index(value, ge) - (ge - gs)
+        except ValueError:
+            raise ValueError(f"{value} 不在顺序表中") from None
+
+    def __contains__(self, value):
+        try:
+            self.index(value)
+        except (ValueError, TypeError, OverflowError):
+            return False
+        return True
+
+    def tolist(self):
+        return self._buf[:self._gs].tolist() + self._buf[self._ge:].tolist()
+
+    def __eq__(self, other):
+        if isinstance(other, GapBuffer):
+            other = other.tolist()
+        return self.tolist() == other
+
+    def __repr__(self):
+        return f"GapBuffer({self.tolist()})"
+
+    def memoryview(self):
+        """
+        零拷贝导出：把间隙移到末尾后返回连续内容的 memoryview（缓冲区协议，可直接交给 NumPy 等）
+        持有该视图期间底层数组不能扩容，继续插入前需先 release()
+        """
+        self._move_gap(len(self))
+        return memoryview(self._buf)[:self._gs]
+
+    def nbytes(self):
+        """底层数组占用的字节数（含间隙）"""
+        return len(self._buf) * self._buf.itemsize
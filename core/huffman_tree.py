@@ -18,6 +18,7 @@ class HuffmanTree:
     def __init__(self):
         self.root = None
         self.code_map = {}  # 字符到编码的映射
+        self.freq_map = {}  # 字符到频率的映射（stats 使用）
         self.listeners = []
         
     def add_listener(self, func):
@@ -29,6 +30,8 @@ class HuffmanTree:
     
     def build(self, text):
         """从文本构建哈夫曼树"""
+        self.code_map = {}
+        self.freq_map = {}
         if not text:
             self.root = None
             self.notify("build", None, extra=None)
@@ -38,6 +41,7 @@ class HuffmanTree:
         freq_dict = defaultdict(int)
         for char in text:
             freq_dict[char] += 1
+        self.freq_map = dict(freq_dict)
             
         # 构建最小堆
         heap = [HuffmanNode(char, freq) for char, freq in freq_dict.items()]
@@ -60,6 +64,60 @@ class HuffmanTree:
         self._generate_codes(self.root, "")
         self.notify("build", self.root, extra={"steps": steps, "code_map": self.code_map})
         
+    def stats(self):
+        """
+        编码统计报告（基于频率数组与码长数组向量化计算，不遍历树）
+        返回 dict：
+        - symbols: 不同字符数；total: 字符总数
+        - entropy: 香农熵（bit/字符）
+        - avg_code_length: 平均码长（bit/字符）
+        - efficiency: 编码效率 = entropy / avg_code_length
+        - length_histogram: {码长: 该码长的字符数}
+        - max_depth: 最大码长（即树深度）
+        - expected_bits / expected_bytes: 按当前码表编码后的大小（不含码表）
+        - raw_bits: 按 8 bit/字符 计的原始大小；compression_ratio = expected_bits / raw_bits
+        """
+        import numpy as np
+
+        if not self.code_map:
+            return {
+                "symbols": 0, "total": 0, "entropy": 0.0, "avg_code_length": 0.0,
+                "efficiency": 1.0, "length_histogram": {}, "max_depth": 0,
+                "expected_bits": 0, "expected_bytes": 0, "raw_bits": 0,
+                "compression_ratio": 1.0,
+            }
+
+        symbols = list(self.code_map)
+        freqs = np.fromiter((self.freq_map.get(c, 0) for c in symbols),
+                            dtype=np.float64, count=len(symbols))
+        # 只有一个字符时码为空串，实际编码仍需 1 bit
+        lengths = np.fromiter((len(self.code_map[c]) for c in symbols),
+                              dtype=np.int64, count=len(symbols))
+        lengths = np.maximum(lengths, 1)
+
+        total = freqs.sum()
+        p = freqs / total
+        nz = p > 0
+        entropy = float(-(p[nz] * np.log2(p[nz])).sum())
+        avg_len = float((p * lengths).sum())
+        expected_bits = int((freqs * lengths).sum())
+        raw_bits = int(total) * 8
+        hist_len, hist_cnt = np.unique(lengths, return_counts=True)
+
+        return {
+            "symbols": len(symbols),
+            "total": int(total),
+            "entropy": entropy,
+            "avg_code_length": avg_len,
+            "efficiency": entropy / avg_len if avg_len else 1.0,
+            "length_histogram": {int(l): int(c) for l, c in zip(hist_len, hist_cnt)},
+            "max_depth": int(lengths.max()),
+            "expected_bits": expected_bits,
+            "expected_bytes": (expected_bits + 7) // 8,
+            "raw_bits": raw_bits,
+            "compression_ratio": expected_bits / raw_bits if raw_bits else 1.0,
+        }
+
     def _generate_codes(self, node, current_code):
         """递归生成哈夫曼编码"""
         if node is None:
@@ -121,11 +179,25 @@ class HuffmanTree:
         self.root = build(data["root"])
         self.code_map.clear()
         self._generate_codes(self.root, "")
+
+        # 从叶子恢复频率表
+        self.freq_map = {}
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if node.char is not None:
+                self.freq_map[node.char] = node.freq
+                continue
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+
         self.notify(
             "build",
             self.root,
             extra={
-                "steps": steps,
+                "steps": [],
                 "code_map": self.code_map
             }
         )
@@ -0,0 +1,207 @@
+# core/implicit_treap.py
+# 隐式键 Treap：节点不存键，中序位置就是下标；每个节点记录子树大小，按大小下降即可定位第 k 个元素
+# 随机优先级使树高期望 O(log n)，因此按下标 insert / pop / 读写、切出一段 (cut)、拼接 (concat) 都是期望 O(log n)
+# 接口与 Python list 中 SequenceList 用到的部分一致，可作为 SequenceList(backend="treap") 的存储
+import random
+
+_rand = random.random
+
+
+class TreapNode:
+    __slots__ = ("val", "prio", "size", "left", "right")
+
+    def __init__(self, val):
+        self.val = val
+        self.prio = _rand()
+        self.size = 1
+        self.left = None
+        self.right = None
+
+
+def _pull(t):
+    t.size = 1 + (t.left.size if t.left else 0) + (t.right.size if t.right else 0)
+
+
+def _split(t, k):
+    """拆成 (前 k 个元素, 其余元素) 两棵树"""
+    if t is None:
+        return None, None
+    ls = t.left.size if t.left else 0
+    if k <= ls:
+        left, t.left = _split(t.left, k)
+        _pull(t)
+        return left, t
+    t.right, right = _split(t.right, k - ls - 1)
+    _pull(t)
+    return t, right
+
+
+def _merge(a, b):
+    """a 的所有元素在 b 之前；优先级大的做根"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _pull(a)
+        return a
+    b.left = _merge(a, b.left)
+    _pull(b)
+    return b
+
+
+def _build(items):
+    """按顺序 O(n) 建树：单调栈构造笛卡尔树，再后序回填子树大小"""
+    stack = []
+    for v in items:
+        node = TreapNode(v)
+        last = None
+        while stack and stack[-1].prio < node.prio:
+            last = stack.pop()
+        node.left = last
+        if stack:
+            stack[-1].right = node
+        stack.append(node)
+    if not stack:
+        return None
+    root = stack[0]
+    order = [root]
+    for t in order:
+        if t.left:
+            order.append(t.left)
+        if t.right:
+            order.append(t.right)
+    for t in reversed(order):
+        _pull(t)
+    return root
+
+
+class ImplicitTreap:
+    def __init__(self, items=()):
+        self.root = _build(items)
+
+    @classmethod
+    def _wrap(cls, root):
+        seq = cls()
+        seq.root = root
+        return seq
+
+    def __len__(self):
+        return self.root.size if self.root else 0
+
+    def _index(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("索引越界")
+        return i
+
+    def _node_at(self, i):
+        t = self.root
+        while True:
+            ls = t.left.size if t.left else 0
+            if i < ls:
+                t = t.left
+            elif i == ls:
+                return t
+            else:
+                i -= ls + 1
+                t = t.right
+
+    # ---------- 按下标读写 ----------
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return self.tolist()[i]
+            return self.slice(start, stop)
+        return self._node_at(self._index(i)).val
+
+    def __setitem__(self, i, value):
+        self._node_at(self._index(i)).val = value
+
+    def insert(self, index, value):
+        n = len(self)
+        if index < 0:
+            index = max(0, index + n)
+        index = min(index, n)
+        left, right = _split(self.root, index)
+        self.root = _merge(_merge(left, TreapNode(value)), right)
+
+    def append(self, value):
+        self.root = _merge(self.root, TreapNode(value))
+
+    def extend(self, values):
+        """批量追加：O(k) 建出新树再与原树合并"""
+        self.root = _merge(self.root, _build(values))
+
+    def pop(self, index=-1):
+        index = self._index(index)
+        left, rest = _split(self.root, index)
+        mid, right = _split(rest, 1)
+        self.root = _merge(left, right)
+        return mid.val
+
+    # ---------- 区间操作 ----------
+    def slice(self, start, stop):
+        """[start, stop) 的值列表：拆出中间一段遍历后再拼回，O(log n + k)"""
+        left, rest = _split(self.root, start)
+        mid, right = _split(rest, max(0, stop - start))
+        out = list(ImplicitTreap._wrap(mid))
+        self.root = _merge(_merge(left, mid), right)
+        return out
+
+    def cut(self, start, stop):
+        """移除 [start, stop) 并作为新的 ImplicitTreap 返回，O(log n)"""
+        left, rest = _split(self.root, start)
+        mid, right = _split(rest, max(0, stop - start))
+        self.root = _merge(left, right)
+        return ImplicitTreap._wrap(mid)
+
+    def concat(self, other):
+        """把 other 的节点整体接到末尾（other 被清空），O(log n)"""
+        self.root = _merge(self.root, other.root)
+        other.root = None
+        return self
+
+    # ---------- 遍历 / 查找 ----------
+    def __iter__(self):
+        stack = []
+        t = self.root
+        while stack or t:
+            while t:
+                stack.append(t)
+                t = t.left
+            t = stack.pop()
+            yield t.val
+            t = t.right
+
+    def index(self, value):
+        for i, v in enumerate(self):
+            if v == value:
+                return i
+        raise ValueError(f"{value} 不在顺序表中")
+
+    def __contains__(self, value):
+        return any(v == value for v in self)
+
+    def tolist(self):
+        return list(self)
+
+    def __eq__(self, other):
+        if isinstance(other, ImplicitTreap):
+            other = other.tolist()
+        return self.tolist() == other
+
+    def __repr__(self):
+        return f"ImplicitTreap({self.tolist()})"
+
+    def height(self):
+        h = 0
+        level = [self.root] if self.root else []
+        while level:
+            h += 1
+            level = [c for t in level for c in (t.left, t.right) if c]
+        return h
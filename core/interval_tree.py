@@ -0,0 +1,139 @@
+# core/interval_tree.py
+# 区间树：以 AVLTree 为基础，键为闭区间 (lo, hi)，按 (lo, hi) 字典序排序（相同区间计频率）
+# 每个节点额外维护 max_end = 子树内所有区间右端点的最大值
+# max_end 在 _update_height 中与高度一起刷新，旋转、插入回溯、删除回溯都会经过它，因此始终正确
+import random
+
+from core.avl_tree import AVLTree, AVLNode
+
+
+class IntervalNode(AVLNode):
+    def __init__(self, val):
+        super().__init__(val)
+        self.max_end = val[1]
+
+
+def _as_interval(val):
+    try:
+        lo, hi = val
+    except (TypeError, ValueError):
+        raise ValueError(f"区间树的键必须是 (lo, hi) 形式的区间，收到 {val!r}") from None
+    if lo > hi:
+        raise ValueError(f"区间左端点不能大于右端点：[{lo}, {hi}]")
+    return (lo, hi)
+
+
+class IntervalAVLTree(AVLTree):
+    def _new_node(self, val):
+        return IntervalNode(val)
+
+    def _update_height(self, node):
+        super()._update_height(node)
+        if node:
+            m = node.val[1]
+            if node.left and node.left.max_end > m:
+                m = node.left.max_end
+            if node.right and node.right.max_end > m:
+                m = node.right.max_end
+            node.max_end = m
+
+    def _refresh_max(self):
+        """整棵树后序刷新 max_end（版本回溯、集合运算会换成普通 AVLNode 重建的树）"""
+        stack = []
+        last = None
+        cur = self.root
+        while stack or cur:
+            while cur:
+                stack.append(cur)
+                cur = cur.left
+            top = stack[-1]
+            if top.right and top.right is not last:
+                cur = top.right
+            else:
+                stack.pop()
+                self._update_height(top)
+                last = top
+
+    def _restore_from_history(self):
+        # 持久化节点没有 max_end，重叠查询无法直接在其上剪枝：区间树跳转版本时仍整棵复制并刷新，O(n)
+        self.root = self.history.materialize()
+        self._refresh_max()
+        self._sync_bloom()
+        self.notify("build", None, extra=[])
+
+    def _replace_root(self, root, label):
+        # 先刷新 max_end 再同步历史并通知视图
+        self._ensure_mutable(keep=False)
+        self.root = root
+        self._refresh_max()
+        super()._replace_root(root, label)
+
+    # ---------- 插入 / 删除：键统一为 (lo, hi) 元组 ----------
+    def insert(self, val, step_callback=None, skip_balance_notify=False):
+        return super().insert(_as_interval(val), step_callback, skip_balance_notify)
+
+    def delete(self, val, step_callback=None):
+        return super().delete(_as_interval(val), step_callback)
+
+    # ---------- 区间查询 ----------
+    def overlap(self, lo, hi, step_callback=None):
+        """
+        与闭区间 [lo, hi] 相交的所有区间节点（按起点有序）
+        中序遍历时剪掉 max_end < lo 的子树，遇到起点 > hi 的节点立即停止，
+        最坏 O((k+1)·log n)；结果按起点连续分布时接近 O(log n + k)
+        """
+        if step_callback:
+            step_callback(f"查找与 [{lo}, {hi}] 重叠的区间")
+        res = []
+        stack = []
+        cur = self.root
+        while stack or cur:
+            while cur and cur.max_end >= lo:
+                stack.append(cur)
+                cur = cur.left
+            if not stack:
+                break
+            cur = stack.pop()
+            if cur.val[0] > hi:
+                break
+            if cur.val[1] >= lo:
+                res.append(cur)
+                if step_callback:
+                    step_callback(f"区间 [{cur.val[0]}, {cur.val[1]}] 与查询重叠")
+            cur = cur.right
+        if step_callback:
+            step_callback(f"共找到 {len(res)} 个重叠区间")
+        self.notify("overlap", None, extra={"range": (lo, hi), "nodes": res})
+        return res
+
+    def stab(self, point, step_callback=None):
+        """包含 point 的所有区间（刺探查询）"""
+        return self.overlap(point, point, step_callback)
+
+    def build_random(self, n=7, value_range=(1, 100), step_callback=None):
+        low, high = value_range
+        if n <= 0:
+            self.clear()
+            if step_callback:
+                step_callback("清空树，生成空区间树")
+            return []
+        span = max((high - low) // 4, 1)
+        values = []
+        for _ in range(n):
+            lo = random.randint(low, high)
+            values.append((lo, min(high, lo + random.randint(0, span))))
+        if step_callback:
+            step_callback(f"随机生成区间序列：{values}")
+
+        self._ensure_mutable(keep=False)
+        self.root = None
+        if self.history is not None:
+            self.history.clear()
+        if self.bloom is not None:
+            self.bloom.clear()
+        for i, v in enumerate(values):
+            self.insert(v, step_callback=step_callback)
+            if step_callback:
+                step_callback(f"插入第 {i+1} 个区间：{v}")
+        self.notify("build", None, extra=values)
+        return values
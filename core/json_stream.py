@@ -0,0 +1,149 @@
+# core/json_stream.py
+# 流式读取保存文件：{"type"/"mode": ..., "data": [大数组]} 这类顶层对象
+# 数组之前的键先读出来放进 header，数组元素则按块读取文件、逐个解码后产出，
+# 调用方直接把迭代器交给 extend / push_many / build，整份数组不会先变成一个 Python 列表再复制一遍
+import json
+import re
+
+_decoder = json.JSONDecoder()
+_SKIP = re.compile(r"[ \t\n\r,]*")  # 数组元素之间的空白与逗号
+_WS = " \t\n\r"
+_NUM_TAIL = "0123456789+-.eE"  # 合法 JSON 中数字后面不可能紧跟这些字符，出现说明数字被块边界截断
+
+
+class JsonArrayReader:
+    """
+    reader = JsonArrayReader(f)       # 读到 "data" 数组开头为止，之前的键在 reader.header 中
+    reader.require("type")            # 需要的键写在数组之后时，先读完数组（暂存）把 header 补全
+    lst.extend(reader)                 # 逐个产出数组元素
+    数组之后的键在迭代结束后补进 header；文件中没有该数组时迭代为空
+    """
+
+    def __init__(self, fp, key: str = "data", chunk_size: int = 1 << 16):
+        self.fp = fp
+        self.key = key
+        self.chunk_size = chunk_size
+        self.header = {}
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._in_array = False
+        self._done = False
+        self._pending = None  # require() 提前读出的数组元素
+        self._expect("{")
+        self._read_members()
+
+    # ---------- 缓冲区 ----------
+    def _fill(self) -> bool:
+        """再读一块；丢弃已消费的前缀。文件结束返回 False"""
+        if self._eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """跳过空白，返回下一个字符（文件结束返回空串）"""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, ch: str) -> None:
+        if self._peek() != ch:
+            raise ValueError(f"JSON 格式错误：位置 {self._pos} 处应为 '{ch}'")
+        self._pos += 1
+
+    def _value(self):
+        """解码下一个完整的 JSON 值；值停在缓冲区末尾或后面紧跟数字字符时（数字被截断）再读一块重试"""
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            if (end == len(self._buf) or self._buf[end] in _NUM_TAIL) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    # ---------- 对象成员 ----------
+    def _read_members(self) -> None:
+        """读取对象成员直到遇到目标数组（进入数组）或对象结束"""
+        while True:
+            ch = self._peek()
+            if ch == "}":
+                self._pos += 1
+                self._done = True
+                return
+            if ch == ",":
+                self._pos += 1
+                continue
+            name = self._value()
+            self._expect(":")
+            if name == self.key and self._peek() == "[":
+                self._pos += 1
+                self._in_array = True
+                return
+            self.header[name] = self._value()
+
+    def require(self, *keys):
+        """
+        保证 keys 都已在 header 中：缺少时说明它们写在数组之后（或根本没有），
+        这时先把数组读完暂存为列表，header 随之补全，随后的迭代从暂存列表产出
+        本程序保存的文件键都在数组之前，不会触发暂存；返回 self
+        """
+        if self._in_array and any(k not in self.header for k in keys):
+            self._pending = list(self._iter_array())
+        return self
+
+    def __iter__(self):
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            return iter(pending)
+        return self._iter_array()
+
+    def _iter_array(self):
+        if not self._in_array:
+            return
+        scan = _decoder.scan_once
+        skip = _SKIP.match
+        buf, pos = self._buf, self._pos
+        while True:
+            pos = skip(buf, pos).end()
+            if pos < len(buf):
+                if buf[pos] == "]":
+                    self._pos = pos + 1
+                    break
+                # 快速路径：值完整落在缓冲区内（后面还有别的字符），直接解码
+                try:
+                    value, end = scan(buf, pos)
+                except (StopIteration, json.JSONDecodeError):
+                    end = len(buf)
+                if end < len(buf) and buf[end] not in _NUM_TAIL:
+                    pos = end
+                    yield value
+                    continue
+            # 慢路径：缓冲区读完或值可能被块边界截断，补读后再解码
+            self._pos = pos
+            ch = self._peek()
+            if ch == "":
+                raise ValueError("JSON 格式错误：数组未结束")
+            if ch in ",]":
+                buf, pos = self._buf, self._pos
+                continue
+            yield self._value()
+            buf, pos = self._buf, self._pos
+        self._in_array = False
+        self._read_members()
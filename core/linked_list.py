@@ -1,5 +1,8 @@
 # core/linked_list.py
-import copy
+# 通知格式与 SequenceList 相同：监听器收到增量 delta（可用 core.sequence_list.apply_delta 应用），
+# 完整数组由 state["snapshot"]() 按需遍历生成
+from core.sequence_list import delta_action
+
 
 class Node:
     def __init__(self, val):
@@ -11,21 +14,36 @@ class LinkedList:
     def __init__(self):
         self.head = None
         self._listeners = []
+        self.pos_index = None  # 可选的位置索引（enable_position_index 后启用）
+
+    def enable_position_index(self):
+        """开启位置索引（游标 + √n 检查点，见 core/position_index.py），insert/delete 定位降为 O(√n)"""
+        from core.position_index import PositionIndex
+
+        self.pos_index = PositionIndex(self)
+        return self.pos_index
 
     def add_listener(self, cb):
         self._listeners.append(cb)
 
-    def _notify(self, action=None):
+    def snapshot(self):
+        """遍历整条链表得到值列表（按需调用，O(n)）"""
         nodes = []
         cur = self.head
         while cur:#遍历
             nodes.append(cur.val)
             cur = cur.next
-        state = {"array": nodes, "action": action}
+        return nodes
+
+    def _notify(self, delta):
+        if not self._listeners:
+            return
+        state = {"delta": delta, "action": delta_action(delta), "snapshot": self.snapshot}
         for cb in self._listeners:
             cb(state)
 
     def build(self, items):
+        items = list(items)
         self.head = None
         tail = None
         for val in items:
@@ -35,13 +53,21 @@ class LinkedList:
             else:
                 tail.next = node
             tail = node#更新尾结点
-        self._notify({"type": "build", "items": items})
+        if self.pos_index is not None:
+            self.pos_index.rebuild()
+        self._notify(("build", items))
 
     def insert(self, index, value):
         new_node = Node(value)
         if index == 0:
             new_node.next = self.head
             self.head = new_node
+        elif self.pos_index is not None:
+            if not 0 < index <= len(self.pos_index):
+                raise IndexError("索引越界")
+            prev = self.pos_index.locate(index - 1)
+            new_node.next = prev.next
+            prev.next = new_node
         else:
             prev = self.head
             for _ in range(index - 1):
@@ -52,7 +78,9 @@ class LinkedList:
                 raise IndexError("索引越界")
             new_node.next = prev.next
             prev.next = new_node
-        self._notify({"type": "insert", "index": index, "value": value})
+        if self.pos_index is not None:
+            self.pos_index.on_insert(index, new_node)
+        self._notify(("insert", index, value))
 
     def delete(self, index):
         if self.head is None:
@@ -60,6 +88,12 @@ class LinkedList:
         if index == 0:
             val = self.head.val
             self.head = self.head.next
+        elif self.pos_index is not None:
+            if not 0 < index < len(self.pos_index):
+                raise IndexError("索引越界")
+            prev = self.pos_index.locate(index - 1)
+            val = prev.next.val
+            prev.next = prev.next.next
         else:
             prev = self.head
             for _ in range(index - 1):
@@ -70,4 +104,6 @@ class LinkedList:
                 raise IndexError("索引越界")
             val = prev.next.val
             prev.next = prev.next.next
-        self._notify({"type": "delete", "index": index, "value": val})
+        if self.pos_index is not None:
+            self.pos_index.on_delete(index, self.head if index == 0 else prev.next)
+        self._notify(("delete", index, val))
@@ -1,4 +1,5 @@
 # core/list.py
+import itertools
 import time
 from typing import Any, Optional, List as PyList
 
@@ -24,16 +25,40 @@ class Node:
     def __repr__(self):
         return f"Node(data={self.data}, vtx_idx={self.vtx_idx})"
 
+
+_next_slim_id = itertools.count(1).__next__
+
+
+class SlimNode:
+    """
+    轻量链表节点：__slots__ 只保存数据与指针，id 为单调递增整数
+    可视化字段（vtx_idx/x/y/color/label）不在节点上，由 List 的侧表按需生成
+    """
+    __slots__ = ("data", "id", "next", "prev")
+
+    def __init__(self, data: Any):
+        self.data = data
+        self.id = _next_slim_id()
+        self.next = None
+        self.prev = None
+
+    def __repr__(self):
+        return f"SlimNode(data={self.data}, id={self.id})"
+
 class List:
     """
     单链表/双链表核心实现
     支持模式："singly"（单链表）、"doubly"（双链表）
+    unbounded=True 时为可扩展模式：不限节点数与取值范围，修改后不再整表重排，
+    布局只在 get_visual_data() 时针对可见窗口计算，insert_head/insert_tail 为真正的 O(1)
+    slim=True 时使用 SlimNode，可视化字段放在侧表 self._visual 中，只为布局过的节点生成
     """
     MAX_NODES = 15  # 最大节点数限制
     MIN_VAL = -99  # 数据最小值
     MAX_VAL = 99  # 数据最大值
+    VISIBLE_NODES = 30  # 可扩展模式下 get_visual_data 默认返回的窗口大小
 
-    def __init__(self, mode: str = "singly"):
+    def __init__(self, mode: str = "singly", unbounded: bool = False, slim: bool = False):
         if mode not in ["singly", "doubly"]:
             raise ValueError("模式仅支持 'singly'（单链表）或 'doubly'（双链表）")
         
@@ -41,7 +66,12 @@ class List:
         self.head: Optional[Node] = None  # 头节点
         self.tail: Optional[Node] = None  # 尾节点
         self.size: int = 0  # 当前节点数
-        self.nodes: PyList[Node] = []  # 存储所有节点（用于可视化）
+        self.nodes: PyList[Node] = []  # 存储所有节点（用于可视化；可扩展模式下只保存最近一次可见窗口）
+        self.unbounded: bool = unbounded
+        self.slim: bool = slim
+        self._visual: dict = {}  # slim 模式的可视化侧表：node.id -> {vtx_idx, x, y, color, label}
+        self.pos_index = None  # 可选的位置索引（enable_position_index 后启用）
+        self.value_index = None  # 可选的值索引 value -> {节点: None}（enable_value_index 后启用）
 
     def is_doubly(self) -> bool:
         """判断是否为双链表"""
@@ -51,12 +81,90 @@ class List:
         """判断链表是否为空"""
         return self.size == 0
 
+    def _check_insert(self, data: Any) -> None:
+        """有界模式下检查容量与取值范围"""
+        if self.unbounded:
+            return
+        if self.size >= self.MAX_NODES:
+            raise ValueError(f"链表已满（最大{self.MAX_NODES}个节点）")
+        if not (self.MIN_VAL <= data <= self.MAX_VAL):
+            raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+
+    def _relayout(self) -> None:
+        """修改后的布局刷新：有界模式立即重排，可扩展模式推迟到 get_visual_data"""
+        if not self.unbounded:
+            self._update_layout()
+
     def _create_node(self, data: Any) -> Node:
         """创建新节点并初始化位置"""
-        vtx_idx = self.size
-        node = Node(data, vtx_idx)
-        # 水平布局：每个节点间隔80像素
-        node.x = 50 + vtx_idx * 80
+        if self.slim:
+            node = SlimNode(data)
+        else:
+            vtx_idx = self.size
+            node = Node(data, vtx_idx)
+            # 水平布局：每个节点间隔80像素
+            node.x = 50 + vtx_idx * 80
+        if self.value_index is not None:
+            self.value_index.setdefault(data, {})[node] = None
+        return node
+
+    def _place(self, node, idx: int, x: int) -> None:
+        """写入节点的可视化索引与坐标（slim 模式写侧表，首次布局时才生成条目）"""
+        if not self.slim:
+            node.vtx_idx = idx
+            node.x = x
+            return
+        vis = self._visual.get(node.id)
+        if vis is None:
+            self._visual[node.id] = {"vtx_idx": idx, "x": x, "y": 100, "color": "#FFFFFF", "label": str(node.data)}
+        else:
+            vis["vtx_idx"] = idx
+            vis["x"] = x
+
+    def _visual_fields(self, node) -> dict:
+        if self.slim:
+            return self._visual[node.id]
+        return {"vtx_idx": node.vtx_idx, "x": node.x, "y": node.y, "color": node.color, "label": node.label}
+
+    def _forget(self, node) -> None:
+        """删除节点时断开指针并清理侧表条目"""
+        node.next = None
+        node.prev = None
+        if self.slim:
+            self._visual.pop(node.id, None)
+        if self.value_index is not None:
+            self._unindex_value(node)
+
+    def _unindex_value(self, node) -> None:
+        bucket = self.value_index.get(node.data)
+        if bucket is not None:
+            bucket.pop(node, None)
+            if not bucket:
+                del self.value_index[node.data]
+
+    def enable_value_index(self):
+        """开启值索引（值 -> 节点集合），find / contains / delete_value 平均 O(1)"""
+        self.value_index = {}
+        current = self.head
+        while current:
+            self.value_index.setdefault(current.data, {})[current] = None
+            current = current.next
+        return self.value_index
+
+    def enable_position_index(self):
+        """开启位置索引（游标 + √n 检查点，见 core/position_index.py），按下标的插入/删除降为 O(√n)"""
+        from core.position_index import PositionIndex
+
+        self.pos_index = PositionIndex(self)
+        return self.pos_index
+
+    def _node_at(self, index: int):
+        """下标 index 处的节点：有位置索引时走索引，否则从头遍历"""
+        if self.pos_index is not None:
+            return self.pos_index.locate(index)
+        node = self.head
+        for _ in range(index):
+            node = node.next
         return node
 
     def _update_layout(self):
@@ -66,8 +174,7 @@ class List:
         self.nodes.clear()
         
         while current:
-            current.vtx_idx = idx
-            current.x = 50 + idx * 80  # 重新计算X坐标
+            self._place(current, idx, 50 + idx * 80)  # 重新计算X坐标
             self.nodes.append(current)
             current = current.next
             idx += 1
@@ -77,10 +184,21 @@ class List:
     # ------------------------------ 查找操作 ------------------------------
     def find(self, value: Any) -> Optional[Node]:
         """
-        查找指定值的节点
+        查找指定值的节点（第一次出现）
         :return: 找到返回节点，未找到返回None
-        时间复杂度：O(N)
+        时间复杂度：O(N)；开启值索引后未命中与唯一值为 O(1)，
+        有重复值时从头扫描到第一个候选节点为止
         """
+        if self.value_index is not None:
+            bucket = self.value_index.get(value)
+            if not bucket:
+                return None
+            if len(bucket) == 1:
+                return next(iter(bucket))
+            current = self.head
+            while current not in bucket:
+                current = current.next
+            return current
         current = self.head
         while current:
             if current.data == value:
@@ -88,16 +206,58 @@ class List:
             current = current.next
         return None
 
+    def contains(self, value: Any) -> bool:
+        """是否包含 value（开启值索引后平均 O(1)）"""
+        if self.value_index is not None:
+            return value in self.value_index
+        return self.find(value) is not None
+
+    def delete_value(self, value: Any) -> bool:
+        """
+        删除第一次出现的 value，返回是否删除成功
+        双链表通过 prev 直接摘除；单链表从头走到前驱再摘除（O(N)），
+        被删的始终是 find 找到的那个节点，其余节点的身份与可视化条目不变
+        """
+        node = self.find(value)
+        if node is None:
+            return False
+        if node is self.head:
+            self.delete_head()
+            return True
+        if node is self.tail:
+            self.delete_tail()
+            return True
+
+        successor = node.next
+        if self.is_doubly():
+            prev = node.prev
+            successor.prev = prev
+            index = None
+        else:
+            prev = self.head
+            index = 1
+            while prev.next is not node:
+                prev = prev.next
+                index += 1
+        prev.next = successor
+        self._forget(node)
+
+        self.size -= 1
+        if self.pos_index is not None:
+            if index is None:
+                self.pos_index.invalidate()
+            else:
+                self.pos_index.on_delete(index, successor)
+        self._relayout()
+        return True
+
     # ------------------------------ 插入操作 ------------------------------
     def insert_head(self, data: Any) -> None:
         """
         头插入（O(1)）
         :param data: 插入的数据
         """
-        if self.size >= self.MAX_NODES:
-            raise ValueError(f"链表已满（最大{self.MAX_NODES}个节点）")
-        if not (self.MIN_VAL <= data <= self.MAX_VAL):
-            raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+        self._check_insert(data)
 
         new_node = self._create_node(data)
         if self.is_empty():
@@ -113,17 +273,16 @@ class List:
             self.head = new_node
 
         self.size += 1
-        self._update_layout()
+        if self.pos_index is not None:
+            self.pos_index.on_insert(0, new_node)
+        self._relayout()
 
     def insert_tail(self, data: Any) -> None:
         """
         尾插入（单链表O(N)，双链表O(1)）
         :param data: 插入的数据
         """
-        if self.size >= self.MAX_NODES:
-            raise ValueError(f"链表已满（最大{self.MAX_NODES}个节点）")
-        if not (self.MIN_VAL <= data <= self.MAX_VAL):
-            raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+        self._check_insert(data)
 
         new_node = self._create_node(data)
         if self.is_empty():
@@ -138,11 +297,13 @@ class List:
             self.tail = new_node
 
         self.size += 1
-        self._update_layout()
+        if self.pos_index is not None:
+            self.pos_index.on_insert(self.size - 1, new_node)
+        self._relayout()
 
     def insert_at_index(self, data: Any, index: int) -> None:
         """
-        中间插入（O(N)）
+        中间插入（O(N)；开启位置索引后 O(√n)）
         :param data: 插入的数据
         :param index: 插入位置（0-based）
         """
@@ -154,9 +315,7 @@ class List:
             return self.insert_tail(data)
 
         # 找到插入位置的前驱节点
-        prev_node = self.head
-        for _ in range(index - 1):
-            prev_node = prev_node.next
+        prev_node = self._node_at(index - 1)
 
         aft_node = prev_node.next  # 后继节点
         new_node = self._create_node(data)
@@ -171,7 +330,52 @@ class List:
             aft_node.prev = new_node
 
         self.size += 1
-        self._update_layout()
+        if self.pos_index is not None:
+            self.pos_index.on_insert(index, new_node)
+        self._relayout()
+
+    def extend(self, iterable) -> int:
+        """
+        批量尾插入：一次遍历把所有节点链接到尾部，最后只做一次布局刷新（O(k)）
+        可扩展模式下直接消费迭代器（如 JsonArrayReader），不会先复制成列表
+        :return: 插入的节点数
+        """
+        if not self.unbounded:
+            # 有界模式先整体校验，避免插入一半才发现越界
+            iterable = list(iterable)
+            if self.size + len(iterable) > self.MAX_NODES:
+                raise ValueError(f"链表已满（最大{self.MAX_NODES}个节点）")
+            for data in iterable:
+                if not (self.MIN_VAL <= data <= self.MAX_VAL):
+                    raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+
+        doubly = self.is_doubly()
+        count = 0
+        try:
+            for data in iterable:
+                new_node = self._create_node(data)
+                if self.tail is None:
+                    self.head = new_node
+                else:
+                    self.tail.next = new_node
+                    if doubly:
+                        new_node.prev = self.tail
+                self.tail = new_node
+                self.size += 1
+                count += 1
+        finally:
+            if count:
+                if self.pos_index is not None:
+                    self.pos_index.invalidate()
+                self._relayout()
+        return count
+
+    @classmethod
+    def from_iterable(cls, iterable, mode: str = "singly", unbounded: bool = False, slim: bool = False) -> "List":
+        """由可迭代对象一次性构建链表"""
+        lst = cls(mode, unbounded=unbounded, slim=slim)
+        lst.extend(iterable)
+        return lst
 
     # ------------------------------ 删除操作 ------------------------------
     def delete_head(self) -> Optional[Any]:
@@ -195,11 +399,12 @@ class List:
 
         # 清理删除节点的指针
         deleted_data = deleted_node.data
-        deleted_node.next = None
-        deleted_node.prev = None
+        self._forget(deleted_node)
 
         self.size -= 1
-        self._update_layout()
+        if self.pos_index is not None:
+            self.pos_index.on_delete(0, self.head)
+        self._relayout()
         return deleted_data
 
     def delete_tail(self) -> Optional[Any]:
@@ -218,10 +423,8 @@ class List:
                 # 双链表：直接通过prev找到前驱
                 prev_node = self.tail.prev
             else:
-                # 单链表：遍历找到前驱
-                prev_node = self.head
-                while prev_node.next != self.tail:
-                    prev_node = prev_node.next
+                # 单链表：定位到倒数第二个节点（有位置索引时 O(√n)）
+                prev_node = self._node_at(self.size - 2)
 
             # 前驱节点next置空
             prev_node.next = None
@@ -230,16 +433,17 @@ class List:
 
         # 清理删除节点的指针
         deleted_data = deleted_node.data
-        deleted_node.next = None
-        deleted_node.prev = None
+        self._forget(deleted_node)
 
         self.size -= 1
-        self._update_layout()
+        if self.pos_index is not None:
+            self.pos_index.on_delete(self.size, None)
+        self._relayout()
         return deleted_data
 
     def delete_at_index(self, index: int) -> Optional[Any]:
         """
-        中间删除（O(N)）
+        中间删除（O(N)；开启位置索引后 O(√n)）
         :param index: 删除位置（0-based）
         :return: 删除的节点数据
         """
@@ -251,9 +455,7 @@ class List:
             return self.delete_tail()
 
         # 找到删除位置的前驱节点
-        prev_node = self.head
-        for _ in range(index - 1):
-            prev_node = prev_node.next
+        prev_node = self._node_at(index - 1)
 
         deleted_node = prev_node.next  # 待删除节点
         aft_node = deleted_node.next  # 后继节点
@@ -267,22 +469,43 @@ class List:
 
         # 清理删除节点的指针
         deleted_data = deleted_node.data
-        deleted_node.next = None
-        deleted_node.prev = None
+        self._forget(deleted_node)
 
         self.size -= 1
-        self._update_layout()
+        if self.pos_index is not None:
+            self.pos_index.on_delete(index, aft_node)
+        self._relayout()
         return deleted_data
 
     # ------------------------------ 可视化支持 ------------------------------
-    def get_visual_data(self) -> dict:
+    def _layout_window(self, start: int, count: int) -> None:
+        """可扩展模式：只为 [start, start+count) 内的节点计算索引与坐标，结果放入 self.nodes"""
+        self.nodes = []
+        current = self.head
+        for _ in range(start):
+            if current is None:
+                return
+            current = current.next
+        idx = start
+        while current and idx < start + count:
+            self._place(current, idx, 50 + (idx - start) * 80)
+            self.nodes.append(current)
+            current = current.next
+            idx += 1
+
+    def get_visual_data(self, start: int = 0, count: Optional[int] = None) -> dict:
         """
         获取可视化所需数据
+        :param start: 可扩展模式下可见窗口的起始下标
+        :param count: 可扩展模式下窗口大小（默认 VISIBLE_NODES）
         :return: 包含节点和边信息的字典
         """
+        if self.unbounded:
+            self._layout_window(max(start, 0), self.VISIBLE_NODES if count is None else count)
         visual_data = {
             "mode": self.mode,
             "size": self.size,
+            "start": start if self.unbounded else 0,
             "nodes": [],
             "edges": []
         }
@@ -290,38 +513,41 @@ class List:
         # 节点数据
         head_id = self.head.id if self.head else None
         tail_id = self.tail.id if self.tail else None
+        fields = {}
         for node in self.nodes:
+            vis = fields[node.id] = self._visual_fields(node)
             visual_data["nodes"].append({
                 "id": node.id,
                 "data": node.data,
-                "vtx_idx": node.vtx_idx,
-                "x": node.x,
-                "y": node.y,
-                "color": node.color,
-                "label": node.label,
+                "vtx_idx": vis["vtx_idx"],
+                "x": vis["x"],
+                "y": vis["y"],
+                "color": vis["color"],
+                "label": vis["label"],
                 "is_head": node.id == head_id,
                 "is_tail": node.id == tail_id
             })
 
-        # 边数据（单链表：next边；双链表：next+prev边）
+        # 边数据（单链表：next边；双链表：next+prev边）；可扩展模式下只连接窗口内的节点
+        visible = {id(node) for node in self.nodes} if self.unbounded else None
         for node in self.nodes:
             # Next边（正向）
-            if node.next:
+            if node.next and (visible is None or id(node.next) in visible):
                 visual_data["edges"].append({
                     "source_id": node.id,
                     "target_id": node.next.id,
                     "type": "next",
                     "color": "#008000",
-                    "idx": node.vtx_idx
+                    "idx": fields[node.id]["vtx_idx"]
                 })
             # Prev边（反向，双链表专用）
-            if self.is_doubly() and node.prev:
+            if self.is_doubly() and node.prev and (visible is None or id(node.prev) in visible):
                 visual_data["edges"].append({
                     "source_id": node.id,
                     "target_id": node.prev.id,
                     "type": "prev",
                     "color": "#FFA500",
-                    "idx": node.vtx_idx + 5000  # 避免ID冲突
+                    "idx": fields[node.id]["vtx_idx"] + 5000  # 避免ID冲突
                 })
 
         return visual_data
@@ -339,6 +565,11 @@ class List:
         self.head = self.tail = None
         self.size = 0
         self.nodes.clear()
+        self._visual.clear()
+        if self.value_index is not None:
+            self.value_index.clear()
+        if self.pos_index is not None:
+            self.pos_index.rebuild()
 
     def to_list(self) -> PyList[Any]:
         """转换为Python列表"""
@@ -0,0 +1,232 @@
+# core/persistent_avl.py
+# 持久化（路径复制）AVL 树：每次插入/删除只复制根到修改点路径上的 O(log n) 个节点，
+# 其余子树在新旧版本之间共享，因此保存快照、撤销/重做、跳转到任意历史版本都不需要深拷贝
+from core.avl_tree import AVLNode
+
+
+class PersistentAVLNode:
+    """不可变节点：创建后不再修改（没有 parent 指针，才能在多个版本间共享）"""
+    __slots__ = ("val", "freq", "left", "right", "height")
+
+    def __init__(self, val, freq=1, left=None, right=None):
+        self.val = val
+        self.freq = freq
+        self.left = left
+        self.right = right
+        self.height = 1 + max(left.height if left else 0, right.height if right else 0)
+
+    def __repr__(self):
+        return f"PersistentAVLNode({self.val},freq={self.freq})"
+
+
+# ---------- 纯函数式的 AVL 操作（均返回新节点，不修改旧节点） ----------
+def _height(node):
+    return node.height if node else 0
+
+
+def _rotate_right(val, freq, left, right):
+    # left 成为新根
+    return PersistentAVLNode(left.val, left.freq, left.left,
+                             PersistentAVLNode(val, freq, left.right, right))
+
+
+def _rotate_left(val, freq, left, right):
+    # right 成为新根
+    return PersistentAVLNode(right.val, right.freq,
+                             PersistentAVLNode(val, freq, left, right.left), right.right)
+
+
+def _balance(val, freq, left, right):
+    """以 (val, freq, left, right) 构造节点，必要时做单旋/双旋"""
+    bf = _height(left) - _height(right)
+    if bf > 1:
+        if _height(left.left) < _height(left.right):  # 左右情况：先对左孩子左旋
+            left = _rotate_left(left.val, left.freq, left.left, left.right)
+        return _rotate_right(val, freq, left, right)
+    if bf < -1:
+        if _height(right.right) < _height(right.left):  # 右左情况：先对右孩子右旋
+            right = _rotate_right(right.val, right.freq, right.left, right.right)
+        return _rotate_left(val, freq, left, right)
+    return PersistentAVLNode(val, freq, left, right)
+
+
+def _insert(node, val):
+    if node is None:
+        return PersistentAVLNode(val)
+    if val < node.val:
+        return _balance(node.val, node.freq, _insert(node.left, val), node.right)
+    if val > node.val:
+        return _balance(node.val, node.freq, node.left, _insert(node.right, val))
+    # 值相等：频率+1，只复制这一个节点
+    return PersistentAVLNode(node.val, node.freq + 1, node.left, node.right)
+
+
+def _pop_max(node):
+    """删除子树中的最大节点，返回 (最大节点, 新子树)"""
+    if node.right is None:
+        return node, node.left
+    max_node, right = _pop_max(node.right)
+    return max_node, _balance(node.val, node.freq, node.left, right)
+
+
+def _delete(node, val):
+    """返回 (新子树, 是否删除成功)；未找到时返回原子树本身"""
+    if node is None:
+        return None, False
+    if val < node.val:
+        left, ok = _delete(node.left, val)
+        if not ok:
+            return node, False
+        return _balance(node.val, node.freq, left, node.right), True
+    if val > node.val:
+        right, ok = _delete(node.right, val)
+        if not ok:
+            return node, False
+        return _balance(node.val, node.freq, node.left, right), True
+    if node.freq > 1:
+        return PersistentAVLNode(node.val, node.freq - 1, node.left, node.right), True
+    if node.left is None:
+        return node.right, True
+    if node.right is None:
+        return node.left, True
+    # 两个孩子：与 AVLTree.delete 一致，用前驱（左子树最大值）替换
+    pred, left = _pop_max(node.left)
+    return _balance(pred.val, pred.freq, left, node.right), True
+
+
+def _build_sorted(pairs, lo, hi):
+    """由有序 (val, freq) 列表构造完全平衡的树，O(n)"""
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    val, freq = pairs[mid]
+    return PersistentAVLNode(val, freq, _build_sorted(pairs, lo, mid), _build_sorted(pairs, mid + 1, hi))
+
+
+class PersistentAVLTree:
+    """
+    带版本历史的持久化 AVL 树
+    - versions[i] 是第 i 个版本的根，labels[i] 是产生该版本的操作说明
+    - insert/delete/clear 产生新版本（会丢弃当前版本之后的重做分支）
+    - undo/redo/checkout 只移动版本指针，O(1)
+    """
+    def __init__(self):
+        self.versions = [None]
+        self.labels = ["空树"]
+        self.current = 0
+        self.listeners = []
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    def notify(self, action, node=None, extra=None):
+        for f in self.listeners:
+            f({"action": action, "node": node, "tree": self.root, "extra": extra})
+
+    @property
+    def root(self):
+        return self.versions[self.current]
+
+    def __len__(self):
+        return len(self.versions)
+
+    # ---------- 产生新版本 ----------
+    def _commit(self, new_root, label):
+        del self.versions[self.current + 1:]
+        del self.labels[self.current + 1:]
+        self.versions.append(new_root)
+        self.labels.append(label)
+        self.current += 1
+        self.notify("version", new_root, extra={"version": self.current, "label": label})
+        return new_root
+
+    def insert(self, val):
+        return self._commit(_insert(self.root, val), f"插入 {val}")
+
+    def delete(self, val):
+        """删除一个 val（频率>1 时只减频率）；未找到时不产生新版本，返回 False"""
+        new_root, ok = _delete(self.root, val)
+        if ok:
+            self._commit(new_root, f"删除 {val}")
+        return ok
+
+    def clear(self):
+        return self._commit(None, "清空")
+
+    def assign(self, pairs, label):
+        """整体替换为有序 (val, freq) 序列（批量操作后记录一个版本），O(n)"""
+        pairs = list(pairs)
+        return self._commit(_build_sorted(pairs, 0, len(pairs)), label)
+
+    def reset(self, pairs=()):
+        """丢弃全部历史，以有序 (val, freq) 序列作为唯一版本"""
+        pairs = list(pairs)
+        self.versions = [_build_sorted(pairs, 0, len(pairs))]
+        self.labels = ["初始"]
+        self.current = 0
+        self.notify("version", self.root, extra={"version": 0, "label": "初始"})
+
+    # ---------- 版本切换 ----------
+    def can_undo(self):
+        return self.current > 0
+
+    def can_redo(self):
+        return self.current < len(self.versions) - 1
+
+    def checkout(self, version):
+        if not 0 <= version < len(self.versions):
+            raise IndexError(f"版本号越界，有效范围[0, {len(self.versions) - 1}]")
+        self.current = version
+        self.notify("version", self.root, extra={"version": version, "label": self.labels[version]})
+        return self.root
+
+    def undo(self):
+        if not self.can_undo():
+            return False
+        self.checkout(self.current - 1)
+        return True
+
+    def redo(self):
+        if not self.can_redo():
+            return False
+        self.checkout(self.current + 1)
+        return True
+
+    # ---------- 查询 ----------
+    def search(self, val, version=None):
+        cur = self.root if version is None else self.versions[version]
+        while cur:
+            if val == cur.val:
+                return cur
+            cur = cur.left if val < cur.val else cur.right
+        return None
+
+    def inorder(self, version=None):
+        res = []
+        stack = []
+        cur = self.root if version is None else self.versions[version]
+        while stack or cur:
+            while cur:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            res.extend([cur.val] * cur.freq)
+            cur = cur.right
+        return res
+
+    def materialize(self, version=None):
+        """
+        把某个版本转换为带 parent 指针的可编辑 AVLNode 树，O(n)
+        AVLTree 跳转版本后直接在持久化节点上查询与绘制，只在第一次修改前调用它
+        """
+        def copy(node, parent):
+            if node is None:
+                return None
+            n = AVLNode(node.val)
+            n.freq = node.freq
+            n.height = node.height
+            n.parent = parent
+            n.left = copy(node.left, n)
+            n.right = copy(node.right, n)
+            return n
+        return copy(self.root if version is None else self.versions[version], None)
@@ -0,0 +1,97 @@
+# core/position_index.py
+# 链表位置索引：给按下标访问的单/双链表加两层加速
+# - 游标：记住最近一次定位的 (节点, 下标)，顺序按下标扫描时每步只前进 1 个节点，均摊 O(1)
+# - 稀疏检查点：每隔约 √n 个节点记一个 (下标, 节点)，任意下标定位最多走 √n 步
+# 插入 / 删除时只平移受影响检查点的下标（O(√n)），每累计 √n 次修改整体重建一次（O(n)），均摊 O(√n)
+import math
+from bisect import bisect_left, bisect_right
+
+
+class PositionIndex:
+    def __init__(self, owner):
+        """owner：带 head 属性、节点带 next 指针的链表"""
+        self.owner = owner
+        self.rebuild()
+
+    def rebuild(self):
+        nodes = []
+        n = 0
+        cur = self.owner.head
+        while cur:
+            nodes.append(cur)
+            cur = cur.next
+            n += 1
+        self.size = n
+        self.step = max(1, math.isqrt(n))
+        self._pos = list(range(0, n, self.step))
+        self._nodes = nodes[::self.step]
+        self._cursor = None  # (下标, 节点)
+        self._dirty = 0      # 上次重建后的修改次数
+        self._stale = False  # 发生了下标未知的修改，下次使用前整体重建
+
+    def invalidate(self):
+        """按节点（而非下标）删除等无法增量维护的修改后调用，推迟到下次使用时重建"""
+        self._stale = True
+
+    def __len__(self):
+        if self._stale:
+            self.rebuild()
+        return self.size
+
+    def _touch(self):
+        self._dirty += 1
+        if self._dirty > self.step:
+            self.rebuild()
+
+    def locate(self, index):
+        """返回下标 index 处的节点（调用方保证 0 <= index < size）"""
+        if self._stale:
+            self.rebuild()
+        start, node = 0, self.owner.head
+        k = bisect_right(self._pos, index) - 1
+        if k >= 0 and self._pos[k] > start:
+            start, node = self._pos[k], self._nodes[k]
+        if self._cursor is not None and start < self._cursor[0] <= index:
+            start, node = self._cursor
+        for _ in range(index - start):
+            node = node.next
+        self._cursor = (index, node)
+        return node
+
+    def on_insert(self, index, node):
+        """在 index 处插入了 node（原 index 及之后的节点后移一位）"""
+        if self._stale:
+            return
+        self.size += 1
+        pos = self._pos
+        for k in range(bisect_left(pos, index), len(pos)):
+            pos[k] += 1
+        if self._cursor is not None:
+            ci, cn = self._cursor
+            if ci >= index:
+                self._cursor = (ci + 1, cn)
+        self._touch()
+
+    def on_delete(self, index, successor):
+        """删除了 index 处的节点，successor 为其后继（现在位于 index）"""
+        if self._stale:
+            return
+        self.size -= 1
+        pos, nodes = self._pos, self._nodes
+        k = bisect_left(pos, index)
+        if k < len(pos) and pos[k] == index:
+            if successor is None or (k + 1 < len(pos) and pos[k + 1] == index + 1):
+                # 后继已是检查点（或没有后继），直接丢弃这个检查点
+                del pos[k], nodes[k]
+            else:
+                nodes[k] = successor
+                k += 1
+        for j in range(k, len(pos)):
+            pos[j] -= 1
+        if self._cursor is not None:
+            ci, cn = self._cursor
+            if ci == index:
+                self._cursor = (index, successor) if successor is not None else None
+            elif ci > index:
+                self._cursor = (ci - 1, cn)
+        self._touch()
@@ -0,0 +1,394 @@
+# core/rb_tree.py
+# 红黑树：与 AVLTree 接口一致（多重集 freq、search/lower_bound/successor/predecessor/inorder、监听器事件）
+# 插入最多 2 次旋转、删除最多 3 次旋转，其余修复只改颜色，适合写多读少的场景
+import random
+
+RED = "red"
+BLACK = "black"
+
+
+class RBNode:
+    def __init__(self, val, color=RED):
+        self.val = val
+        self.freq = 1
+        self.left = None
+        self.right = None
+        self.parent = None
+        self.color = color  # 新节点默认红色
+
+
+def _color(node):
+    # 空节点视为黑色
+    return node.color if node else BLACK
+
+
+class RBTree:
+    def __init__(self):
+        self.root = None
+        self.listeners = []
+        self.rotations = 0  # 累计旋转次数（基准测试使用）
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    def notify(self, action, node=None, extra=None):
+        for f in self.listeners:
+            f({"action": action, "node": node, "tree": self.root, "extra": extra})
+
+    def clear(self):
+        self.root = None
+        self.notify("build", None, extra=[])
+
+    def height(self):
+        """树高（空树为 0），迭代计算"""
+        h = 0
+        level = [self.root] if self.root else []
+        while level:
+            h += 1
+            level = [c for n in level for c in (n.left, n.right) if c]
+        return h
+
+    # ---------- 旋转（带通知，与 AVLTree 的事件一致，便于复用旋转动画） ----------
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+        if new:
+            new.parent = parent
+
+    def _left_rotate(self, x):
+        y = x.right
+        self.notify("rotation_prepare", node=x, extra={"type": "left", "pivot": y.val})
+        x.right = y.left
+        if y.left:
+            y.left.parent = x
+        self._replace_child(x.parent, x, y)
+        y.left = x
+        x.parent = y
+        self.rotations += 1
+        self.notify("rotation", node=y, extra={"type": "left", "pivot": y.val})
+        return y
+
+    def _right_rotate(self, y):
+        x = y.left
+        self.notify("rotation_prepare", node=y, extra={"type": "right", "pivot": x.val})
+        y.left = x.right
+        if x.right:
+            x.right.parent = y
+        self._replace_child(y.parent, y, x)
+        x.right = y
+        y.parent = x
+        self.rotations += 1
+        self.notify("rotation", node=x, extra={"type": "right", "pivot": x.val})
+        return x
+
+    # ---------- 插入 ----------
+    def insert(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始插入值：{val}")
+
+        parent = None
+        cur = self.root
+        path = []
+        while cur:
+            path.append(cur)
+            parent = cur
+            if val == cur.val:
+                cur.freq += 1
+                if step_callback:
+                    step_callback(f"节点 {val} 已存在，频率+1 -> {cur.freq}")
+                self.notify("increase_freq", cur, extra=path)
+                return self.root
+            cur = cur.left if val < cur.val else cur.right
+
+        node = RBNode(val)
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif val < parent.val:
+            parent.left = node
+        else:
+            parent.right = node
+        path.append(node)
+
+        self.notify("bst_insert_complete", node, extra=path)
+        if step_callback:
+            step_callback(f"BST插入完成：节点 {val}（红色）")
+
+        self._insert_fixup(node, step_callback)
+
+        self.notify("balance_complete", self.root, {})
+        if step_callback:
+            step_callback("红黑性质修复完成")
+        return self.root
+
+    def _insert_fixup(self, z, step_callback=None):
+        while _color(z.parent) == RED:
+            p = z.parent
+            g = p.parent
+            if p is g.left:
+                uncle = g.right
+                if _color(uncle) == RED:
+                    # 叔叔为红：父、叔变黑，祖父变红，问题上移两层
+                    p.color = uncle.color = BLACK
+                    g.color = RED
+                    self.notify("recolor", g, extra={"nodes": [p, uncle, g]})
+                    if step_callback:
+                        step_callback(f"叔叔 {uncle.val} 为红：重新着色，继续检查祖父 {g.val}")
+                    z = g
+                    continue
+                if z is p.right:
+                    if step_callback:
+                        step_callback(f"左右情况：对 {p.val} 左旋转")
+                    z = p
+                    self._left_rotate(z)
+                    p = z.parent
+                if step_callback:
+                    step_callback(f"左左情况：{p.val} 变黑、{g.val} 变红，对 {g.val} 右旋转")
+                p.color = BLACK
+                g.color = RED
+                self._right_rotate(g)
+            else:
+                uncle = g.left
+                if _color(uncle) == RED:
+                    p.color = uncle.color = BLACK
+                    g.color = RED
+                    self.notify("recolor", g, extra={"nodes": [p, uncle, g]})
+                    if step_callback:
+                        step_callback(f"叔叔 {uncle.val} 为红：重新着色，继续检查祖父 {g.val}")
+                    z = g
+                    continue
+                if z is p.left:
+                    if step_callback:
+                        step_callback(f"右左情况：对 {p.val} 右旋转")
+                    z = p
+                    self._right_rotate(z)
+                    p = z.parent
+                if step_callback:
+                    step_callback(f"右右情况：{p.val} 变黑、{g.val} 变红，对 {g.val} 左旋转")
+                p.color = BLACK
+                g.color = RED
+                self._left_rotate(g)
+        self.root.color = BLACK
+
+    # ---------- 删除 ----------
+    def delete(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始删除值：{val}")
+
+        node = self.root
+        path = []
+        while node and node.val != val:
+            path.append(node)
+            node = node.left if val < node.val else node.right
+
+        if node is None:
+            self.notify("bst_delete_complete", None, extra=path)
+            if step_callback:
+                step_callback(f"未找到节点 {val}")
+            return self.root
+
+        path.append(node)
+        if step_callback:
+            step_callback(f"找到要删除的节点 {val}")
+        if node.freq > 1:
+            node.freq -= 1
+            if step_callback:
+                step_callback(f"节点 {val} 频率-1 -> {node.freq}")
+            self.notify("decrease_freq", node, extra=path)
+            return self.root
+
+        # 有两个孩子时，与 AVLTree 一致：用前驱（左子树最大值）替换，再删除前驱
+        target = node
+        if node.left and node.right:
+            target = node.left
+            while target.right:
+                path.append(target)
+                target = target.right
+            path.append(target)
+            if step_callback:
+                step_callback(f"使用前驱节点 {target.val} 替换待删除节点")
+            node.val, node.freq = target.val, target.freq
+
+        child = target.left or target.right
+        parent = target.parent
+        self._replace_child(parent, target, child)
+
+        self.notify("bst_delete_complete", node, extra=path)
+        if step_callback:
+            step_callback(f"BST删除完成：节点 {val}")
+
+        if target.color == BLACK:
+            if _color(child) == RED:
+                child.color = BLACK
+            else:
+                self._delete_fixup(child, parent, step_callback)
+
+        self.notify("balance_complete", self.root, {})
+        if step_callback:
+            step_callback("红黑性质修复完成")
+        return self.root
+
+    def _delete_fixup(self, x, parent, step_callback=None):
+        # x 所在位置缺少一个黑色（x 可能为空，因此单独传入 parent）
+        while x is not self.root and _color(x) == BLACK:
+            if x is parent.left:
+                w = parent.right
+                if _color(w) == RED:
+                    w.color = BLACK
+                    parent.color = RED
+                    self._left_rotate(parent)
+                    w = parent.right
+                if _color(w.left) == BLACK and _color(w.right) == BLACK:
+                    w.color = RED
+                    self.notify("recolor", w, extra={"nodes": [w]})
+                    if step_callback:
+                        step_callback(f"兄弟 {w.val} 的孩子均为黑：兄弟变红，问题上移到 {parent.val}")
+                    x, parent = parent, parent.parent
+                    continue
+                if _color(w.right) == BLACK:
+                    w.left.color = BLACK
+                    w.color = RED
+                    self._right_rotate(w)
+                    w = parent.right
+                w.color = parent.color
+                parent.color = BLACK
+                w.right.color = BLACK
+                self._left_rotate(parent)
+                x = self.root
+            else:
+                w = parent.left
+                if _color(w) == RED:
+                    w.color = BLACK
+                    parent.color = RED
+                    self._right_rotate(parent)
+                    w = parent.left
+                if _color(w.left) == BLACK and _color(w.right) == BLACK:
+                    w.color = RED
+                    self.notify("recolor", w, extra={"nodes": [w]})
+                    if step_callback:
+                        step_callback(f"兄弟 {w.val} 的孩子均为黑：兄弟变红，问题上移到 {parent.val}")
+                    x, parent = parent, parent.parent
+                    continue
+                if _color(w.left) == BLACK:
+                    w.right.color = BLACK
+                    w.color = RED
+                    self._left_rotate(w)
+                    w = parent.left
+                w.color = parent.color
+                parent.color = BLACK
+                w.left.color = BLACK
+                self._right_rotate(parent)
+                x = self.root
+        if x:
+            x.color = BLACK
+
+    # ---------- 查询（与 AVLTree 相同的返回值与事件） ----------
+    def search(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始查找值：{val}")
+        cur = self.root
+        path = []
+        while cur:
+            path.append(cur)
+            if val == cur.val:
+                self.notify("found", cur, extra=path)
+                if step_callback:
+                    step_callback(f"找到节点 {val}（频率：{cur.freq}）")
+                return cur
+            cur = cur.left if val < cur.val else cur.right
+        self.notify("not_found", None, extra=path)
+        if step_callback:
+            step_callback(f"未找到节点 {val}")
+        return None
+
+    def inorder(self):
+        res = []
+        stack = []
+        cur = self.root
+        while stack or cur:
+            while cur:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            res.extend([cur.val] * cur.freq)
+            cur = cur.right
+        return res
+
+    def lower_bound(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的lower_bound（首个≥{val}的节点）")
+        cur = self.root
+        res = None
+        path = []
+        while cur:
+            path.append(cur)
+            if cur.val >= val:
+                res = cur
+                cur = cur.left
+            else:
+                cur = cur.right
+        self.notify("trace_path", res, extra=path)
+        return res, path
+
+    def successor(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的后继（中序遍历后一个节点）")
+        cur = self.root
+        succ = None
+        path = []
+        while cur:
+            path.append(cur)
+            if cur.val > val:
+                succ = cur
+                cur = cur.left
+            else:
+                cur = cur.right
+        self.notify("trace_path", succ, extra=path)
+        return succ, path
+
+    def predecessor(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的前驱（中序遍历前一个节点）")
+        cur = self.root
+        pred = None
+        path = []
+        while cur:
+            path.append(cur)
+            if cur.val < val:
+                pred = cur
+                cur = cur.right
+            else:
+                cur = cur.left
+        self.notify("trace_path", pred, extra=path)
+        return pred, path
+
+    def build_random(self, n=7, value_range=(1, 100), step_callback=None):
+        low, high = value_range
+        if n <= 0:
+            self.clear()
+            if step_callback:
+                step_callback("清空树，生成空红黑树")
+            return []
+
+        rng = high - low + 1
+        if n <= rng:
+            values = random.sample(range(low, high + 1), n)
+        else:
+            values = random.choices(range(low, high + 1), k=n)
+        random.shuffle(values)
+
+        if step_callback:
+            step_callback(f"随机生成值序列：{values}")
+
+        self.root = None
+        for i, v in enumerate(values):
+            self.insert(v, step_callback=step_callback)
+            if step_callback:
+                step_callback(f"插入第 {i+1} 个节点：{v}")
+
+        self.notify("build", None, extra=values)
+        return values
@@ -1,32 +1,160 @@
 # core/sequence_list.py
-import copy
+# 监听器收到的是增量 delta，而不是整表快照：
+#   ("build", items) / ("insert", index, value) / ("delete", index, value) / ("set", index, value)
+#   ("cut", start, stop) / ("extend", items)
+# 需要完整数组时调用 state["snapshot"]()；视图也可以用 apply_delta 在自己的副本上增量更新
+
+
+def apply_delta(arr, delta):
+    """把 delta 应用到视图维护的数组副本 arr 上（原地修改）"""
+    kind = delta[0]
+    if kind == "build":
+        arr[:] = delta[1]
+    elif kind == "insert":
+        arr.insert(delta[1], delta[2])
+    elif kind == "delete":
+        del arr[delta[1]]
+    elif kind == "set":
+        arr[delta[1]] = delta[2]
+    elif kind == "cut":
+        del arr[delta[1]:delta[2]]
+    elif kind == "extend":
+        arr.extend(delta[1])
+    return arr
+
+
+_DELTA_FIELDS = {
+    "build": ("items",),
+    "insert": ("index", "value"),
+    "delete": ("index", "value"),
+    "set": ("index", "value"),
+    "cut": ("start", "stop"),
+    "extend": ("items",),
+}
+
+
+def delta_action(delta):
+    """把 delta 元组展开成带字段名的 action 字典，如 {"type": "insert", "index": 1, "value": 9}"""
+    action = {"type": delta[0]}
+    action.update(zip(_DELTA_FIELDS[delta[0]], delta[1:]))
+    return action
+
 
 class SequenceList:
     """顺序表"""
-    def __init__(self):
-        self.data = []
+    def __init__(self, backend="list"):
+        """
+        backend："list" 为 Python 列表；"gap" 为 array('q') 间隙缓冲区（见 core/gap_buffer.py），
+        只能存 64 位整数，内存紧凑，在上次编辑位置附近插入/删除均摊 O(1)；
+        "treap" 为隐式键 Treap（见 core/implicit_treap.py），任意下标的插入/删除/读写、cut、concat 均为 O(log n)
+        """
+        if backend not in ("list", "gap", "treap"):
+            raise ValueError(f"未知的顺序表后端：{backend}")
+        self.backend = backend
+        self.data = self._new_storage(())
         self._listeners = []
 
+    def _new_storage(self, items):
+        if self.backend == "gap":
+            from core.gap_buffer import GapBuffer
+
+            return GapBuffer(items)
+        if self.backend == "treap":
+            from core.implicit_treap import ImplicitTreap
+
+            return ImplicitTreap(items)
+        return list(items)
+
     def add_listener(self, cb):
         self._listeners.append(cb)
 
-    def _notify(self, action=None):
-        state = {"array": copy.deepcopy(self.data), "action": action}
+    def snapshot(self):
+        """当前内容的浅拷贝（按需生成，O(n)）"""
+        return list(self.data)
+
+    def _notify(self, delta):
+        if not self._listeners:
+            return
+        state = {"delta": delta, "action": delta_action(delta), "snapshot": self.snapshot}
         for cb in self._listeners:
             cb(state)
 
     def build(self, items):
-        self.data = list(items)
-        self._notify({"type": "build", "items": items})
+        self.data = self._new_storage(items)
+        if self._listeners:
+            # 发快照而不是底层存储本身，监听器保存的副本不会随后续编辑变化
+            self._notify(("build", list(self.data)))
 
     def insert(self, index, value):
         if index < 0 or index > len(self.data):
             raise IndexError("索引越界")
         self.data.insert(index, value)
-        self._notify({"type": "insert", "index": index, "value": value})
+        self._notify(("insert", index, value))
 
     def delete(self, index):
         if index < 0 or index >= len(self.data):
             raise IndexError("索引越界")
         val = self.data.pop(index)
-        self._notify({"type": "delete", "index": index, "value": val})
+        self._notify(("delete", index, val))
+
+    def get(self, index):
+        if index < 0 or index >= len(self.data):
+            raise IndexError("索引越界")
+        return self.data[index]
+
+    def set(self, index, value):
+        if index < 0 or index >= len(self.data):
+            raise IndexError("索引越界")
+        self.data[index] = value
+        self._notify(("set", index, value))
+
+    def _check_range(self, start, stop):
+        if not 0 <= start <= stop <= len(self.data):
+            raise IndexError("索引越界")
+
+    def slice(self, start, stop):
+        """[start, stop) 的值列表（不修改顺序表）"""
+        self._check_range(start, stop)
+        return list(self.data[start:stop])
+
+    def cut(self, start, stop):
+        """
+        移除 [start, stop) 并作为同后端的新顺序表返回，原地修改不重建存储
+        treap 后端 O(log n)；gap 后端为移动间隙的距离 + 切出的长度；list 后端为 del 切片，O(n - start)
+        """
+        self._check_range(start, stop)
+        part = SequenceList(self.backend)
+        if self.backend == "list":
+            part.data = self.data[start:stop]
+            del self.data[start:stop]
+        else:
+            part.data = self.data.cut(start, stop)
+        self._notify(("cut", start, stop))
+        return part
+
+    def concat(self, other):
+        """把 other 的全部元素接到末尾，other 随后被清空（treap 后端 O(log n)）"""
+        if other is self:
+            raise ValueError("不能与自身拼接")
+        items = list(other.data) if self._listeners else None
+        if self.backend == "treap" and other.backend == "treap":
+            self.data.concat(other.data)
+        else:
+            self.data.extend(other.data)
+        other.build(())
+        self._notify(("extend", items))
+        return self
+
+    def extend(self, iterable):
+        """批量追加到末尾：各后端一次写入，只发一次 ("extend", items) 通知"""
+        items = list(iterable)
+        self.data.extend(items)
+        # 通知直接复用物化后的 items，不再从存储里切片复制尾部
+        self._notify(("extend", items))
+        return len(items)
+
+    @classmethod
+    def from_iterable(cls, iterable, backend="list"):
+        seq = cls(backend)
+        seq.data = seq._new_storage(iterable)
+        return seq
@@ -0,0 +1,297 @@
+# core/skip_list.py
+# 跳表有序多重集：与 BSTree 方法一致（insert 计频率、delete、search、lower_bound、successor/predecessor、kth_smallest）
+# 每层指针额外记录跨度 span = 跨过的元素个数（按频率加权），因此第 k 小 / 排名也是期望 O(log n)
+# 更新只改局部指针，没有旋转；各层天然有序，范围遍历就是沿第 0 层前进
+import random
+
+MAX_LEVEL = 32
+P = 0.25  # 节点升一层的概率
+
+
+class SkipNode:
+    __slots__ = ("val", "freq", "forward", "span", "backward")
+
+    def __init__(self, val, level):
+        self.val = val
+        self.freq = 1
+        self.forward = [None] * level  # forward[i]：第 i 层的下一个节点
+        self.span = [0] * level        # span[i]：到 forward[i] 为止（含）跨过的元素数；forward 为空时为到表尾的元素数
+        self.backward = None           # 第 0 层的前一个节点（前驱 / 反向遍历）
+
+    @property
+    def level(self):
+        return len(self.forward)
+
+    def __repr__(self):
+        return f"SkipNode({self.val},freq={self.freq},level={self.level})"
+
+
+class SkipList:
+    def __init__(self, seed=None):
+        self.header = SkipNode(None, MAX_LEVEL)
+        self.level = 1   # 当前最高层数
+        self.size = 0    # 元素总数（含重复）
+        self.listeners = []
+        self._rnd = random.Random(seed)
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    def notify(self, action, node=None, extra=None):
+        for f in self.listeners:
+            f({"action": action, "node": node, "tree": self, "extra": extra})
+
+    def __len__(self):
+        return self.size
+
+    def clear(self):
+        self.header = SkipNode(None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        self.notify("build", None, extra=[])
+
+    def _random_level(self):
+        lvl = 1
+        while lvl < MAX_LEVEL and self._rnd.random() < P:
+            lvl += 1
+        return lvl
+
+    def _find_update(self, val, path=None):
+        """返回 (update, rank)：update[i] 为第 i 层最后一个值 < val 的节点，rank[i] 为其之前（含）的元素数"""
+        update = [None] * MAX_LEVEL
+        rank = [0] * MAX_LEVEL
+        x = self.header
+        for i in range(self.level - 1, -1, -1):
+            rank[i] = rank[i + 1] if i + 1 < self.level else 0
+            nxt = x.forward[i]
+            while nxt is not None and nxt.val < val:
+                rank[i] += x.span[i]
+                x = nxt
+                if path is not None:
+                    path.append(x)
+                nxt = x.forward[i]
+            update[i] = x
+        return update, rank
+
+    def _find_prev(self, val, path=None):
+        """只读查询用：返回第 0 层最后一个值 < val 的节点（不记录各层 update / rank）"""
+        x = self.header
+        for i in range(self.level - 1, -1, -1):
+            nxt = x.forward[i]
+            while nxt is not None and nxt.val < val:
+                x = nxt
+                if path is not None:
+                    path.append(x)
+                nxt = x.forward[i]
+        return x
+
+    # ---------- 插入 / 删除 ----------
+    def insert(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始插入值：{val}")
+        update, rank = self._find_update(val)
+        x = update[0].forward[0]
+        if x is not None and x.val == val:
+            # 已存在：频率+1，所有覆盖该节点的跨度 +1
+            x.freq += 1
+            for i in range(self.level):
+                update[i].span[i] += 1
+            self.size += 1
+            if step_callback:
+                step_callback(f"节点 {val} 已存在，频率+1 -> {x.freq}")
+            self.notify("increase_freq", x, extra={"val": val})
+            return x
+
+        lvl = self._random_level()
+        if lvl > self.level:
+            for i in range(self.level, lvl):
+                rank[i] = 0
+                update[i] = self.header
+                self.header.span[i] = self.size
+            self.level = lvl
+
+        node = SkipNode(val, lvl)
+        for i in range(lvl):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+            # 新节点之前（update[i] 之后）的元素数为 rank[0] - rank[i]
+            node.span[i] = update[i].span[i] - (rank[0] - rank[i])
+            update[i].span[i] = rank[0] - rank[i] + 1
+        for i in range(lvl, self.level):
+            update[i].span[i] += 1
+
+        node.backward = update[0] if update[0] is not self.header else None
+        if node.forward[0] is not None:
+            node.forward[0].backward = node
+        self.size += 1
+        if step_callback:
+            step_callback(f"插入节点 {val}，层数 {lvl}")
+        self.notify("insert", node, extra={"val": val, "level": lvl})
+        return node
+
+    def delete(self, val, step_callback=None):
+        """删除一个 val（频率>1 时只减频率），返回是否删除成功"""
+        if step_callback:
+            step_callback(f"开始删除值：{val}")
+        update, _ = self._find_update(val)
+        x = update[0].forward[0]
+        if x is None or x.val != val:
+            if step_callback:
+                step_callback(f"未找到节点 {val}")
+            self.notify("not_found", None, extra=[])
+            return False
+
+        self.size -= 1
+        if x.freq > 1:
+            x.freq -= 1
+            for i in range(self.level):
+                update[i].span[i] -= 1
+            if step_callback:
+                step_callback(f"节点 {val} 频率-1 -> {x.freq}")
+            self.notify("decrease_freq", x, extra={"val": val})
+            return True
+
+        for i in range(self.level):
+            if update[i].forward[i] is x:
+                update[i].span[i] += x.span[i] - 1
+                update[i].forward[i] = x.forward[i]
+            else:
+                update[i].span[i] -= 1
+        if x.forward[0] is not None:
+            x.forward[0].backward = x.backward
+        while self.level > 1 and self.header.forward[self.level - 1] is None:
+            self.level -= 1
+        if step_callback:
+            step_callback(f"删除节点 {val}")
+        self.notify("delete", x, extra={"val": val})
+        return True
+
+    # ---------- 查询 ----------
+    def search(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始查找值：{val}")
+        path = []
+        x = self._find_prev(val, path).forward[0]
+        if x is not None and x.val == val:
+            path.append(x)
+            self.notify("found", x, extra=path)
+            if step_callback:
+                step_callback(f"找到节点 {val}（频率：{x.freq}）")
+            return x
+        self.notify("not_found", None, extra=path)
+        if step_callback:
+            step_callback(f"未找到节点 {val}")
+        return None
+
+    def lower_bound(self, val, step_callback=None):
+        """首个 >= val 的节点，返回 (node, path)"""
+        path = []
+        res = self._find_prev(val, path).forward[0]
+        self.notify("trace_path", res, extra=path)
+        return res, path
+
+    def successor(self, val, step_callback=None):
+        path = []
+        res = self._find_prev(val, path).forward[0]
+        if res is not None and res.val == val:
+            res = res.forward[0]
+        self.notify("trace_path", res, extra=path)
+        return res, path
+
+    def predecessor(self, val, step_callback=None):
+        path = []
+        prev = self._find_prev(val, path)
+        res = prev if prev is not self.header else None
+        self.notify("trace_path", res, extra=path)
+        return res, path
+
+    def rank(self, val):
+        """小于 val 的元素个数（按频率计）"""
+        _, rank = self._find_update(val)
+        return rank[0]
+
+    def kth_smallest(self, k, step_callback=None):
+        """
+        第 k 小元素（1-based，按频率计），返回 (node, path, local_index)，与 BSTree.kth_smallest 一致
+        """
+        if step_callback:
+            step_callback(f"[kth] 选择第 {k} 小元素")
+        path = []
+        if not 1 <= k <= self.size:
+            self.notify("not_found", None, extra=path)
+            if step_callback:
+                step_callback("[kth] 未找到对应第 k 小（k 越界）")
+            return None, path, None
+        traversed = 0
+        x = self.header
+        for i in range(self.level - 1, -1, -1):
+            while x.forward[i] is not None and traversed + x.span[i] < k:
+                traversed += x.span[i]
+                x = x.forward[i]
+                path.append(x)
+        node = x.forward[0]
+        path.append(node)
+        local_index = k - traversed
+        self.notify("trace_path", node, extra=path)
+        if step_callback:
+            step_callback(f"[kth] 找到：节点 {node.val}，是其第 {local_index} 次")
+        return node, path, local_index
+
+    def range(self, lo=None, hi=None):
+        """按序产出 lo <= 值 < hi 的 (值, 频率)"""
+        x = self.header.forward[0] if lo is None else self._find_prev(lo).forward[0]
+        while x is not None and (hi is None or x.val < hi):
+            yield x.val, x.freq
+            x = x.forward[0]
+
+    def nodes(self):
+        x = self.header.forward[0]
+        while x is not None:
+            yield x
+            x = x.forward[0]
+
+    def inorder(self):
+        res = []
+        for x in self.nodes():
+            res.extend([x.val] * x.freq)
+        return res
+
+    def build_random(self, n=7, value_range=(0, 100), step_callback=None):
+        low, high = value_range
+        self.header = SkipNode(None, MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+        if n <= 0:
+            self.notify("build", None, extra=[])
+            return []
+        rng = high - low + 1
+        if n <= rng:
+            values = random.sample(range(low, high + 1), n)
+        else:
+            values = random.choices(range(low, high + 1), k=n)
+        if step_callback:
+            step_callback(f"[build_random] 值序列: {values}")
+        for v in values:
+            self.insert(v, step_callback=step_callback)
+        self.notify("build", None, extra=values)
+        return values
+
+    # ---------- 可视化数据 ----------
+    def get_visual_data(self):
+        """
+        返回 {"nodes": [(val, freq, level)], "links": [(层, 起点下标, 终点下标, 跨度)]}
+        下标 0 为表头，1.. 为第 0 层上的各个节点，终点为 None 表示指向表尾
+        """
+        nodes = list(self.nodes())
+        index = {id(n): i + 1 for i, n in enumerate(nodes)}
+        index[id(self.header)] = 0
+        links = []
+        for src in [self.header] + nodes:
+            for i in range(min(src.level, self.level)):
+                dst = src.forward[i]
+                links.append((i, index[id(src)], index[id(dst)] if dst else None, src.span[i]))
+        return {
+            "nodes": [(n.val, n.freq, n.level) for n in nodes],
+            "links": links,
+            "level": self.level,
+        }
@@ -0,0 +1,263 @@
+# core/splay_tree.py
+# 伸展树：每次访问后把目标节点旋转到根，热点键的访问路径会越来越短
+# 单次操作均摊 O(log n)；访问分布越倾斜（如 Zipf），相对 AVL 的优势越明显
+# 接口与 AVLTree / BSTree 一致，旋转时发出 rotation_prepare / rotation 事件，可直接复用旋转动画
+import random
+
+
+class SplayNode:
+    def __init__(self, val):
+        self.val = val
+        self.freq = 1
+        self.left = None
+        self.right = None
+        self.parent = None
+
+
+class SplayTree:
+    def __init__(self):
+        self.root = None
+        self.listeners = []
+        self.rotations = 0  # 累计旋转次数（基准测试使用）
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    def notify(self, action, node=None, extra=None):
+        for f in self.listeners:
+            f({"action": action, "node": node, "tree": self.root, "extra": extra})
+
+    def clear(self):
+        self.root = None
+        self.notify("build", None, extra=[])
+
+    # ---------- 旋转与伸展 ----------
+    def _rotate(self, x):
+        """把 x 旋转到其父节点的位置"""
+        p = x.parent
+        g = p.parent
+        kind = "right" if x is p.left else "left"
+        listening = bool(self.listeners)  # 没有监听器时跳过事件构造（伸展时旋转很频繁）
+        if listening:
+            self.notify("rotation_prepare", node=p, extra={"type": kind, "pivot": x.val})
+
+        if kind == "right":
+            p.left = x.right
+            if x.right:
+                x.right.parent = p
+            x.right = p
+        else:
+            p.right = x.left
+            if x.left:
+                x.left.parent = p
+            x.left = p
+        p.parent = x
+        x.parent = g
+        if g is None:
+            self.root = x
+        elif g.left is p:
+            g.left = x
+        else:
+            g.right = x
+
+        self.rotations += 1
+        if listening:
+            self.notify("rotation", node=x, extra={"type": kind, "pivot": x.val})
+
+    def _splay(self, x, step_callback=None):
+        if x is None or x is self.root:
+            return
+        if step_callback:
+            step_callback(f"伸展节点 {x.val} 到根")
+        while x.parent:
+            p = x.parent
+            g = p.parent
+            if g is None:
+                # zig：父节点就是根
+                self._rotate(x)
+            elif (x is p.left) == (p is g.left):
+                # zig-zig：同侧，先转父节点再转自己
+                self._rotate(p)
+                self._rotate(x)
+            else:
+                # zig-zag：异侧，连续两次转自己
+                self._rotate(x)
+                self._rotate(x)
+        self.notify("splay_complete", x, extra={})
+
+    def _descend(self, val):
+        """沿查找路径下降，返回 (命中节点或 None, 路径)"""
+        cur = self.root
+        path = []
+        while cur:
+            path.append(cur)
+            if val == cur.val:
+                return cur, path
+            cur = cur.left if val < cur.val else cur.right
+        return None, path
+
+    # ---------- 插入 / 删除 ----------
+    def insert(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始插入值：{val}")
+        node, path = self._descend(val)
+        if node:
+            node.freq += 1
+            if step_callback:
+                step_callback(f"节点 {val} 已存在，频率+1 -> {node.freq}")
+            self.notify("increase_freq", node, extra=path)
+        else:
+            node = SplayNode(val)
+            parent = path[-1] if path else None
+            node.parent = parent
+            if parent is None:
+                self.root = node
+            elif val < parent.val:
+                parent.left = node
+            else:
+                parent.right = node
+            path.append(node)
+            self.notify("bst_insert_complete", node, extra=path)
+            if step_callback:
+                step_callback(f"BST插入完成：节点 {val}")
+        self._splay(node, step_callback)
+        self.notify("balance_complete", self.root, {})
+        return self.root
+
+    def delete(self, val, step_callback=None):
+        """删除一个 val（频率>1 时只减频率），返回是否删除成功"""
+        if step_callback:
+            step_callback(f"开始删除值：{val}")
+        node, path = self._descend(val)
+        if node is None:
+            # 未找到时伸展最后访问的节点，保持均摊复杂度
+            self._splay(path[-1] if path else None, step_callback)
+            self.notify("bst_delete_complete", None, extra=path)
+            if step_callback:
+                step_callback(f"未找到节点 {val}")
+            return False
+
+        self._splay(node, step_callback)
+        if node.freq > 1:
+            node.freq -= 1
+            if step_callback:
+                step_callback(f"节点 {val} 频率-1 -> {node.freq}")
+            self.notify("decrease_freq", node, extra=path)
+            return True
+
+        left, right = node.left, node.right
+        if left:
+            left.parent = None
+        if right:
+            right.parent = None
+        if left is None:
+            self.root = right
+        else:
+            # 把左子树的最大节点伸展到左子树的根，它没有右孩子，直接挂上右子树
+            self.root = left
+            top = left
+            while top.right:
+                top = top.right
+            self._splay(top, step_callback)
+            top.right = right
+            if right:
+                right.parent = top
+        self.notify("bst_delete_complete", node, extra=path)
+        if step_callback:
+            step_callback(f"删除完成：节点 {val}")
+        self.notify("balance_complete", self.root, {})
+        return True
+
+    # ---------- 查询（访问后伸展） ----------
+    def search(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"开始查找值：{val}")
+        node, path = self._descend(val)
+        if node:
+            self.notify("found", node, extra=path)
+            if step_callback:
+                step_callback(f"找到节点 {val}（频率：{node.freq}）")
+        else:
+            self.notify("not_found", None, extra=path)
+            if step_callback:
+                step_callback(f"未找到节点 {val}")
+        self._splay(node or (path[-1] if path else None), step_callback)
+        return node
+
+    def _bound(self, val, pick, step_callback):
+        """pick(cur) 返回 (是否为候选, 是否向左)；结束后伸展候选节点"""
+        cur = self.root
+        res = None
+        path = []
+        while cur:
+            path.append(cur)
+            ok, go_left = pick(cur)
+            if ok:
+                res = cur
+            cur = cur.left if go_left else cur.right
+        self.notify("trace_path", res, extra=list(path))
+        self._splay(res or (path[-1] if path else None), step_callback)
+        return res, path
+
+    def lower_bound(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的lower_bound（首个≥{val}的节点）")
+        return self._bound(val, lambda n: (n.val >= val, n.val >= val), step_callback)
+
+    def successor(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的后继（中序遍历后一个节点）")
+        return self._bound(val, lambda n: (n.val > val, n.val > val), step_callback)
+
+    def predecessor(self, val, step_callback=None):
+        if step_callback:
+            step_callback(f"查找值 {val} 的前驱（中序遍历前一个节点）")
+        return self._bound(val, lambda n: (n.val < val, n.val >= val), step_callback)
+
+    def inorder(self):
+        res = []
+        stack = []
+        cur = self.root
+        while stack or cur:
+            while cur:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            res.extend([cur.val] * cur.freq)
+            cur = cur.right
+        return res
+
+    def height(self):
+        h = 0
+        level = [self.root] if self.root else []
+        while level:
+            h += 1
+            level = [c for n in level for c in (n.left, n.right) if c]
+        return h
+
+    def build_random(self, n=7, value_range=(1, 100), step_callback=None):
+        low, high = value_range
+        if n <= 0:
+            self.clear()
+            if step_callback:
+                step_callback("清空树，生成空伸展树")
+            return []
+
+        rng = high - low + 1
+        if n <= rng:
+            values = random.sample(range(low, high + 1), n)
+        else:
+            values = random.choices(range(low, high + 1), k=n)
+        random.shuffle(values)
+
+        if step_callback:
+            step_callback(f"随机生成值序列：{values}")
+
+        self.root = None
+        for i, v in enumerate(values):
+            self.insert(v, step_callback=step_callback)
+            if step_callback:
+                step_callback(f"插入第 {i+1} 个节点：{v}")
+
+        self.notify("build", None, extra=values)
+        return values
@@ -1,39 +1,39 @@
 # core/stack.py
+# 栈：数组末尾就是栈顶，push / pop 都是 list.append / list.pop，真正 O(1)
+# 元素只保存数据本身；可视化坐标在 get_visual_data() 时只为可见的若干个元素计算
 from typing import Any, Optional, List as PyList
 
 class Stack:
     """
-    栈（基于链表实现）
+    栈（基于数组实现）
     遵循LIFO（后进先出）原则
+    - 有界模式（默认，供可视化窗口使用）：容量 MAX_SIZE，数据范围 [MIN_VAL, MAX_VAL]
+    - 可扩展模式（unbounded=True）：不限容量与取值，可视化只返回栈顶附近的 VISIBLE_NODES 个元素
     """
-    MAX_SIZE = 10  # 最大栈容量
+    MAX_SIZE = 10  # 最大栈容量（有界模式）
     MIN_VAL = -99  # 数据最小值
     MAX_VAL = 99  # 数据最大值
+    VISIBLE_NODES = 10  # 可扩展模式下 get_visual_data 默认返回的元素个数
 
-    def __init__(self):
-        # 栈节点定义（内部类）
-        class Node:
-            def __init__(self, data: Any):
-                self.data: Any = data
-                self.next: Optional['Node'] = None
-                # 可视化属性
-                self.x: int = 350  # 栈节点X坐标（居中）
-                self.y: int = 0     # 栈节点Y坐标（垂直排列）
-                self.color: str = "#FFFFFF"  # 背景色
-                self.label: str = str(data)  # 显示文本
-
-        self.Node = Node  # 内部Node类
-        self.top: Optional[Node] = None  # 栈顶指针
-        self.size: int = 0  # 当前栈大小
-        self.nodes: PyList[Node] = []  # 存储所有节点（用于可视化）
+    def __init__(self, unbounded: bool = False):
+        self.items: PyList[Any] = []  # 栈底 -> 栈顶
+        self.unbounded: bool = unbounded
+
+    @property
+    def size(self) -> int:
+        """当前栈大小"""
+        return len(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
 
     def is_empty(self) -> bool:
         """判断栈是否为空"""
-        return self.size == 0
+        return not self.items
 
     def is_full(self) -> bool:
-        """判断栈是否已满"""
-        return self.size >= self.MAX_SIZE
+        """判断栈是否已满（可扩展模式永不满）"""
+        return not self.unbounded and len(self.items) >= self.MAX_SIZE
 
     # ------------------------------ 核心操作 ------------------------------
     def push(self, data: Any) -> None:
@@ -41,74 +41,98 @@ class Stack:
         入栈（O(1)）
         :param data: 入栈数据
         """
-        if self.is_full():
-            raise ValueError(f"栈已满（最大容量{self.MAX_SIZE}）")
-        if not (self.MIN_VAL <= data <= self.MAX_VAL):
-            raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
-
-        # 创建新节点
-        new_node = self.Node(data)
-        # 新节点成为新栈顶
-        new_node.next = self.top
-        self.top = new_node
-        # 更新节点位置（垂直排列：栈顶在上，依次向下）
-        self._update_layout()
-        self.size += 1
-        self.nodes.insert(0, new_node)  # 栈顶节点插入列表头部
+        if not self.unbounded:
+            if self.is_full():
+                raise ValueError(f"栈已满（最大容量{self.MAX_SIZE}）")
+            if not (self.MIN_VAL <= data <= self.MAX_VAL):
+                raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+        self.items.append(data)
+
+    def push_many(self, iterable, top_first: bool = False) -> int:
+        """
+        批量入栈（O(k)），等价于依次 push
+        :param top_first: 为 True 时 iterable 按 [栈顶, ..., 栈底] 排列（即 to_list() / 保存文件的顺序）
+        :return: 入栈的元素个数
+        """
+        if top_first:
+            values = list(iterable)
+            values.reverse()
+        elif self.unbounded:
+            # 可扩展模式直接消费迭代器
+            before = len(self.items)
+            self.items.extend(iterable)
+            return len(self.items) - before
+        else:
+            values = list(iterable)
+
+        if not self.unbounded:
+            if len(self.items) + len(values) > self.MAX_SIZE:
+                raise ValueError(f"栈已满（最大容量{self.MAX_SIZE}）")
+            for data in values:
+                if not (self.MIN_VAL <= data <= self.MAX_VAL):
+                    raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+        if self.items:
+            self.items.extend(values)
+        else:
+            self.items = values  # 空栈直接接管已经物化的列表，不再复制
+        return len(values)
+
+    @classmethod
+    def from_iterable(cls, iterable, unbounded: bool = False, top_first: bool = False) -> "Stack":
+        """由可迭代对象构建栈（默认 iterable 的最后一个元素为栈顶）"""
+        stack = cls(unbounded=unbounded)
+        stack.push_many(iterable, top_first=top_first)
+        return stack
 
     def pop(self) -> Optional[Any]:
         """
         出栈（O(1)）
         :return: 出栈数据
         """
-        if self.is_empty():
+        if not self.items:
             raise IndexError("空栈无法出栈")
-
-        # 栈顶节点出栈
-        popped_node = self.top
-        self.top = self.top.next
-        # 清理节点指针
-        popped_data = popped_node.data
-        popped_node.next = None
-        # 更新布局
-        self.size -= 1
-        self.nodes.pop(0)  # 移除栈顶节点
-        self._update_layout()
-
-        return popped_data
+        return self.items.pop()
 
     def peek(self) -> Optional[Any]:
         """
         查看栈顶元素（O(1)）
         :return: 栈顶数据
         """
-        if self.is_empty():
+        if not self.items:
             return None
-        return self.top.data
+        return self.items[-1]
 
     # ------------------------------ 可视化支持 ------------------------------
-    def _update_layout(self):
-        """更新所有节点的位置（垂直排列）"""
-        for i, node in enumerate(self.nodes):
-            # 栈顶在上方，每个节点间隔50像素
-            node.y = 100 + i * 50
-
-    def get_visual_data(self) -> dict:
-        """获取可视化所需数据"""
+    def get_visual_data(self, start: int = 0, count: Optional[int] = None) -> dict:
+        """
+        获取可视化所需数据，nodes 按 [栈顶, ..., 栈底] 排列
+        :param start: 可扩展模式下从栈顶往下数的起始位置
+        :param count: 可扩展模式下返回的元素个数（默认 VISIBLE_NODES）
+        坐标只为返回的元素计算：栈顶在上方，每个节点间隔50像素
+        """
+        if not self.unbounded:
+            start, count = 0, len(self.items)
+        elif count is None:
+            count = self.VISIBLE_NODES
+        start = max(start, 0)
+        stop = min(len(self.items), start + count)
+
         visual_data = {
-            "size": self.size,
-            "max_size": self.MAX_SIZE,
+            "size": len(self.items),
+            "max_size": self.MAX_SIZE if not self.unbounded else None,
+            "start": start,
             "nodes": []
         }
 
-        # 节点数据
-        for i, node in enumerate(self.nodes):
+        top = len(self.items) - 1
+        for i in range(start, stop):
+            data = self.items[top - i]
             visual_data["nodes"].append({
-                "data": node.data,
-                "x": node.x,
-                "y": node.y,
-                "color": node.color,
-                "label": node.label,
+                "data": data,
+                "x": 350,
+                "y": 100 + (i - start) * 50,
+                "color": "#FFFFFF",
+                "label": str(data),
                 "is_top": i == 0  # 第一个节点是栈顶
             })
 
@@ -117,10 +141,8 @@ class Stack:
     # ------------------------------ 辅助操作 ------------------------------
     def clear(self) -> None:
         """清空栈"""
-        self.top = None
-        self.size = 0
-        self.nodes.clear()
+        self.items.clear()
 
     def to_list(self) -> PyList[Any]:
         """转换为Python列表（栈顶在前）"""
-        return [node.data for node in self.nodes]
\ No newline at end of file
+        return self.items[::-1]
@@ -0,0 +1,116 @@
+# core/tree_cursor.py
+# 树游标（finger）：持有一个节点，借助 parent 指针前后移动，不必每次从根重新下降
+# - next() / prev()：中序后继 / 前驱，遍历整棵树总共只走 O(n) 条边，均摊 O(1)
+# - seek(val)：从当前节点向上爬到覆盖 val 的最小子树再向下，代价 O(log d)，d 为移动的距离
+# 适用于带 val/freq/left/right/parent 的节点（AVLTree / BSTree）；树被修改后应重新 seek
+
+
+def _leftmost(node):
+    while node.left:
+        node = node.left
+    return node
+
+
+def _rightmost(node):
+    while node.right:
+        node = node.right
+    return node
+
+
+def _next_node(node):
+    if node.right:
+        return _leftmost(node.right)
+    while node.parent and node is node.parent.right:
+        node = node.parent
+    return node.parent
+
+
+def _prev_node(node):
+    if node.left:
+        return _rightmost(node.left)
+    while node.parent and node is node.parent.left:
+        node = node.parent
+    return node.parent
+
+
+class TreeCursor:
+    def __init__(self, tree, node=None):
+        self.tree = tree
+        self.node = node
+
+    @property
+    def valid(self):
+        return self.node is not None
+
+    @property
+    def val(self):
+        return self.node.val if self.node else None
+
+    @property
+    def freq(self):
+        return self.node.freq if self.node else 0
+
+    def first(self):
+        root = self.tree.root
+        self.node = _leftmost(root) if root else None
+        return self.node
+
+    def last(self):
+        root = self.tree.root
+        self.node = _rightmost(root) if root else None
+        return self.node
+
+    def next(self):
+        """移到中序后继并返回；已是最后一个时返回 None，游标停在原处"""
+        if self.node is None:
+            return None
+        nxt = _next_node(self.node)
+        if nxt is not None:
+            self.node = nxt
+        return nxt
+
+    def prev(self):
+        """移到中序前驱并返回；已是第一个时返回 None，游标停在原处"""
+        if self.node is None:
+            return None
+        prv = _prev_node(self.node)
+        if prv is not None:
+            self.node = prv
+        return prv
+
+    def seek(self, val):
+        """移到首个 >= val 的节点（lower_bound）并返回；不存在时游标失效并返回 None"""
+        x = self.node or self.tree.root
+        if x is None:
+            return None
+        # 向上爬：直到 val 落在 x 的子树范围内（或已到根）
+        # 向右找时，子树内没有 >= val 的节点则答案就是父节点，由下面的 _next_node 处理
+        if val > x.val:
+            while x.parent and not (x is x.parent.left and val <= x.parent.val):
+                x = x.parent
+        elif val < x.val:
+            while x.parent and not (x is x.parent.right and val > x.parent.val):
+                x = x.parent
+        # 在子树内向下找 lower_bound
+        res = None
+        last = x
+        cur = x
+        while cur:
+            last = cur
+            if cur.val >= val:
+                res = cur
+                cur = cur.left
+            else:
+                cur = cur.right
+        if res is None:
+            # 子树内全部 < val：答案是子树之后的中序后继
+            res = _next_node(last)
+        self.node = res
+        return res
+
+    def __iter__(self):
+        """从当前位置（含）向后按序产出节点"""
+        node = self.node
+        while node is not None:
+            yield node
+            node = _next_node(node)
@@ -0,0 +1,41 @@
+# core/tree_mixins.py
+# AVLTree / BSTree 共用的只读查询接口（宿主类需提供 self.root，节点有 val / left / right）
+# 具体实现都在各自模块中，这里只负责按需导入并转发
+
+
+class TreeQueryMixin:
+    # ---------- 游标（见 core/tree_cursor.py） ----------
+    def cursor(self, val=None):
+        """返回 TreeCursor：val 为 None 时定位到最小节点，否则定位到首个 >= val 的节点"""
+        from core.tree_cursor import TreeCursor
+
+        cur = TreeCursor(self)
+        if val is None:
+            cur.first()
+        else:
+            cur.seek(val)
+        return cur
+
+    # ---------- 批量查询（见 core/batch_query.py），不触发逐键事件 ----------
+    def search_many(self, keys):
+        """批量精确查找，返回与 keys 等长的节点列表（未找到为 None）"""
+        from core import batch_query
+
+        return batch_query.search_many(self.root, keys, size=self._batch_size())
+
+    def lower_bound_many(self, keys):
+        """批量 lower_bound，返回与 keys 等长的节点列表（无首个≥键的节点为 None）"""
+        from core import batch_query
+
+        return batch_query.lower_bound_many(self.root, keys, size=self._batch_size())
+
+    def _batch_size(self):
+        # BSTNode 维护子树大小 sz，可直接给出节点数；AVLNode 没有，返回 None 由 batch_query 按树高估计
+        return getattr(self.root, "sz", None)
+
+    # ---------- 只读冻结索引（见 core/frozen_index.py） ----------
+    def freeze(self):
+        """生成当前内容的不可变 FrozenIndex（迭代遍历，退化树同样适用），支持整批键的 search/lower_bound/rank/count_range"""
+        from core.frozen_index import FrozenIndex
+
+        return FrozenIndex.from_tree(self.root)
@@ -0,0 +1,323 @@
+# core/unrolled_list.py
+# 块状链表（unrolled linked list）：每个块保存一个容量固定的小数组，块之间再用 next / prev 指针相连
+# 遍历时大部分时间在块内顺序扫描，指针跳转次数降为 n / 容量；按下标定位也按块跳过
+# 插入使块溢出时对半分裂，删除使块低于半满时与后继块合并或从后继块借元素
+# 公共接口与 core.list.List 一致（单链表 / 双链表、头尾插删、按下标插删、contains、可视化数据）；
+# 元素不是独立节点，按值查找用 index_of 返回下标，不提供返回节点的 find
+import itertools
+from typing import Any, List as PyList, Optional
+
+_next_block_id = itertools.count(1).__next__
+
+
+class Block:
+    """一个块：items 为块内元素（Python 列表，长度不超过容量）"""
+    __slots__ = ("items", "id", "next", "prev")
+
+    def __init__(self, items=None):
+        self.items: list = items if items is not None else []
+        self.id: int = _next_block_id()
+        self.next: Optional["Block"] = None
+        self.prev: Optional["Block"] = None  # 双链表专用
+
+    def __repr__(self):
+        return f"Block(id={self.id}, items={self.items})"
+
+
+class UnrolledList:
+    """
+    块状链表
+    - 单链表(singly)：块之间只有 next 指针，尾删除需要找前驱块（O(n / 容量)）
+    - 双链表(doubly)：块之间有 next 和 prev 指针
+    """
+    MAX_NODES = 15  # 最大元素数限制（与 List 一致）
+    MIN_VAL = -99
+    MAX_VAL = 99
+    VISIBLE_NODES = 30
+    DEFAULT_CAPACITY = 16
+
+    def __init__(self, mode: str = "singly", capacity: int = DEFAULT_CAPACITY, unbounded: bool = False):
+        if mode not in ["singly", "doubly"]:
+            raise ValueError("模式仅支持 'singly'（单链表）或 'doubly'（双链表）")
+        if capacity < 2:
+            raise ValueError("块容量至少为 2")
+
+        self.mode: str = mode
+        self.capacity: int = capacity
+        self.unbounded: bool = unbounded
+        self.head: Optional[Block] = None  # 头块
+        self.tail: Optional[Block] = None  # 尾块
+        self.size: int = 0                 # 元素总数
+        self.blocks: int = 0               # 块数
+
+    def is_doubly(self) -> bool:
+        return self.mode == "doubly"
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def _check_insert(self, data: Any) -> None:
+        if self.unbounded:
+            return
+        if self.size >= self.MAX_NODES:
+            raise ValueError(f"链表已满（最大{self.MAX_NODES}个节点）")
+        if not (self.MIN_VAL <= data <= self.MAX_VAL):
+            raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+
+    # ------------------------------ 块维护 ------------------------------
+    def _link_after(self, block: Optional[Block], new: Block) -> None:
+        """把 new 接在 block 之后（block 为 None 时作为头块）"""
+        if block is None:
+            new.next = self.head
+            self.head = new
+        else:
+            new.next = block.next
+            block.next = new
+        if self.is_doubly():
+            new.prev = block
+            if new.next:
+                new.next.prev = new
+        if new.next is None:
+            self.tail = new
+        self.blocks += 1
+
+    def _unlink(self, block: Block, prev: Optional[Block]) -> None:
+        """摘除 block，prev 为其前驱块（头块时为 None）"""
+        if prev is None:
+            self.head = block.next
+        else:
+            prev.next = block.next
+        if self.is_doubly() and block.next:
+            block.next.prev = prev
+        if block is self.tail:
+            self.tail = prev
+        block.next = block.prev = None
+        self.blocks -= 1
+
+    def _locate(self, index: int, for_insert: bool = False):
+        """
+        返回 (块, 块内偏移, 前驱块)
+        for_insert 时 index 可以等于某块长度（插在块尾），index == size 落在尾块末尾
+        """
+        prev = None
+        block = self.head
+        while True:
+            n = len(block.items)
+            if index < n or (for_insert and index == n and block.next is None):
+                return block, index, prev
+            index -= n
+            prev = block
+            block = block.next
+
+    def _split(self, block: Block) -> None:
+        """块溢出：后一半移到新块"""
+        half = len(block.items) // 2
+        new = Block(block.items[half:])
+        del block.items[half:]
+        self._link_after(block, new)
+
+    def _rebalance(self, block: Block, prev: Optional[Block]) -> None:
+        """块低于半满：与后继合并，或从后继借元素；空块直接摘除"""
+        items = block.items
+        nxt = block.next
+        if nxt is not None and len(items) < self.capacity // 2:
+            if len(items) + len(nxt.items) <= self.capacity:
+                items.extend(nxt.items)
+                self._unlink(nxt, block)
+            else:
+                take = (len(nxt.items) - len(items)) // 2
+                items.extend(nxt.items[:take])
+                del nxt.items[:take]
+        if not items:
+            self._unlink(block, prev)
+
+    # ------------------------------ 插入操作 ------------------------------
+    def insert_head(self, data: Any) -> None:
+        self.insert_at_index(data, 0)
+
+    def insert_tail(self, data: Any) -> None:
+        self._check_insert(data)
+        # 尾块满了就新开一块（顺序追加时块保持全满，不做对半分裂）
+        if self.tail is None or len(self.tail.items) >= self.capacity:
+            self._link_after(self.tail, Block())
+        self.tail.items.append(data)
+        self.size += 1
+
+    def insert_at_index(self, data: Any, index: int) -> None:
+        if index < 0 or index > self.size:
+            raise IndexError(f"索引越界，有效范围[0, {self.size}]")
+        if index == self.size:
+            self.insert_tail(data)
+            return
+        self._check_insert(data)
+        block, offset, _ = self._locate(index, for_insert=True)
+        block.items.insert(offset, data)
+        if len(block.items) > self.capacity:
+            self._split(block)
+        self.size += 1
+
+    def extend(self, iterable) -> int:
+        """批量尾插入：依次填满尾块、满了再开新块，与逐个 insert_tail 结果相同但没有逐元素的调用开销"""
+        if not self.unbounded:
+            iterable = list(iterable)
+            if self.size + len(iterable) > self.MAX_NODES:
+                raise ValueError(f"链表已满（最大{self.MAX_NODES}个节点）")
+            for data in iterable:
+                if not (self.MIN_VAL <= data <= self.MAX_VAL):
+                    raise ValueError(f"数据需在[{self.MIN_VAL}, {self.MAX_VAL}]范围内")
+
+        count = 0
+        capacity = self.capacity
+        items = self.tail.items if self.tail else None
+        for data in iterable:
+            if items is None or len(items) >= capacity:
+                self._link_after(self.tail, Block())
+                items = self.tail.items
+            items.append(data)
+            self.size += 1
+            count += 1
+        return count
+
+    @classmethod
+    def from_iterable(cls, iterable, mode: str = "singly", capacity: int = DEFAULT_CAPACITY,
+                      unbounded: bool = False) -> "UnrolledList":
+        lst = cls(mode, capacity=capacity, unbounded=unbounded)
+        lst.extend(iterable)
+        return lst
+
+    # ------------------------------ 删除操作 ------------------------------
+    def delete_head(self) -> Optional[Any]:
+        if self.is_empty():
+            raise IndexError("空链表无法删除")
+        return self.delete_at_index(0)
+
+    def delete_tail(self) -> Optional[Any]:
+        """尾删除（双链表 O(1)；单链表只有尾块被删空时才需要找前驱块）"""
+        if self.is_empty():
+            raise IndexError("空链表无法删除")
+        block = self.tail
+        data = block.items.pop()
+        if not block.items:
+            if self.is_doubly():
+                prev = block.prev
+            else:
+                prev = None if block is self.head else self._locate(self.size - 2)[0]
+            self._unlink(block, prev)
+        self.size -= 1
+        return data
+
+    def delete_at_index(self, index: int) -> Optional[Any]:
+        if self.is_empty():
+            raise IndexError("空链表无法删除")
+        if index < 0 or index >= self.size:
+            raise IndexError(f"索引越界，有效范围[0, {self.size-1}]")
+        block, offset, prev = self._locate(index)
+        data = block.items.pop(offset)
+        self._rebalance(block, prev)
+        self.size -= 1
+        return data
+
+    # ------------------------------ 查找 / 遍历 ------------------------------
+    def index_of(self, value: Any) -> Optional[int]:
+        """返回 value 第一次出现的下标，未找到返回 None（块内用 list.index 扫描）"""
+        base = 0
+        block = self.head
+        while block:
+            items = block.items
+            if value in items:
+                return base + items.index(value)
+            base += len(items)
+            block = block.next
+        return None
+
+    def contains(self, value: Any) -> bool:
+        return self.index_of(value) is not None
+
+    def get(self, index: int) -> Any:
+        if index < 0 or index >= self.size:
+            raise IndexError(f"索引越界，有效范围[0, {self.size-1}]")
+        block, offset, _ = self._locate(index)
+        return block.items[offset]
+
+    def __iter__(self):
+        block = self.head
+        while block:
+            yield from block.items
+            block = block.next
+
+    def to_list(self) -> PyList[Any]:
+        result = []
+        block = self.head
+        while block:
+            result.extend(block.items)
+            block = block.next
+        return result
+
+    def clear(self) -> None:
+        block = self.head
+        while block:
+            nxt = block.next
+            block.next = block.prev = None
+            block = nxt
+        self.head = self.tail = None
+        self.size = 0
+        self.blocks = 0
+
+    # ------------------------------ 可视化 ------------------------------
+    def get_visual_data(self, start: int = 0, count: Optional[int] = None) -> dict:
+        """
+        与 List.get_visual_data 相同的 nodes / edges 结构，外加 blocks：
+        每个块一项 {"id", "start"（块内首元素在 nodes 中的位置）, "count", "capacity"}
+        元素 id 为 (块 id, 块内偏移)；同一块内的元素连续存放，没有指针，只在相邻块之间画 next / prev 边
+        """
+        if not self.unbounded:
+            start, count = 0, self.size
+        elif count is None:
+            count = self.VISIBLE_NODES
+        start = max(start, 0)
+        stop = min(self.size, start + count)
+
+        visual_data = {
+            "mode": self.mode,
+            "size": self.size,
+            "start": start,
+            "capacity": self.capacity,
+            "nodes": [],
+            "edges": [],
+            "blocks": [],
+        }
+        nodes = visual_data["nodes"]
+        edges = visual_data["edges"]
+        base = 0
+        block = self.head
+        prev_last = None  # 上一个可见块的最后一个元素 id
+        while block and base < stop:
+            n = len(block.items)
+            lo, hi = max(start, base), min(stop, base + n)
+            if lo < hi:
+                first = (block.id, lo - base)
+                if prev_last is not None:
+                    edges.append({"source_id": prev_last, "target_id": first, "type": "next",
+                                  "color": "#008000", "idx": len(edges)})
+                    if self.is_doubly():
+                        edges.append({"source_id": first, "target_id": prev_last, "type": "prev",
+                                      "color": "#FFA500", "idx": len(edges) + 5000})
+                visual_data["blocks"].append({"id": block.id, "start": len(nodes), "count": hi - lo,
+                                              "capacity": self.capacity})
+                for idx in range(lo, hi):
+                    data = block.items[idx - base]
+                    nodes.append({
+                        "id": (block.id, idx - base),
+                        "data": data,
+                        "vtx_idx": idx,
+                        "x": 50 + (idx - start) * 80,
+                        "y": 100,
+                        "color": "#FFFFFF",
+                        "label": str(data),
+                        "is_head": idx == 0,
+                        "is_tail": idx == self.size - 1,
+                    })
+                prev_last = (block.id, hi - 1 - base)
+            base += n
+            block = block.next
+        return visual_data
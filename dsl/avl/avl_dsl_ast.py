@@ -1,6 +1,9 @@
 # dsl/avl/avl_dsl_ast.py
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
+
+# 键：普通树为整数，区间树为 (lo, hi) 元组
+Key = Union[int, Tuple[int, int]]
 
 @dataclass
 class Statement:
@@ -15,17 +18,17 @@ class ClearStatement(Statement):
 @dataclass
 class InsertStatement(Statement):
     """插入语句"""
-    value: int
+    value: Key
 
 @dataclass
 class DeleteStatement(Statement):
     """删除语句"""
-    value: int
+    value: Key
 
 @dataclass
 class SearchStatement(Statement):
     """查找语句"""
-    value: int
+    value: Key
 
 @dataclass
 class InorderStatement(Statement):
@@ -40,17 +43,23 @@ class RandomStatement(Statement):
 @dataclass
 class PredecessorStatement(Statement):
     """查找前驱语句"""
-    value: int
+    value: Key
 
 @dataclass
 class SuccessorStatement(Statement):
     """查找后继语句"""
-    value: int
+    value: Key
 
 @dataclass
 class LowerBoundStatement(Statement):
     """查找下界语句"""
-    value: int
+    value: Key
+
+@dataclass
+class OverlapStatement(Statement):
+    """区间重叠查询语句（仅区间树）"""
+    lo: int
+    hi: int
 
 @dataclass
 class DelayStatement(Statement):
@@ -2,7 +2,7 @@
 from .avl_dsl_ast import (
     Program, ClearStatement, InsertStatement, DeleteStatement,
     SearchStatement, InorderStatement, RandomStatement, PredecessorStatement,
-    SuccessorStatement, LowerBoundStatement, DelayStatement
+    SuccessorStatement, LowerBoundStatement, OverlapStatement, DelayStatement
 )
 from core.avl_tree import AVLTree
 from PySide6.QtCore import QTimer, QCoreApplication
@@ -35,6 +35,14 @@ class AVLDslExecutor:
         self.current_statement += 1
         self.log_callback(f"执行: {stmt}")
 
+        # 语句由 QTimer 逐条调度，异常不会回到 run_dsl 的 try 中：在这里记录错误并终止脚本
+        try:
+            self._dispatch(stmt)
+        except (ValueError, TypeError, IndexError) as e:
+            self.log_callback(f"执行错误（第{self.current_statement}条语句）: {e}")
+            self.log_callback("=== DSL脚本已终止 ===")
+
+    def _dispatch(self, stmt):
         # 根据语句类型执行相应操作
         if isinstance(stmt, ClearStatement):
             self._execute_clear()
@@ -54,12 +62,14 @@ class AVLDslExecutor:
             self._execute_successor(stmt)
         elif isinstance(stmt, LowerBoundStatement):
             self._execute_lower_bound(stmt)
+        elif isinstance(stmt, OverlapStatement):
+            self._execute_overlap(stmt)
         elif isinstance(stmt, DelayStatement):
             self._execute_delay(stmt)
 
     def _execute_clear(self):
         """执行清空操作"""
-        self.tree.root = None
+        self.tree.clear()
         self.log_callback("树已清空")
         self.update_ui_callback()
         QTimer.singleShot(500, self._execute_next)
@@ -136,6 +146,15 @@ class AVLDslExecutor:
         self.log_callback(f"查找下界结果: {result}")
         QTimer.singleShot(1000, self._execute_next)
 
+    def _execute_overlap(self, stmt: OverlapStatement):
+        """执行区间重叠查询（区间树）"""
+        def step_callback(msg: str):
+            self.log_callback(f"重叠查询步骤: {msg}")
+
+        nodes = self.tree.overlap(stmt.lo, stmt.hi, step_callback)
+        self.log_callback(f"重叠查询结果: {[node.val for node in nodes]}")
+        QTimer.singleShot(1000, self._execute_next)
+
     def _execute_delay(self, stmt: DelayStatement):
         """执行延迟操作"""
         self.log_callback(f"延迟 {stmt.milliseconds} 毫秒")
@@ -2,7 +2,7 @@
 from .avl_dsl_ast import (
     Program, Statement, ClearStatement, InsertStatement, DeleteStatement,
     SearchStatement, InorderStatement, RandomStatement, PredecessorStatement,
-    SuccessorStatement, LowerBoundStatement, DelayStatement
+    SuccessorStatement, LowerBoundStatement, OverlapStatement, DelayStatement
 )
 import re
 from typing import List
@@ -15,22 +15,43 @@ class ParserError(Exception):
             message = f"第{line}行: {message}"
         super().__init__(message)
 
+# 键的写法：普通树为整数，区间树为 lo,hi
+_INT = r'(\d+)'
+_PAIR = r'(\d+)\s*,\s*(\d+)'
+_KEYED = ('insert', 'delete', 'search', 'predecessor', 'successor', 'lower_bound')
+
+
 class AVLDslParser:
-    """AVL树DSL解析器"""
-    def __init__(self):
+    """AVL树DSL解析器；interval=True 时键写成 lo,hi（区间树），并支持 overlap lo,hi"""
+    def __init__(self, interval: bool = False):
+        self.interval = interval
+        key = _PAIR if interval else _INT
         # 正则表达式匹配各种语句
         self.patterns = {
             'clear': re.compile(r'^\s*clear\s*$'),
-            'insert': re.compile(r'^\s*insert\s+(\d+)\s*$'),
-            'delete': re.compile(r'^\s*delete\s+(\d+)\s*$'),
-            'search': re.compile(r'^\s*search\s+(\d+)\s*$'),
+            'insert': re.compile(rf'^\s*insert\s+{key}\s*$'),
+            'delete': re.compile(rf'^\s*delete\s+{key}\s*$'),
+            'search': re.compile(rf'^\s*search\s+{key}\s*$'),
             'inorder': re.compile(r'^\s*inorder\s*$'),
             'random': re.compile(r'^\s*random\s+(\d+)\s*$'),
-            'predecessor': re.compile(r'^\s*predecessor\s+(\d+)\s*$'),
-            'successor': re.compile(r'^\s*successor\s+(\d+)\s*$'),
-            'lower_bound': re.compile(r'^\s*lower_bound\s+(\d+)\s*$'),
+            'predecessor': re.compile(rf'^\s*predecessor\s+{key}\s*$'),
+            'successor': re.compile(rf'^\s*successor\s+{key}\s*$'),
+            'lower_bound': re.compile(rf'^\s*lower_bound\s+{key}\s*$'),
             'delay': re.compile(r'^\s*delay\s+(\d+)\s*$')
         }
+        if interval:
+            self.patterns['overlap'] = re.compile(rf'^\s*overlap\s+{_PAIR}\s*$')
+        # 区间树里写成单个整数的键：给出明确的提示而不是“无效的语句”
+        self._scalar_key = re.compile(rf'^\s*({"|".join(_KEYED)})\s+\d+\s*$')
+
+    def _key(self, m, line_num: int):
+        """从匹配结果取出键：整数，或校验后的 (lo, hi)"""
+        if not self.interval:
+            return int(m.group(1))
+        lo, hi = int(m.group(1)), int(m.group(2))
+        if lo > hi:
+            raise ParserError(f"区间左端点不能大于右端点：{lo},{hi}", line_num)
+        return (lo, hi)
 
     def parse(self, code: str) -> Program:
         """解析DSL代码为AST"""
@@ -49,13 +70,13 @@ class AVLDslParser:
                 statements.append(ClearStatement())
                 matched = True
             elif m := self.patterns['insert'].match(line):
-                statements.append(InsertStatement(int(m.group(1))))
+                statements.append(InsertStatement(self._key(m, line_num)))
                 matched = True
             elif m := self.patterns['delete'].match(line):
-                statements.append(DeleteStatement(int(m.group(1))))
+                statements.append(DeleteStatement(self._key(m, line_num)))
                 matched = True
             elif m := self.patterns['search'].match(line):
-                statements.append(SearchStatement(int(m.group(1))))
+                statements.append(SearchStatement(self._key(m, line_num)))
                 matched = True
             elif self.patterns['inorder'].match(line):
                 statements.append(InorderStatement())
@@ -67,13 +88,17 @@ class AVLDslParser:
                 statements.append(RandomStatement(count))
                 matched = True
             elif m := self.patterns['predecessor'].match(line):
-                statements.append(PredecessorStatement(int(m.group(1))))
+                statements.append(PredecessorStatement(self._key(m, line_num)))
                 matched = True
             elif m := self.patterns['successor'].match(line):
-                statements.append(SuccessorStatement(int(m.group(1))))
+                statements.append(SuccessorStatement(self._key(m, line_num)))
                 matched = True
             elif m := self.patterns['lower_bound'].match(line):
-                statements.append(LowerBoundStatement(int(m.group(1))))
+                statements.append(LowerBoundStatement(self._key(m, line_num)))
+                matched = True
+            elif self.interval and (m := self.patterns['overlap'].match(line)):
+                lo, hi = self._key(m, line_num)
+                statements.append(OverlapStatement(lo, hi))
                 matched = True
             elif m := self.patterns['delay'].match(line):
                 ms = int(m.group(1))
@@ -83,6 +108,8 @@ class AVLDslParser:
                 matched = True
             
             if not matched:
+                if self.interval and (m := self._scalar_key.match(line)):
+                    raise ParserError(f"区间树的键是区间，请写成 {m.group(1)} lo,hi（如 {m.group(1)} 10,20）", line_num)
                 raise ParserError(f"无效的语句: {line}", line_num)
         
         return Program(statements)
\ No newline at end of file
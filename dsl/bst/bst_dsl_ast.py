@@ -42,6 +42,10 @@ class FindLowerBoundCmd(BSTCmd):
     def __init__(self, value):
         self.value = value
 
+class RebalanceCmd(BSTCmd):
+    """DSW重新平衡命令"""
+    pass
+
 class InorderCmd(BSTCmd):
     """中序遍历命令"""
     pass
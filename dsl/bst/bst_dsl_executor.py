@@ -80,6 +80,10 @@ class BSTDSLExecutor:
             node, path = w.tree.lower_bound(cmd.value, step_callback=w.add_step)
             w._animate_special_path("下界", cmd.value, node, path)
             
+        elif isinstance(cmd, RebalanceCmd):
+            w.add_step("DSL操作: DSW重新平衡")
+            w.tree.rebalance(step_callback=w.add_step)
+            
         elif isinstance(cmd, InorderCmd):
             seq = w.tree.inorder()
             seq_text = " -> ".join(map(str, seq))
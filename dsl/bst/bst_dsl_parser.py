@@ -73,6 +73,9 @@ class BSTDSLParser:
                 raise SyntaxError("find_lower_bound语法错误，正确格式: find_lower_bound 5")
             return FindLowerBoundCmd(int(parts[1]))
             
+        if line == "rebalance":
+            return RebalanceCmd()
+            
         if line == "inorder":
             return InorderCmd()
             
@@ -3,7 +3,7 @@
 from core.huffman_tree import HuffmanTree
 from dsl.huffman.huffman_dsl_parser import (
     ClearCmd, BuildCmd, DrawCmd,
-    ShowCodesCmd, SaveCmd, LoadCmd
+    ShowCodesCmd, ShowStatsCmd, SaveCmd, LoadCmd
 )
 
 
@@ -61,6 +61,9 @@ class HuffmanDSLExecutor:
         elif isinstance(cmd, ShowCodesCmd):
             self._cmd_show_codes()
 
+        elif isinstance(cmd, ShowStatsCmd):
+            self._cmd_show_stats()
+
         elif isinstance(cmd, SaveCmd):
             self._cmd_save(cmd)
 
@@ -89,6 +92,10 @@ class HuffmanDSLExecutor:
             text += f"'{ch}' -> {code}\n"
         self.window.code_display.setText(text)
 
+    def _cmd_show_stats(self):
+        stats = self.window.tree.stats()
+        self.window.code_display.setText(self.window.format_stats_text(stats))
+
     def _cmd_save(self, cmd: SaveCmd):
         self.window.tree.save_to_file(cmd.path)
 
@@ -26,6 +26,10 @@ class ShowCodesCmd(DSLCommand):
     pass
 
 
+class ShowStatsCmd(DSLCommand):
+    pass
+
+
 class SaveCmd(DSLCommand):
     def __init__(self, path: str):
         self.path = path
@@ -88,6 +92,9 @@ class HuffmanDSLParser:
         if line.startswith("show_codes"):
             return ShowCodesCmd()
 
+        if line.startswith("show_stats"):
+            return ShowStatsCmd()
+
         if line.startswith("save"):
             return self._parse_save(line)
 
@@ -33,14 +33,14 @@ class ListDSLExecutor:
             w._clear_list()
 
         elif isinstance(cmd, ModeCmd):
+            prefix = "块状" if w.mode_combo.currentText().startswith("块状") else ""
             w.mode_combo.setCurrentText(
-                "单链表" if cmd.mode == "singly" else "双链表"
+                prefix + ("单链表" if cmd.mode == "singly" else "双链表")
             )
 
         elif isinstance(cmd, BuildCmd):
             w.list.clear()
-            for v in cmd.values:
-                w.list.insert_tail(v)
+            w.list.extend(cmd.values)
             w._draw_list()
 
         elif isinstance(cmd, InsertHeadCmd):
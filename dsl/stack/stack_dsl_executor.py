@@ -50,10 +50,8 @@ class StackDSLExecutor:
 
         elif op == "random":
             self.win._clear_stack()
-            for _ in range(cmd[1]):
-                self.win.stack.push(
-                    random.randint(self.win.stack.MIN_VAL, self.win.stack.MAX_VAL)
-                )
+            stack = self.win.stack
+            stack.push_many(random.randint(stack.MIN_VAL, stack.MAX_VAL) for _ in range(cmd[1]))
             self.win._draw_stack()
             QTimer.singleShot(500, self.step)
 
@@ -12,6 +12,8 @@ import json
 import os
 import random
 from core.list import List
+from core.unrolled_list import UnrolledList
+from core.json_stream import JsonArrayReader
 
 # 配置matplotlib中文字体
 import matplotlib
@@ -23,6 +25,7 @@ from dsl.list.list_dsl_executor import ListDSLExecutor
 
 class ListWindow(QMainWindow):
     """链表可视化窗口"""
+    UNROLLED_CAPACITY = 4  # 块状链表演示用的块容量（节点数上限为 15，容量小才能看出分块）
     
     def __init__(self):
         super().__init__()
@@ -129,7 +132,7 @@ draw;-------------------强制刷新
         # 模式选择
         ctrl_layout.addWidget(QLabel("链表模式："))
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(["单链表", "双链表"])
+        self.mode_combo.addItems(["单链表", "双链表", "块状单链表", "块状双链表"])
         self.mode_combo.currentTextChanged.connect(self._switch_mode)
         ctrl_layout.addWidget(self.mode_combo)
         
@@ -284,18 +287,23 @@ draw;
             QMessageBox.warning(self, "警告", "动画执行中，无法切换模式")
             return
         
-        mode = "singly" if text == "单链表" else "doubly"
         # 保存当前数据
         current_data = self.list.to_list()
         # 重新初始化链表
-        self.list = List(mode=mode)
+        self.list = self._new_list(text)
         # 恢复数据
-        for data in current_data:
-            self.list.insert_tail(data)
+        self.list.extend(current_data)
         
         self._log_operation(f"切换为{text}模式")
         self._draw_list()
 
+    def _new_list(self, text: str):
+        """按模式下拉框的文字创建链表：块状链表见 core/unrolled_list.py"""
+        mode = "doubly" if "双" in text else "singly"
+        if text.startswith("块状"):
+            return UnrolledList(mode=mode, capacity=self.UNROLLED_CAPACITY)
+        return List(mode=mode)
+
     def _get_input_data(self) -> int:
         """获取输入数据并验证"""
         try:
@@ -403,6 +411,7 @@ draw;
         
         save_data = {
             "mode": self.list.mode,
+            "unrolled": isinstance(self.list, UnrolledList),
             "data": self.list.to_list()
         }
         with open(filename, "w", encoding="utf-8") as f:
@@ -425,20 +434,17 @@ draw;
         
         try:
             with open(filename, "r", encoding="utf-8") as f:
-                load_data = json.load(f)
-            
-            mode = load_data.get("mode", "singly")
-            data = load_data.get("data", [])
-            
-            # 初始化链表
-            self.list = List(mode=mode)
-            for val in data:
-                self.list.insert_tail(val)
+                # mode / unrolled 写在 data 之后时先读完数组补全 header，避免按默认值建错链表
+                reader = JsonArrayReader(f).require("mode", "unrolled")
+                mode = reader.header.get("mode", "singly")
+                
+                # 初始化链表，数组元素边读边链接
+                text = ("块状" if reader.header.get("unrolled") else "") + ("单链表" if mode == "singly" else "双链表")
+                self.list = self._new_list(text)
+                self.list.extend(reader)
             
             # 更新UI
-            self.mode_combo.setCurrentText(
-                "单链表" if mode == "singly" else "双链表"
-            )
+            self.mode_combo.setCurrentText(text)
             self._log_operation(f"从{os.path.basename(filename)}加载链表")
             self._draw_list()
         except Exception as e:
@@ -691,7 +697,21 @@ draw;
                     fontsize=10, color="blue", fontweight="bold"
                 )
 
-        # 4. 刷新画布（使绘制生效）
+        # 4. 块状链表：用虚线框出每个块，标注块内元素数 / 容量
+        for b, blk in enumerate(visual_data.get("blocks", [])):
+            x0 = canvas_padding + blk["start"] * (node_width + node_spacing)
+            width = blk["count"] * (node_width + node_spacing) - node_spacing
+            self.ax.add_patch(patches.Rectangle(
+                (x0 - 0.4, canvas_padding - 0.35), width + 0.8, node_height + 0.7,
+                fill=False, linestyle="--", linewidth=1.5, edgecolor="#4169E1"
+            ))
+            self.ax.text(
+                x0 + width / 2, canvas_padding + node_height + 0.7,
+                f"块{b}（{blk['count']}/{blk['capacity']}）",
+                ha="center", va="bottom", fontsize=9, color="#4169E1"
+            )
+
+        # 5. 刷新画布（使绘制生效）
         self.canvas.draw_idle()
 
     def _on_node_click(self, event):
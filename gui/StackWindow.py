@@ -12,6 +12,7 @@ import os
 import random
 # 假设 core/stack.py 存在并提供 Stack 类
 from core.stack import Stack 
+from core.json_stream import JsonArrayReader
 
 # 配置matplotlib中文字体
 import matplotlib
@@ -330,17 +331,15 @@ peek
 
         try:
             with open(filename, "r", encoding="utf-8") as f:
-                load_data = json.load(f)
-            
-            if load_data.get("type") != "stack":
-                raise ValueError("不是栈结构文件")
-            
-            data = load_data.get("data", [])
-            # 清空并恢复栈
-            self.stack.clear()
-            # 注意: 栈的 to_list() 应该是从栈底到栈顶，所以直接 push 即可
-            for val in data:
-                self.stack.push(val)
+                reader = JsonArrayReader(f).require("type")
+                dtype = reader.header.get("type")
+                if dtype is None:
+                    raise ValueError("文件缺少 type 字段")
+                if dtype != "stack":
+                    raise ValueError(f"不是栈结构文件（type 为 {dtype}）")
+                # 清空并恢复栈（保存的是 to_list() 的顺序：栈顶在前）
+                self.stack.clear()
+                self.stack.push_many(reader, top_first=True)
             
             self._log_operation(f"从{os.path.basename(filename)}加载栈")
             self._draw_stack()
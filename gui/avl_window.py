@@ -1,7 +1,7 @@
 import sys
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, 
                                QPushButton, QLineEdit, QLabel, QTextEdit, QSpinBox, 
-                               QMessageBox, QFileDialog, QSplitter, QSizePolicy)
+                               QMessageBox, QFileDialog, QSplitter, QSizePolicy, QSlider)
 from PySide6.QtCore import Qt, QTimer, QDateTime, QIODevice, QTextStream, QCoreApplication
 from PySide6.QtGui import QTextCursor
 import matplotlib
@@ -12,6 +12,9 @@ import matplotlib.patches as patches
 
 # 请确保这些模块路径正确
 from core.avl_tree import AVLTree, AVLNode
+from core.rb_tree import RBTree, RED
+from core.splay_tree import SplayTree
+from core.interval_tree import IntervalAVLTree
 from dsl.avl.avl_dsl_parser import AVLDslParser, ParserError
 from dsl.avl.avl_dsl_executor import AVLDslExecutor
 
@@ -24,18 +27,34 @@ IMBALANCED_TEXT_COLOR = '#c0392b'  # 深红色
 DEFAULT_NODE_SIZE = 0.35  # 默认节点大小
 MIN_NODE_SIZE = 0.2       # 最小节点大小
 NODE_SIZE_THRESHOLD = 8   # 节点数量阈值
+RB_RED_COLOR = '#c0392b'    # 红黑树红色节点
+RB_BLACK_COLOR = '#2c3e50'  # 红黑树黑色节点
+
+# 可插拔的树引擎：窗口只依赖 insert/delete/search/... 接口与监听器事件
+TREE_ENGINE_NAMES = {
+    AVLTree: "AVL树",
+    RBTree: "红黑树",
+    SplayTree: "伸展树",
+    IntervalAVLTree: "区间树",
+}
 
 
 class AVLWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, tree=None):
         super().__init__()
-        self.setWindowTitle("AVL树可视化 - 支持DSL脚本")
+        # 1. 核心数据结构初始化（必须最先初始化）；tree 为空时使用 AVLTree
+        self.tree = tree if tree is not None else AVLTree()
+        self.tree_name = TREE_ENGINE_NAMES.get(type(self.tree), type(self.tree).__name__)
+        # 区间树：键为 (lo, hi)，输入框接受 "a,b"，节点额外显示子树最大右端点
+        self.is_interval = isinstance(self.tree, IntervalAVLTree)
+        self.setWindowTitle(f"{self.tree_name}可视化 - 支持DSL脚本")
         self.resize(1600, 800)
 
-        # 1. 核心数据结构初始化（必须最先初始化）
-        self.tree = AVLTree()
         self.tree.add_listener(self.on_update)
-        self.state_list = []  # 用于存储状态快照
+        # 版本历史：持久化 AVL，每个版本只多占 O(log n) 节点；撤销/重做/跳转直接显示该版本的持久化根，O(1)
+        self.has_history = hasattr(self.tree, "enable_history")
+        if self.has_history:
+            self.tree.enable_history().add_listener(self.on_history_update)
 
         # 2. 步骤日志文本框（必须在布局前初始化）
         self.step_text = QTextEdit()
@@ -66,7 +85,11 @@ class AVLWindow(QMainWindow):
 
         # 5. DSL相关组件
         self.dsl_editor = QTextEdit()
-        self.dsl_editor.setPlaceholderText("输入AVL树DSL脚本，每行一个操作...\n例如:\nclear\ninsert 5\ninsert 3\ninsert 7\ninorder")
+        if self.is_interval:
+            example = "clear\ninsert 5,10\ninsert 3,4\ninsert 7,20\noverlap 8,12\ninorder"
+        else:
+            example = "clear\ninsert 5\ninsert 3\ninsert 7\ninorder"
+        self.dsl_editor.setPlaceholderText(f"输入{self.tree_name}DSL脚本，每行一个操作...\n例如:\n{example}")
         self.btn_run_dsl = QPushButton("运行DSL脚本")
         self.btn_run_dsl.clicked.connect(self.run_dsl)
         
@@ -75,7 +98,8 @@ class AVLWindow(QMainWindow):
         self.btn_load_example.clicked.connect(self.load_example_code)
 
         # 6. 初始化DSL解析器和执行器
-        self.dsl_parser = AVLDslParser()
+        # 区间树的键写成 lo,hi，并额外支持 overlap lo,hi
+        self.dsl_parser = AVLDslParser(interval=self.is_interval)
         self.dsl_executor = AVLDslExecutor(
             self.tree,
             log_callback=lambda msg: self.add_step(msg),
@@ -84,7 +108,7 @@ class AVLWindow(QMainWindow):
 
         # 7. 基础操作控件
         self.inputVal = QLineEdit()
-        self.inputVal.setPlaceholderText("输入整数（1-100）")
+        self.inputVal.setPlaceholderText("输入区间 a,b（1-100）" if self.is_interval else "输入整数（1-100）")
         self.inputVal.setMaximumWidth(120)
         
         self.btn_insert = QPushButton("插入")
@@ -105,7 +129,7 @@ class AVLWindow(QMainWindow):
         self.spinN.setValue(10)
         self.spinN.setMaximumWidth(60)
         
-        self.btn_random = QPushButton("随机生成 AVL")
+        self.btn_random = QPushButton(f"随机生成 {self.tree_name}")
         self.btn_random.clicked.connect(self.random_build)
 
         # 高级功能控件
@@ -118,6 +142,9 @@ class AVLWindow(QMainWindow):
         self.btn_lower_bound = QPushButton("lower_bound（首个≥值）")
         self.btn_lower_bound.clicked.connect(self.find_lower_bound)
 
+        self.btn_overlap = QPushButton("重叠查询（a,b 或单点）")
+        self.btn_overlap.clicked.connect(self.find_overlap)
+
         # 文件操作控件
         self.btn_save = QPushButton("保存数据")
         self.btn_save.clicked.connect(self.save_data)
@@ -125,8 +152,28 @@ class AVLWindow(QMainWindow):
         self.btn_load = QPushButton("加载数据")
         self.btn_load.clicked.connect(self.load_data)
 
+        # 版本历史控件（撤销/重做 + 时间轴）
+        self.btn_undo = QPushButton("撤销")
+        self.btn_undo.clicked.connect(self.undo)
+
+        self.btn_redo = QPushButton("重做")
+        self.btn_redo.clicked.connect(self.redo)
+        if self.is_interval:
+            history_tip = "区间树切换版本需整棵复制并刷新 max_end，耗时 O(n)"
+        else:
+            history_tip = "切换版本只移动版本指针（O(1)）；之后第一次修改时才复制出可编辑的树（O(n)）"
+        self.btn_undo.setToolTip(history_tip)
+        self.btn_redo.setToolTip(history_tip)
+
+        self.history_slider = QSlider(Qt.Horizontal)
+        self.history_slider.setRange(0, 0)
+        self.history_slider.valueChanged.connect(self.on_history_slider)
+        self.history_slider.setToolTip(history_tip)
+        self.history_label = QLabel("版本 0：初始")
+        self._syncing_history = False
+
         # 状态栏
-        self.status = QLabel("就绪 - AVL树自动保持平衡，支持旋转操作可视化")
+        self.status = QLabel(f"就绪 - {self.tree_name}自动保持平衡，支持旋转操作可视化")
 
         # 8. 布局组装
         # 8.1 DSL面板
@@ -153,12 +200,23 @@ class AVLWindow(QMainWindow):
         adv_layout.addWidget(self.btn_predecessor)
         adv_layout.addWidget(self.btn_successor)
         adv_layout.addWidget(self.btn_lower_bound)
+        if self.is_interval:
+            adv_layout.addWidget(self.btn_overlap)
+        else:
+            self.btn_overlap.hide()
 
         file_layout = QHBoxLayout()
         file_layout.addWidget(QLabel("文件操作："))
         file_layout.addWidget(self.btn_save)
         file_layout.addWidget(self.btn_load)
 
+        history_layout = QHBoxLayout()
+        history_layout.addWidget(QLabel("版本历史："))
+        history_layout.addWidget(self.btn_undo)
+        history_layout.addWidget(self.btn_redo)
+        history_layout.addWidget(self.history_slider)
+        history_layout.addWidget(self.history_label)
+
         middle_panel = QWidget()
         middle_layout = QVBoxLayout(middle_panel)
         middle_layout.addWidget(self.canvas)
@@ -167,6 +225,12 @@ class AVLWindow(QMainWindow):
         middle_layout.addLayout(adv_layout)
         middle_layout.addWidget(QLabel("——— 文件操作 ———"))
         middle_layout.addLayout(file_layout)
+        if self.has_history:
+            middle_layout.addWidget(QLabel("——— 版本历史 ———"))
+            middle_layout.addLayout(history_layout)
+        else:
+            for w in (self.btn_undo, self.btn_redo, self.history_slider, self.history_label):
+                w.hide()
         middle_layout.addWidget(self.status)
 
         # 8.3 日志面板
@@ -193,6 +257,7 @@ class AVLWindow(QMainWindow):
 
         # 初始绘制空树
         self.draw_tree(None)
+        self._refresh_history_controls()
 
     # DSL执行方法
     def run_dsl(self):
@@ -208,8 +273,7 @@ class AVLWindow(QMainWindow):
             self.add_step("DSL脚本解析成功，开始执行...")
             
             # 清空当前树
-            self.tree.root = None
-            self.draw_tree(None)
+            self.tree.clear()
             
             # 执行脚本
             self.dsl_executor.execute(program)
@@ -288,10 +352,12 @@ class AVLWindow(QMainWindow):
                 
             x, y = self.coords[n.val]
             
-            if n.parent and n.parent.val in self.coords:
-                px, py = self.coords[n.parent.val]
-                line_color = PATH_COLOR if highlight_path and n.parent in highlight_path else 'gray'
-                self.ax.plot([px, x], [py, y], color=line_color, linestyle='-', linewidth=1.5, zorder=1)
+            # 边从父节点画向子节点：历史版本的持久化节点没有 parent 指针
+            line_color = PATH_COLOR if highlight_path and n in highlight_path else 'gray'
+            for child in (n.left, n.right):
+                if child is not None and child.val in self.coords:
+                    cx, cy = self.coords[child.val]
+                    self.ax.plot([x, cx], [y, cy], color=line_color, linestyle='-', linewidth=1.5, zorder=1)
                 
             current_color = node_color
             text_color = 'white'
@@ -307,26 +373,26 @@ class AVLWindow(QMainWindow):
                 current_color = PATH_COLOR
             elif node_color != DEFAULT_NODE_COLOR:
                 current_color = node_color
+            else:
+                current_color = self._engine_node_color(n, current_color)
 
             # 使用计算出的节点大小
             circle = patches.Circle((x, y), node_size, facecolor=current_color, edgecolor='black', linewidth=lw, zorder=2)
             self.ax.add_patch(circle)
             self.node_artists.append((circle, n))
 
-            label = f"{n.val}"
-            if n.freq > 1:
-                label += f"-{n.freq}"
+            label = self._node_label(n)
             
             # 根据节点大小调整字体
             font_size = max(8, int(10 * (node_size / DEFAULT_NODE_SIZE)))
             self.ax.text(x, y, label, ha='center', va='center', fontsize=font_size, color=text_color, zorder=3)
             
-            if show_bf:
+            if show_bf and hasattr(n, "height"):
                 bf = self.tree._balance_factor(n)
                 bf_c = IMBALANCED_TEXT_COLOR if abs(bf) > 1 else bf_text_color
                 # 平衡因子字体也相应调整
                 bf_font_size = max(6, int(8 * (node_size / DEFAULT_NODE_SIZE)))
-                self.ax.text(x, y + node_size + 0.05, f"h={n.height}", ha='center', va='center', fontsize=bf_font_size, color='black', zorder=3)
+                self.ax.text(x, y + node_size + 0.05, self._node_top_text(n), ha='center', va='center', fontsize=bf_font_size, color='black', zorder=3)
                 self.ax.text(x, y - node_size - 0.05, f"bf={bf}", ha='center', va='center', fontsize=bf_font_size, color=bf_c, zorder=3)
             
             _draw_node_recursive(n.left)
@@ -335,6 +401,67 @@ class AVLWindow(QMainWindow):
         _draw_node_recursive(node)
         self.canvas.draw_idle()
 
+    # ---------- 版本历史 ----------
+    def _refresh_history_controls(self):
+        if not self.has_history:
+            return
+        history = self.tree.history
+        self._syncing_history = True
+        self.history_slider.setRange(0, len(history) - 1)
+        self.history_slider.setValue(history.current)
+        self._syncing_history = False
+        self.history_label.setText(f"版本 {history.current}：{history.labels[history.current]}")
+        self.btn_undo.setEnabled(history.can_undo())
+        self.btn_redo.setEnabled(history.can_redo())
+
+    def on_history_update(self, state):
+        self._refresh_history_controls()
+
+    def _stop_animations(self):
+        self.animation_timer.stop()
+        self.path_timer.stop()
+        self.animating = False
+        self.rotation_highlight = None
+
+    def undo(self):
+        self._stop_animations()
+        if self.has_history and self.tree.undo():
+            self.add_step(f"撤销 -> 版本 {self.tree.history.current}")
+
+    def redo(self):
+        self._stop_animations()
+        if self.has_history and self.tree.redo():
+            self.add_step(f"重做 -> 版本 {self.tree.history.current}")
+
+    def on_history_slider(self, value):
+        if self._syncing_history or value == self.tree.history.current:
+            return
+        self._stop_animations()
+        self.tree.checkout(value)
+        self.add_step(f"跳转到版本 {value}：{self.tree.history.labels[value]}")
+
+    def _node_label(self, n):
+        if self.is_interval:
+            label = f"[{n.val[0]},{n.val[1]}]"
+        else:
+            label = f"{n.val}"
+        if n.freq > 1:
+            label += f"-{n.freq}"
+        return label
+
+    def _node_top_text(self, n):
+        """节点上方的增强信息：高度，区间树另加子树最大右端点"""
+        if hasattr(n, "max_end"):
+            return f"h={n.height} max={n.max_end}"
+        return f"h={n.height}"
+
+    def _engine_node_color(self, n, default):
+        """红黑树节点按颜色着色，其余引擎使用默认颜色"""
+        color = getattr(n, "color", None)
+        if color is None:
+            return default
+        return RB_RED_COLOR if color == RED else RB_BLACK_COLOR
+
     # 状态更新回调
     def on_update(self, state):
         action = state.get("action")
@@ -374,6 +501,14 @@ class AVLWindow(QMainWindow):
                                 bf_text_color=text_color)
             return
 
+        if action == "recolor":
+            self.status.setText(f"重新着色，继续检查节点 {node.val}")
+            self._delayed_draw(500, self.draw_tree,
+                                self.tree.root,
+                                highlight_pair=extra.get("nodes"),
+                                show_bf=True)
+            return
+
         if action == "move_to_parent":
             next_node = extra.get("next_node")
             self.status.setText(f"移动到父节点 {next_node.val} 继续检查")
@@ -435,6 +570,14 @@ class AVLWindow(QMainWindow):
         if action == "trace_path":
             self._animate_special_path(extra, node)
             return
+
+        if action == "overlap":
+            lo, hi = extra.get("range")
+            hits = extra.get("nodes") or []
+            text = "、".join(self._node_label(n) for n in hits) or "无"
+            self.status.setText(f"与 [{lo}, {hi}] 重叠的区间：{text}")
+            self.draw_tree(self.tree.root, highlight_path=hits, show_bf=True)
+            return
             
         if action in ("insert", "delete", "found", "not_found", "increase_freq", "decrease_freq", "build"):
             if action == "build":
@@ -512,29 +655,29 @@ class AVLWindow(QMainWindow):
 
             x, y = current_coords[n.val]
 
-            if n.parent and n.parent.val in current_coords:
-                px, py = current_coords[n.parent.val]
-                self.ax.plot([px, x], [py, y], color='gray', linestyle='-', linewidth=1.5, zorder=1)
+            for child in (n.left, n.right):
+                if child is not None and child.val in current_coords:
+                    cx, cy = current_coords[child.val]
+                    self.ax.plot([x, cx], [y, cy], color='gray', linestyle='-', linewidth=1.5, zorder=1)
 
-            current_color = DEFAULT_NODE_COLOR
+            current_color = self._engine_node_color(n, DEFAULT_NODE_COLOR)
             if n.val in self.start_coords or n.val in self.target_coords:
                 current_color = ROTATION_COLOR
 
             circle = patches.Circle((x, y), node_size, facecolor=current_color, edgecolor='black', linewidth=1.5, zorder=2)
             self.ax.add_patch(circle)
 
-            label = f"{n.val}"
-            if n.freq > 1:
-                label += f"-{n.freq}"
+            label = self._node_label(n)
 
             font_size = max(8, int(10 * (node_size / DEFAULT_NODE_SIZE)))
             self.ax.text(x, y, label, ha='center', va='center', fontsize=font_size, color='white', zorder=3)
             
-            bf = self.tree._balance_factor(n)
-            bf_color = IMBALANCED_TEXT_COLOR if abs(bf) > 1 else 'black'
-            bf_font_size = max(6, int(8 * (node_size / DEFAULT_NODE_SIZE)))
-            self.ax.text(x, y + node_size + 0.05, f"h={n.height}", ha='center', va='center', fontsize=bf_font_size, color='black', zorder=3)
-            self.ax.text(x, y - node_size - 0.05, f"bf={bf}", ha='center', va='center', fontsize=bf_font_size, color=bf_color, zorder=3)
+            if hasattr(n, "height"):
+                bf = self.tree._balance_factor(n)
+                bf_color = IMBALANCED_TEXT_COLOR if abs(bf) > 1 else 'black'
+                bf_font_size = max(6, int(8 * (node_size / DEFAULT_NODE_SIZE)))
+                self.ax.text(x, y + node_size + 0.05, self._node_top_text(n), ha='center', va='center', fontsize=bf_font_size, color='black', zorder=3)
+                self.ax.text(x, y - node_size - 0.05, f"bf={bf}", ha='center', va='center', fontsize=bf_font_size, color=bf_color, zorder=3)
 
             _draw_anim_node(n.left)
             _draw_anim_node(n.right)
@@ -601,14 +744,14 @@ class AVLWindow(QMainWindow):
 
     # 操作实现
     def insert(self):
-        val = self._get_int()
+        val = self._get_key()
         if val is None:
             return
         self.add_step(f"外部执行插入操作：{val}")
         self.tree.insert(val, step_callback=self.add_step)
 
     def search(self):
-        val = self._get_int()
+        val = self._get_key()
         if val is None:
             return
         self.current_op = 'search'
@@ -616,7 +759,7 @@ class AVLWindow(QMainWindow):
         self.tree.search(val, step_callback=self.add_step)
 
     def delete(self):
-        val = self._get_int()
+        val = self._get_key()
         if val is None:
             return
         self.add_step(f"外部执行删除操作：{val}")
@@ -629,17 +772,17 @@ class AVLWindow(QMainWindow):
         seq = self.tree.inorder()
         seq_text = " -> ".join(map(str, seq))
         self.status.setText(f"中序遍历（递增序列）: {seq_text}")
-        self.add_step(f"中序遍历结果（AVL特性：递增）：{seq_text}")
+        self.add_step(f"中序遍历结果（{self.tree_name}特性：递增）：{seq_text}")
 
     def random_build(self):
         n = self.spinN.value()
-        self.add_step(f"开始随机生成 {n} 个节点的AVL树（值范围：1-100）")
+        self.add_step(f"开始随机生成 {n} 个节点的{self.tree_name}（值范围：1-100）")
         values = self.tree.build_random(n=n, value_range=(1, 100), step_callback=self.add_step)
         self.add_step(f"生成完成，值序列：{values}")
         self.status.setText(f"随机生成 {n} 个节点: {values}")
 
     def find_predecessor(self):
-        val = self._get_int()
+        val = self._get_key()
         if val is None:
             return
         self.current_op = 'predecessor'
@@ -647,7 +790,7 @@ class AVLWindow(QMainWindow):
         self.tree.predecessor(val, step_callback=self.add_step)
 
     def find_successor(self):
-        val = self._get_int()
+        val = self._get_key()
         if val is None:
             return
         self.current_op = 'successor'
@@ -655,13 +798,22 @@ class AVLWindow(QMainWindow):
         self.tree.successor(val, step_callback=self.add_step)
 
     def find_lower_bound(self):
-        val = self._get_int()
+        val = self._get_key()
         if val is None:
             return
         self.current_op = 'lower_bound'
         self.add_step(f"查找值 {val} 的lower_bound（首个≥{val}的节点）")
         self.tree.lower_bound(val, step_callback=self.add_step)
         
+    def find_overlap(self):
+        parts = self._parse_ints()
+        if parts is None or len(parts) not in (1, 2) or parts[0] > parts[-1]:
+            QMessageBox.warning(self, "输入错误", "请输入区间 a,b（a≤b）或单个点！")
+            return
+        lo, hi = parts[0], parts[-1]
+        self.add_step(f"查询与 [{lo}, {hi}] 重叠的区间")
+        self.tree.overlap(lo, hi, step_callback=self.add_step)
+
     def _compute_depth(self, root):
         if not root:
             return 0
@@ -693,6 +845,23 @@ class AVLWindow(QMainWindow):
                     self.tree.delete(val, step_callback=self.add_step)
                 break
 
+    def _parse_ints(self):
+        text = self.inputVal.text().replace("，", ",").replace("[", " ").replace("]", " ")
+        try:
+            return [int(x) for x in text.replace(",", " ").split()]
+        except ValueError:
+            return None
+
+    def _get_key(self):
+        """普通树返回整数，区间树返回 (lo, hi)"""
+        if not self.is_interval:
+            return self._get_int()
+        parts = self._parse_ints()
+        if parts is None or len(parts) != 2 or not 1 <= parts[0] <= parts[1] <= 100:
+            QMessageBox.warning(self, "输入错误", "请输入区间 a,b（1 ≤ a ≤ b ≤ 100）！")
+            return None
+        return tuple(parts)
+
     def _get_int(self):
         try:
             val = int(self.inputVal.text().strip())
@@ -728,7 +897,10 @@ class AVLWindow(QMainWindow):
             file = QFile(file_path)
             if file.open(QIODevice.WriteOnly | QIODevice.Text):
                 stream = QTextStream(file)
-                stream << ",".join(map(str, data))
+                if self.is_interval:
+                    stream << ",".join(f"{lo}:{hi}" for lo, hi in data)
+                else:
+                    stream << ",".join(map(str, data))
                 file.close()
                 self.add_step(f"数据已保存到 {file_path}")
                 QMessageBox.information(self, "成功", "数据保存成功")
@@ -751,14 +923,16 @@ class AVLWindow(QMainWindow):
                 content = stream.readAll()
                 file.close()
                 
-                self.tree.root = None
-                self.draw_tree(None)
+                self.tree.clear()
                 
-                values = list(map(int, content.split(',')))
+                if self.is_interval:
+                    values = [tuple(map(int, v.split(':'))) for v in content.split(',') if v.strip()]
+                else:
+                    values = list(map(int, content.split(',')))
                 self.add_step(f"从 {file_path} 加载数据：{values}")
                 
                 for val in values:
-                    if 1 <= val <= 100:
+                    if (1 <= val[0] <= val[1] <= 100) if self.is_interval else (1 <= val <= 100):
                         self.tree.insert(val, step_callback=self.add_step)
                     else:
                         self.add_step(f"跳过无效值 {val}（必须在1-100之间）")
@@ -770,7 +944,20 @@ class AVLWindow(QMainWindow):
 
     def load_example_code(self):
         """加载示例DSL代码"""
-        example_code = """clear
+        if self.is_interval:
+            example_code = """clear
+insert 10,30
+insert 5,8
+insert 20,25
+insert 40,60
+insert 15,45
+inorder
+overlap 22,41
+delete 5,8
+lower_bound 16,16
+random 5"""
+        else:
+            example_code = """clear
 insert 50
 insert 30
 insert 70
@@ -0,0 +1,326 @@
+# gui/bplus_window.py
+# B+ 树可视化：按层绘制节点（矩形内为有序键数组），叶子之间画出链表指针
+from PySide6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+                               QPushButton, QLineEdit, QLabel, QTextEdit, QSpinBox,
+                               QMessageBox, QSplitter)
+from PySide6.QtCore import Qt, QDateTime
+from PySide6.QtGui import QTextCursor
+import matplotlib
+matplotlib.use("Qt5Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+import matplotlib.patches as patches
+
+from core.bplus_tree import BPlusTree
+from dsl.avl.avl_dsl_parser import AVLDslParser, ParserError
+from dsl.avl.avl_dsl_executor import AVLDslExecutor
+
+# 常量定义
+INTERNAL_COLOR = '#3498db'  # 内部节点：蓝色
+LEAF_COLOR = '#2ecc71'      # 叶子节点：绿色
+HIGHLIGHT_COLOR = '#e74c3c' # 高亮：红色
+PATH_COLOR = '#f39c12'      # 查找路径：橙色
+KEY_WIDTH = 0.6             # 每个键占用的宽度
+NODE_HEIGHT = 0.6
+NODE_GAP = 0.5              # 同层节点间距
+
+
+class BPlusWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("B+树可视化 - 支持DSL脚本")
+        self.resize(1600, 800)
+
+        # 1. 核心数据结构
+        self.tree = BPlusTree(order=4)
+        self.tree.add_listener(self.on_update)
+
+        # 2. 日志
+        self.step_text = QTextEdit()
+        self.step_text.setReadOnly(True)
+        self.step_text.setPlaceholderText("操作步骤将显示在这里...")
+
+        # 3. 画布
+        self.fig = Figure(figsize=(8, 6), dpi=100)
+        self.canvas = FigureCanvas(self.fig)
+        self.ax = self.fig.add_subplot(111)
+
+        # 4. DSL（与 AVL 树共用语法：insert/delete/search/inorder/random/lower_bound ...）
+        self.dsl_editor = QTextEdit()
+        self.dsl_editor.setPlaceholderText("输入B+树DSL脚本，每行一个操作...\n例如:\nclear\ninsert 5\ninsert 3\ninsert 7\ninorder")
+        self.btn_run_dsl = QPushButton("运行DSL脚本")
+        self.btn_run_dsl.clicked.connect(self.run_dsl)
+        self.dsl_parser = AVLDslParser()
+        self.dsl_executor = AVLDslExecutor(
+            self.tree,
+            log_callback=lambda msg: self.add_step(msg),
+            update_ui_callback=lambda: self.draw_tree()
+        )
+
+        # 5. 操作控件
+        self.spinOrder = QSpinBox()
+        self.spinOrder.setRange(3, 16)
+        self.spinOrder.setValue(self.tree.order)
+        self.btn_order = QPushButton("设置阶数（清空）")
+        self.btn_order.clicked.connect(self.set_order)
+
+        self.inputVal = QLineEdit()
+        self.inputVal.setPlaceholderText("输入整数（1-100）")
+        self.inputVal.setMaximumWidth(120)
+
+        self.btn_insert = QPushButton("插入")
+        self.btn_insert.clicked.connect(self.insert)
+        self.btn_delete = QPushButton("删除")
+        self.btn_delete.clicked.connect(self.delete)
+        self.btn_search = QPushButton("查找")
+        self.btn_search.clicked.connect(self.search)
+        self.btn_inorder = QPushButton("顺序遍历")
+        self.btn_inorder.clicked.connect(self.show_inorder)
+
+        self.inputHi = QLineEdit()
+        self.inputHi.setPlaceholderText("范围上界（不含）")
+        self.inputHi.setMaximumWidth(120)
+        self.btn_range = QPushButton("范围扫描 [值, 上界)")
+        self.btn_range.clicked.connect(self.range_scan)
+
+        self.spinN = QSpinBox()
+        self.spinN.setRange(1, 40)
+        self.spinN.setValue(15)
+        self.btn_random = QPushButton("随机生成 B+树")
+        self.btn_random.clicked.connect(self.random_build)
+        self.btn_clear = QPushButton("清空")
+        self.btn_clear.clicked.connect(self.tree.clear)
+
+        self.status = QLabel("就绪 - 叶子保存有序键数组并互相链接，支持范围扫描")
+
+        # 6. 布局
+        dsl_panel = QWidget()
+        dsl_layout = QVBoxLayout(dsl_panel)
+        dsl_layout.addWidget(QLabel("DSL脚本编辑区"))
+        dsl_layout.addWidget(self.dsl_editor)
+        dsl_layout.addWidget(self.btn_run_dsl)
+
+        ctrl_layout = QHBoxLayout()
+        ctrl_layout.addWidget(self.inputVal)
+        ctrl_layout.addWidget(self.btn_insert)
+        ctrl_layout.addWidget(self.btn_delete)
+        ctrl_layout.addWidget(self.btn_search)
+        ctrl_layout.addWidget(self.btn_inorder)
+
+        range_layout = QHBoxLayout()
+        range_layout.addWidget(self.inputHi)
+        range_layout.addWidget(self.btn_range)
+        range_layout.addWidget(QLabel("随机个数："))
+        range_layout.addWidget(self.spinN)
+        range_layout.addWidget(self.btn_random)
+        range_layout.addWidget(QLabel("阶数："))
+        range_layout.addWidget(self.spinOrder)
+        range_layout.addWidget(self.btn_order)
+        range_layout.addWidget(self.btn_clear)
+
+        middle_panel = QWidget()
+        middle_layout = QVBoxLayout(middle_panel)
+        middle_layout.addWidget(self.canvas)
+        middle_layout.addLayout(ctrl_layout)
+        middle_layout.addLayout(range_layout)
+        middle_layout.addWidget(self.status)
+
+        log_panel = QWidget()
+        log_layout = QVBoxLayout(log_panel)
+        log_layout.addWidget(QLabel("操作日志"))
+        log_layout.addWidget(self.step_text)
+
+        central = QWidget()
+        self.setCentralWidget(central)
+        main_layout = QHBoxLayout(central)
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.addWidget(dsl_panel)
+        splitter.addWidget(middle_panel)
+        splitter.addWidget(log_panel)
+        splitter.setSizes([300, 800, 500])
+        main_layout.addWidget(splitter)
+
+        self.draw_tree()
+
+    # ---------- 绘制 ----------
+    def _node_width(self, node):
+        return max(len(node.keys), 1) * KEY_WIDTH
+
+    def _layout(self):
+        """叶子层从左到右紧密排列，内部节点放在其孩子的正上方中央"""
+        levels = self.tree.levels()
+        coords = {}
+        x = 0.0
+        for leaf in levels[-1]:
+            w = self._node_width(leaf)
+            coords[id(leaf)] = (x + w / 2, 0.0)
+            x += w + NODE_GAP
+        for depth, level in enumerate(reversed(levels[:-1]), start=1):
+            for node in level:
+                first = coords[id(node.children[0])][0]
+                last = coords[id(node.children[-1])][0]
+                coords[id(node)] = ((first + last) / 2, depth * 1.5)
+        return levels, coords
+
+    def draw_tree(self, highlight=None, path=None, keys=None):
+        """highlight：高亮的节点；path：查找路径；keys：需要高亮的键集合"""
+        self.ax.clear()
+        self.ax.set_aspect('equal', adjustable='box')
+        self.ax.axis('off')
+        path_ids = {id(n) for n in (path or [])}
+        keys = set(keys or ())
+
+        if self.tree.size == 0:
+            self.ax.text(0.5, 0.5, "(空树)", ha="center", va="center", fontsize=16, color="gray")
+            self.canvas.draw_idle()
+            return
+
+        levels, coords = self._layout()
+        for level in levels:
+            for node in level:
+                x, y = coords[id(node)]
+                w = self._node_width(node)
+                if not node.is_leaf:
+                    for i, child in enumerate(node.children):
+                        cx, cy = coords[id(child)]
+                        px = x - w / 2 + i * w / max(len(node.children) - 1, 1)
+                        self.ax.plot([px, cx], [y - NODE_HEIGHT / 2, cy + NODE_HEIGHT / 2],
+                                     color='gray', linewidth=1, zorder=1)
+                color = LEAF_COLOR if node.is_leaf else INTERNAL_COLOR
+                if node is highlight:
+                    color = HIGHLIGHT_COLOR
+                elif id(node) in path_ids:
+                    color = PATH_COLOR
+                rect = patches.Rectangle((x - w / 2, y - NODE_HEIGHT / 2), w, NODE_HEIGHT,
+                                         facecolor=color, edgecolor='black', zorder=2)
+                self.ax.add_patch(rect)
+                for i, k in enumerate(node.keys):
+                    kx = x - w / 2 + (i + 0.5) * KEY_WIDTH
+                    label = str(k)
+                    if node.is_leaf and node.freqs[i] > 1:
+                        label += f"×{node.freqs[i]}"
+                    weight = 'bold' if node.is_leaf and k in keys else 'normal'
+                    self.ax.text(kx, y, label, ha='center', va='center', fontsize=8,
+                                 color='white', weight=weight, zorder=3)
+                    if i:
+                        sx = x - w / 2 + i * KEY_WIDTH
+                        self.ax.plot([sx, sx], [y - NODE_HEIGHT / 2, y + NODE_HEIGHT / 2],
+                                     color='black', linewidth=0.5, zorder=3)
+                # 叶子链表指针
+                if node.is_leaf and node.next is not None:
+                    nx, ny = coords[id(node.next)]
+                    self.ax.annotate("", xy=(nx - self._node_width(node.next) / 2, ny),
+                                     xytext=(x + w / 2, y),
+                                     arrowprops=dict(arrowstyle="->", color='black'), zorder=1)
+
+        xs = [x for x, _ in coords.values()]
+        ys = [y for _, y in coords.values()]
+        self.ax.set_xlim(min(xs) - 1.5, max(xs) + 1.5)
+        self.ax.set_ylim(min(ys) - 1, max(ys) + 1)
+        self.canvas.draw_idle()
+
+    # ---------- 事件回调 ----------
+    def on_update(self, state):
+        action = state.get("action")
+        node = state.get("node")
+        extra = state.get("extra")
+
+        if action == "found":
+            self.draw_tree(highlight=node, path=extra)
+        elif action == "not_found":
+            self.draw_tree(path=extra)
+        elif action == "trace_path":
+            self.draw_tree(highlight=node, path=extra)
+        elif action == "split":
+            self.status.setText(f"节点分裂，分隔键 {extra.get('sep')} 上移")
+        elif action == "merge":
+            self.status.setText("节点下溢，已与兄弟合并")
+        elif action in ("insert", "delete", "build"):
+            self.draw_tree(highlight=node if action == "insert" else None)
+
+    # ---------- 操作 ----------
+    def _get_int(self, edit=None):
+        edit = edit or self.inputVal
+        try:
+            val = int(edit.text().strip())
+            if val < 1 or val > 100:
+                QMessageBox.warning(self, "范围错误", "请输入1-100之间的整数！")
+                return None
+            return val
+        except ValueError:
+            QMessageBox.warning(self, "输入错误", "请输入有效的整数！")
+            return None
+
+    def set_order(self):
+        order = self.spinOrder.value()
+        self.tree.order = order
+        self.tree.max_keys = order - 1
+        self.tree.min_keys = self.tree.max_keys // 2
+        self.tree.clear()
+        self.add_step(f"阶数设置为 {order}（每个节点最多 {order - 1} 个键），树已清空")
+
+    def insert(self):
+        val = self._get_int()
+        if val is None:
+            return
+        self.tree.insert(val, step_callback=self.add_step)
+
+    def delete(self):
+        val = self._get_int()
+        if val is None:
+            return
+        if not self.tree.delete(val, step_callback=self.add_step):
+            self.status.setText(f"未找到 {val}")
+
+    def search(self):
+        val = self._get_int()
+        if val is None:
+            return
+        entry = self.tree.search(val, step_callback=self.add_step)
+        self.status.setText(f"找到 {val}（频率 {entry.freq}）" if entry else f"未找到 {val}")
+
+    def show_inorder(self):
+        seq = self.tree.inorder()
+        if not seq:
+            QMessageBox.warning(self, "错误", "树为空")
+            return
+        text = " -> ".join(map(str, seq))
+        self.status.setText(f"沿叶子链表顺序遍历: {text}")
+        self.add_step(f"顺序遍历结果：{text}")
+
+    def range_scan(self):
+        lo = self._get_int()
+        hi = self._get_int(self.inputHi)
+        if lo is None or hi is None:
+            return
+        items = list(self.tree.range(lo, hi))
+        self.draw_tree(keys=[k for k, _ in items])
+        text = ", ".join(f"{k}×{f}" if f > 1 else str(k) for k, f in items)
+        self.status.setText(f"范围 [{lo}, {hi}) 共 {len(items)} 个键")
+        self.add_step(f"范围扫描 [{lo}, {hi})：{text or '(无)'}")
+
+    def random_build(self):
+        n = self.spinN.value()
+        values = self.tree.build_random(n=n, value_range=(1, 100))
+        self.add_step(f"随机生成 {n} 个值：{values}")
+
+    def run_dsl(self):
+        code = self.dsl_editor.toPlainText()
+        if not code.strip():
+            QMessageBox.warning(self, "警告", "请输入DSL脚本")
+            return
+        try:
+            program = self.dsl_parser.parse(code)
+        except ParserError as e:
+            QMessageBox.critical(self, "解析错误", str(e))
+            self.add_step(f"解析错误: {str(e)}")
+            return
+        self.add_step("DSL脚本解析成功，开始执行...")
+        self.tree.clear()
+        self.dsl_executor.execute(program)
+
+    def add_step(self, text):
+        current_time = QDateTime.currentDateTime().toString("HH:mm:ss")
+        self.step_text.append(f"[{current_time}] {text}")
+        self.step_text.moveCursor(QTextCursor.End)
+
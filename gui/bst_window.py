@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QLineEdit, QMessageBox, QSpinBox, QTextEdit, QScrollBar
+    QLabel, QLineEdit, QMessageBox, QSpinBox, QTextEdit, QScrollBar, QCheckBox
 )
 from PySide6.QtCore import QTimer, QDateTime, Qt # 导入 Qt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
@@ -18,6 +18,8 @@ class BSTWindow(QMainWindow):
     NODE_RADIUS = 0.28 
     # 动画速度（毫秒）
     ANIMATION_SPEED = 450 
+    # 自动重新平衡阈值 c（树高 > c·log2(n+1) 时触发 DSW）
+    AUTO_REBALANCE_FACTOR = 2.0
 
     def __init__(self):
         super().__init__()
@@ -118,6 +120,13 @@ class BSTWindow(QMainWindow):
         self.btn_lower_bound = QPushButton("lower_bound（首个≥值）")
         self.btn_lower_bound.clicked.connect(self.find_lower_bound)
         adv.addWidget(self.btn_lower_bound)
+        self.btn_rebalance = QPushButton("重新平衡(DSW)")
+        self.btn_rebalance.clicked.connect(self.rebalance)
+        adv.addWidget(self.btn_rebalance)
+        self.chk_auto_rebalance = QCheckBox("自动平衡")
+        self.chk_auto_rebalance.setToolTip(f"树高超过 {self.AUTO_REBALANCE_FACTOR}·log2(n+1) 时自动执行 DSW")
+        self.chk_auto_rebalance.toggled.connect(self.toggle_auto_rebalance)
+        adv.addWidget(self.chk_auto_rebalance)
 
         # 文件操作布局
         file_ops = QHBoxLayout()
@@ -265,6 +274,18 @@ inorder;
         self.status.setText(f"中序遍历（递增序列）: {seq_text}")
         self.add_step(f"中序遍历结果（BST特性：递增）：{seq_text}")
 
+    def rebalance(self):
+        if not self.tree.root:
+            QMessageBox.warning(self, "错误", "树为空")
+            return
+        self.tree.rebalance(step_callback=self.add_step)
+
+    def toggle_auto_rebalance(self, checked):
+        self.tree.auto_rebalance_factor = self.AUTO_REBALANCE_FACTOR if checked else None
+        self.add_step(f"自动重新平衡：{'开启' if checked else '关闭'}")
+        if checked:
+            self.tree._maybe_rebalance(step_callback=self.add_step)
+
     def random_build(self):
         # ... (与原代码相同)
         n = self.spinN.value()
@@ -396,6 +417,10 @@ inorder;
             self.status.setText("BST 构建完成")
             self.add_step("BST 构建/加载完成")
             self.draw_tree(self.tree.root)
+        elif action == "rebalance":
+            self.status.setText(f"DSW 重新平衡完成：树高 {extra['before']} -> {extra['after']}")
+            self.add_step(f"重新平衡完成，树高 {extra['before']} -> {extra['after']}")
+            self.draw_tree(self.tree.root)
         elif action == "found":
             # 查找成功（无路径或路径已走完）
             self.status.setText(f"查找成功: {node.val} (freq={node.freq})")
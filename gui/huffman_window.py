@@ -137,17 +137,32 @@ class HuffmanWindow(QMainWindow):
             self.build_steps = extra.get("steps", [])
             self.code_map = extra.get("code_map", {})
             
-            # 显示编码
-            code_text = "哈夫曼编码表：\n"
-            for char, code in self.code_map.items():
-                code_text += f"'{char}' -> {code}\n"
-            self.code_display.setText(code_text)
+            # 显示编码统计报告（码表可通过 DSL show_codes 查看，叶子节点上也有标注）
+            self.code_display.setText(self.format_stats_text(self.tree.stats()))
             
             # 开始构建动画
             self.step_index = 0
             self.timer.start(1000)
             self.status.setText("哈夫曼树构建完成，正在播放构建动画")
         
+    def format_stats_text(self, stats):
+        """把 HuffmanTree.stats() 的结果格式化为文本"""
+        if not stats["total"]:
+            return "哈夫曼编码统计：\n(空)"
+        text = "哈夫曼编码统计：\n"
+        text += f"字符总数：{stats['total']}，不同字符：{stats['symbols']}\n"
+        text += f"香农熵：{stats['entropy']:.4f} bit/字符\n"
+        text += f"平均码长：{stats['avg_code_length']:.4f} bit/字符\n"
+        text += f"编码效率：{stats['efficiency'] * 100:.2f}%\n"
+        text += f"最大深度：{stats['max_depth']}\n"
+        text += f"编码后大小：{stats['expected_bits']} bit（约 {stats['expected_bytes']} 字节）\n"
+        text += f"原始大小：{stats['raw_bits']} bit（8 bit/字符）\n"
+        text += f"压缩比：{stats['compression_ratio'] * 100:.2f}%\n"
+        text += "码长分布：\n"
+        for length, count in stats["length_histogram"].items():
+            text += f"  {length} 位：{count} 个字符\n"
+        return text
+
     def _animate_build(self):
         if self.step_index < len(self.build_steps):
             left, right, merged = self.build_steps[self.step_index]
@@ -355,6 +370,7 @@ clear MyHuff;
 build MyHuff text="abbccc";
 draw MyHuff;
 show_codes MyHuff;
+show_stats MyHuff;
 """
         )
         # 设置DSL输入框的最小高度
@@ -12,7 +12,9 @@ import json, os, random
 import matplotlib
 matplotlib.rcParams["font.family"] = ["SimHei", "WenQuanYi Micro Hei", "Heiti TC"]
 matplotlib.rcParams["axes.unicode_minus"] = False  # 解决负号显示问题
-from core.sequence_list import SequenceList 
+from core.sequence_list import SequenceList, apply_delta
+from core.json_stream import JsonArrayReader
+from core.skip_list import SkipList
 from dsl.sequence.sequence_dsl import SequenceDSLParser
 
 DSL_EXAMPLES = {
@@ -50,8 +52,13 @@ class LinearWindow(QMainWindow):
 
         # 顺序表结构
         self.seq = SequenceList()
+        self.seq_view = []  # 视图侧的数组副本，按 delta 增量更新
         self.seq.add_listener(self.on_update)
 
+        # 跳表结构（有序多重集，按值插入/删除/查找）
+        self.skip = SkipList()
+        self.skip.add_listener(self.on_skip_update)
+
         # 动画状态
         self.anim_timer = QTimer()
         self.anim_timer.timeout.connect(self._anim_step)
@@ -88,6 +95,8 @@ class LinearWindow(QMainWindow):
         ctrl.addWidget(QLabel("结构类型:"))
         self.comboType = QComboBox()
         self.comboType.addItem("SequenceList")
+        self.comboType.addItem("SequenceList(Treap)")
+        self.comboType.addItem("SkipList")
         self.comboType.currentTextChanged.connect(self.switch_mode)
         ctrl.addWidget(self.comboType)
 
@@ -110,6 +119,10 @@ class LinearWindow(QMainWindow):
         self.btnDelete.clicked.connect(self.delete)
         ctrl.addWidget(self.btnDelete)
 
+        self.btnSearch = QPushButton("查找")
+        self.btnSearch.clicked.connect(self.search)
+        ctrl.addWidget(self.btnSearch)
+
         # 文件操作区
         file_ctrl = QHBoxLayout()
         right_panel.addLayout(file_ctrl)
@@ -168,11 +181,30 @@ class LinearWindow(QMainWindow):
         self.selected_index = None
         if "Seq" in text:
             self.mode = "Sequence"
+            # 隐式 Treap 后端：接口与列表后端相同，任意下标插入/删除 O(log n)
+            backend = "treap" if "Treap" in text else "list"
+            if backend != self.seq.backend:
+                items = self.seq.snapshot()
+                self.seq = SequenceList(backend)
+                self.seq.add_listener(self.on_update)
+                self.seq.build(items)
+        elif "Skip" in text:
+            self.mode = "SkipList"
         self.status.setText(f"当前为 {self.mode} 模式")
-        self.draw([])
+        self.redraw()
+
+    def redraw(self):
+        if self.mode == "SkipList":
+            self.draw_skip()
+        else:
+            self.draw(self.seq.data)
 
     # ========== 构建 ==========
     def build_structure(self):
+        if self.mode == "SkipList":
+            self.skip.build_random(8, (0, 100))
+            self.status.setText(f"构建 {self.mode} 成功")
+            return
         data = [random.randint(0, 100) for _ in range(6)]
         self.seq.build(data)
         self.status.setText(f"构建 {self.mode} 成功")
@@ -185,14 +217,50 @@ class LinearWindow(QMainWindow):
         except:
             QMessageBox.warning(self, "输入错误", "请输入数字")
             return
+        if self.mode == "SkipList":
+            # 跳表按值有序插入，位置由值决定
+            node = self.skip.insert(val)
+            self.status.setText(f"插入 {val}（层数 {node.level}，频率 {node.freq}）")
+            return
         idx = self.inputIndex.value()
         self.start_animation("insert", idx, val)
 
     def delete(self):
         """删除当前选中节点或输入索引"""
+        if self.mode == "SkipList":
+            try:
+                val = int(self.inputValue.text())
+            except ValueError:
+                QMessageBox.warning(self, "输入错误", "请输入数字")
+                return
+            ok = self.skip.delete(val)
+            self.status.setText(f"删除 {val}" if ok else f"未找到 {val}")
+            return
         idx = self.selected_index if self.selected_index is not None else self.inputIndex.value()
         self.start_animation("delete", idx)
 
+    def search(self):
+        try:
+            val = int(self.inputValue.text())
+        except ValueError:
+            QMessageBox.warning(self, "输入错误", "请输入数字")
+            return
+        if self.mode == "SkipList":
+            node = self.skip.search(val)
+            if node:
+                self.status.setText(f"找到 {val}（频率 {node.freq}，排名 {self.skip.rank(val) + 1}）")
+            else:
+                self.status.setText(f"未找到 {val}")
+            return
+        if val in self.seq.data:
+            idx = self.seq.data.index(val)
+            self.selected_index = idx
+            self.status.setText(f"找到 {val} -> 索引 {idx}")
+        else:
+            self.selected_index = None
+            self.status.setText(f"未找到 {val}")
+        self.draw(self.seq.data)
+
     # ========== 保存与打开 ==========
     def save_structure(self):
         filename, _ = QFileDialog.getSaveFileName(
@@ -211,26 +279,45 @@ class LinearWindow(QMainWindow):
         )
         if not filename:
             return
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self.restore_data(data)
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                # 流式读取：data 数组以迭代器形式交给 build / insert，不先整体解析成列表
+                # type 写在 data 之后的文件由 require 先读完数组补全 header，再按类型恢复
+                reader = JsonArrayReader(f).require("type")
+                self.restore_data(dict(reader.header, data=reader))
+        except Exception as e:
+            QMessageBox.warning(self, "打开失败", f"文件格式错误：{e}")
+            return
         self.status.setText(f"已打开 {os.path.basename(filename)}")
         self.selected_index = None
 
     def get_current_data(self):
-        return {"type": self.mode, "data": self.seq.data}
+        if self.mode == "SkipList":
+            return {"type": self.mode, "data": self.skip.inorder()}
+        return {"type": self.mode, "data": self.seq.snapshot()}
 
     def restore_data(self, info):
         dtype = info.get("type")
         data = info.get("data", [])
         if dtype == "Sequence":
-            self.comboType.setCurrentText("SequenceList")
+            if self.mode != "Sequence":
+                self.comboType.setCurrentText("SequenceList")
             self.seq.build(data)
+        elif dtype == "SkipList":
+            self.comboType.setCurrentText("SkipList")
+            self.skip.clear()
+            for v in data:
+                self.skip.insert(v)
+            self.draw_skip()
+        elif dtype is None:
+            raise ValueError("文件缺少 type 字段")
+        else:
+            raise ValueError(f"未知的结构类型：{dtype}")
 
     # ========== 点击事件 ==========
     def on_pick(self, event):
         """点击节点 = 选中（高亮，不删除）"""
-        if self.anim_timer.isActive():
+        if self.anim_timer.isActive() or self.mode != "Sequence":
             return
         bar = getattr(event, "artist", None)
         if bar is None:
@@ -316,13 +403,71 @@ class LinearWindow(QMainWindow):
             self.selected_index = None
 
     def disable_buttons(self, disable=True):
-        for b in [self.btnInsert, self.btnDelete, self.btnBuild, self.btnSave, self.btnOpen]:
+        for b in [self.btnInsert, self.btnDelete, self.btnSearch, self.btnBuild, self.btnSave, self.btnOpen]:
             b.setEnabled(not disable)
 
     # ========== 可视化 ==========
     def on_update(self, state):
-        arr = state.get("array", [])
-        self.draw(arr)
+        apply_delta(self.seq_view, state["delta"])
+        if self.mode != "Sequence":
+            return
+        self.draw(self.seq_view)
+
+    def on_skip_update(self, state):
+        if self.mode != "SkipList":
+            return
+        action = state.get("action")
+        if action in ("found", "not_found", "trace_path"):
+            self.draw_skip(path=state.get("extra"), target=state.get("node"))
+        else:
+            self.draw_skip(target=state.get("node") if action in ("insert", "increase_freq") else None)
+
+    def draw_skip(self, path=None, target=None):
+        """跳表：每列一个节点、每行一层，箭头上标注跨度 span；查找路径与目标节点高亮"""
+        self.ax.clear()
+        self.ax.axis("off")
+        info = self.skip.get_visual_data()
+        nodes = info["nodes"]
+        if not nodes:
+            self.ax.text(0.4, 0.5, "(空)", fontsize=16, color="gray")
+            self.canvas.draw_idle()
+            return
+
+        on_path = {n.val for n in (path or []) if n is not None}
+        target_val = target.val if target is not None else None
+        tail = len(nodes) + 1  # 表尾 NIL 所在列
+        box_w, box_h = 0.7, 0.6
+
+        # 表头与各节点的每一层
+        columns = [("H", 0, info["level"])] + [
+            (f"{v}×{f}" if f > 1 else str(v), i + 1, lvl) for i, (v, f, lvl) in enumerate(nodes)
+        ]
+        for label, col, lvl in columns:
+            val = nodes[col - 1][0] if col else None
+            color = "#87CEFA"
+            if col == 0:
+                color = "#D3D3D3"
+            elif val == target_val:
+                color = "#FF6347"
+            elif val in on_path:
+                color = "#FFA07A"
+            for h in range(lvl):
+                self.ax.add_patch(patches.Rectangle((col - box_w / 2, h - box_h / 2), box_w, box_h,
+                                                    facecolor=color, edgecolor="black"))
+            self.ax.text(col, -0.8, label, ha="center", va="center", fontsize=10)
+        self.ax.text(tail, -0.8, "NIL", ha="center", va="center", fontsize=10, color="gray")
+
+        for h, src, dst, span in info["links"]:
+            end = tail if dst is None else dst
+            self.ax.annotate("", xy=(end - box_w / 2, h), xytext=(src + box_w / 2, h),
+                             arrowprops=dict(arrowstyle="->", color="gray"))
+            self.ax.text((src + end) / 2, h + 0.38, str(span), ha="center", va="center",
+                         fontsize=7, color="#555555")
+
+        self.ax.set_xlim(-1, tail + 1)
+        self.ax.set_ylim(-1.3, info["level"] + 0.5)
+        self.ax.set_title(f"跳表（{len(self.skip)} 个元素，{info['level']} 层）")
+        self.canvas.draw_idle()
 
     def draw(self, arr, action=None):
         self.ax.clear()
@@ -377,6 +522,9 @@ class LinearWindow(QMainWindow):
         self.canvas.draw_idle()
 
     def run_dsl(self):
+        # DSL 语法针对顺序表，执行前切回顺序表模式
+        if self.mode != "Sequence":
+            self.comboType.setCurrentText("SequenceList")
         text = self.dslEdit.toPlainText()
         try:
             self.dsl_cmds = SequenceDSLParser.parse(text)
@@ -124,6 +124,8 @@ delete 2
 find_predecessor 5
 find_successor 5
 find_lower_bound 5
+重新平衡
+rebalance
 遍历与绘制
 inorder
 draw
@@ -153,6 +155,7 @@ build text="hello world"
 编码与展示
 draw
 show_codes
+show_stats
 文件操作
 save to "huffman_codes.json"
 load from "huffman_codes.json"
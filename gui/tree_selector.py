@@ -31,6 +31,26 @@ class TreeSelector(QMainWindow):
         btn_avl.clicked.connect(self.open_avl_tree)
         layout.addWidget(btn_avl)
 
+        # 红黑树按钮（复用 AVL 窗口，换成红黑树引擎）
+        btn_rb = QPushButton("红黑树可视化")
+        btn_rb.clicked.connect(self.open_rb_tree)
+        layout.addWidget(btn_rb)
+
+        # 伸展树按钮（同样复用 AVL 窗口，可观察伸展旋转）
+        btn_splay = QPushButton("伸展树可视化")
+        btn_splay.clicked.connect(self.open_splay_tree)
+        layout.addWidget(btn_splay)
+
+        # B+树按钮
+        btn_bplus = QPushButton("B+树可视化")
+        btn_bplus.clicked.connect(self.open_bplus_tree)
+        layout.addWidget(btn_bplus)
+
+        # 区间树按钮
+        btn_interval = QPushButton("区间树可视化")
+        btn_interval.clicked.connect(self.open_interval_tree)
+        layout.addWidget(btn_interval)
+
     def open_binary_tree(self):
         from gui.tree_window import TreeWindow  # 注意：如果tree_window在gui目录下，需要补全路径
         self.binary_window = TreeWindow()
@@ -53,4 +73,31 @@ class TreeSelector(QMainWindow):
         from gui.avl_window import AVLWindow  
         self.avl_window = AVLWindow()
         self.avl_window.show()
-        self.close()
\ No newline at end of file
+        self.close()
+
+    def open_rb_tree(self):
+        from gui.avl_window import AVLWindow
+        from core.rb_tree import RBTree
+        self.rb_window = AVLWindow(tree=RBTree())
+        self.rb_window.show()
+        self.close()
+
+    def open_bplus_tree(self):
+        from gui.bplus_window import BPlusWindow
+        self.bplus_window = BPlusWindow()
+        self.bplus_window.show()
+        self.close()
+
+    def open_splay_tree(self):
+        from gui.avl_window import AVLWindow
+        from core.splay_tree import SplayTree
+        self.splay_window = AVLWindow(tree=SplayTree())
+        self.splay_window.show()
+        self.close()
+
+    def open_interval_tree(self):
+        from gui.avl_window import AVLWindow
+        from core.interval_tree import IntervalAVLTree
+        self.interval_window = AVLWindow(tree=IntervalAVLTree())
+        self.interval_window.show()
+        self.close()